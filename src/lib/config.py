@@ -6,7 +6,8 @@ and default fallback values.
 """
 
 import json
-from typing import Any, Dict, List, Tuple
+import string
+from typing import Any, Dict, FrozenSet, List, Tuple
 
 from .paths import get_config_path
 
@@ -46,6 +47,15 @@ array in config.json:
 """
 
 
+_BUNDLE_ID_CHARS: FrozenSet[str] = frozenset(string.ascii_letters + string.digits + ".-")
+"""Characters allowed in bundle IDs listed in excluded_apps."""
+
+
+def _is_valid_bundle_id(bundle_id: str) -> bool:
+    """Check that a (stripped) bundle ID is non-empty and uses only allowed characters."""
+    return bool(bundle_id) and _BUNDLE_ID_CHARS.issuperset(bundle_id)
+
+
 class Config:
     """Configuration holder with typed properties."""
 
@@ -91,19 +101,16 @@ class Config:
             self.exclusion_mode = "skip"
 
         if not isinstance(self.excluded_apps, list):
-            if isinstance(self.excluded_apps, str) and self.excluded_apps.strip():
-                stripped = self.excluded_apps.strip()
-                if all(c.isalnum() or c in ".-" for c in stripped):
-                    self.excluded_apps = [stripped]
-                else:
-                    self.excluded_apps = []
+            if isinstance(self.excluded_apps, str) and _is_valid_bundle_id(self.excluded_apps.strip()):
+                self.excluded_apps = [self.excluded_apps.strip()]
             else:
                 self.excluded_apps = []
         else:
-            self.excluded_apps = [
-                app.strip() for app in self.excluded_apps
-                if isinstance(app, str) and app.strip() and all(c.isalnum() or c in ".-" for c in app.strip())
-            ]
+            stripped_apps = (app.strip() for app in self.excluded_apps if isinstance(app, str))
+            self.excluded_apps = [app for app in stripped_apps if _is_valid_bundle_id(app)]
+
+        # Set view of excluded_apps for O(1) lookups in is_app_excluded
+        self._excluded_apps_set: FrozenSet[str] = frozenset(self.excluded_apps)
 
         if not (0 <= self.ffmpeg_crf <= 51):
             self.ffmpeg_crf = 28
@@ -121,7 +128,7 @@ class Config:
         Returns:
             True if the app is in the excluded_apps list, False otherwise.
         """
-        return bundle_id in self.excluded_apps
+        return bundle_id in self._excluded_apps_set
 
     @staticmethod
     def get_recommended_exclusions() -> List[Tuple[str, str]]:
@@ -10,20 +10,336 @@ The database uses WAL mode for concurrent reads/writes, allowing the playback
 app to read while the processing service writes.
 """
 
+import bisect
+import itertools
 import logging
 import os
-import shutil
 import sqlite3
+import threading
 import time
+import weakref
 from contextlib import contextmanager
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-SCHEMA_VERSION = "1.1"
+SCHEMA_VERSION = "1.8"
+
+# Performance PRAGMAs applied to every connection (read-only and writable)
+CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size=-64000",  # 64 MB page cache (negative value = KiB)
+    "PRAGMA temp_store=MEMORY",  # Sorts and temp indexes in memory
+    "PRAGMA mmap_size=268435456",  # Memory-map up to 256 MB for reads
+    "PRAGMA busy_timeout=5000",  # Wait up to 5 s for a lock instead of failing
+)
+
+# Additional PRAGMAs for writable connections once WAL is active
+WAL_WRITER_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",  # fsync at checkpoints, not every commit
+    "PRAGMA wal_autocheckpoint=1000",  # Checkpoint every ~1000 WAL pages
+    "PRAGMA journal_size_limit=67108864",  # Truncate the WAL back to 64 MB after checkpoints
+)
+
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 256
+
+# Page size for new database files; must be set before the first write
+PAGE_SIZE = 4096
+
+# WAL checkpoint modes accepted by checkpoint()
+CHECKPOINT_MODES = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+# insert_segments_bulk() batches larger than this run a PASSIVE checkpoint
+CHECKPOINT_BATCH_THRESHOLD = 1000
+
+# insert_ocr_batch() hands rows to executemany() in slices of this size
+OCR_BATCH_CHUNK_SIZE = 10_000
+
+# Pages copied per step by backup(); the source lock is released between steps
+BACKUP_PAGES_PER_STEP = 1024
+
+
+# FTS5 full-text index over ocr_text. It is an external-content table: it
+# stores only the index, reads column values from ocr_text, and is kept in
+# sync by triggers, so writers only ever insert into ocr_text.
+_OCR_SEARCH_SCHEMA: Tuple[str, ...] = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS ocr_search USING fts5(
+    text_content,
+    segment_id UNINDEXED,
+    timestamp UNINDEXED,
+    content = 'ocr_text',
+    content_rowid = 'id',
+    tokenize = 'porter unicode61'
+)""",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_search_insert AFTER INSERT ON ocr_text
+BEGIN
+    INSERT INTO ocr_search (rowid, text_content, segment_id, timestamp)
+    VALUES (NEW.id, NEW.text_content, NEW.segment_id, NEW.timestamp);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_search_delete AFTER DELETE ON ocr_text
+BEGIN
+    INSERT INTO ocr_search (ocr_search, rowid, text_content, segment_id, timestamp)
+    VALUES ('delete', OLD.id, OLD.text_content, OLD.segment_id, OLD.timestamp);
+END""",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_search_update AFTER UPDATE ON ocr_text
+BEGIN
+    INSERT INTO ocr_search (ocr_search, rowid, text_content, segment_id, timestamp)
+    VALUES ('delete', OLD.id, OLD.text_content, OLD.segment_id, OLD.timestamp);
+    INSERT INTO ocr_search (rowid, text_content, segment_id, timestamp)
+    VALUES (NEW.id, NEW.text_content, NEW.segment_id, NEW.timestamp);
+END""",
+)
+
+# Summary rows maintained by triggers so get_database_stats() does not scan
+# segments/appsegments. INSERT OR REPLACE deletes the old row without firing
+# DELETE triggers (recursive_triggers is off), so BEFORE INSERT triggers first
+# subtract any row being replaced; a plain INSERT that conflicts aborts the
+# whole statement, trigger effects included.
+_SUMMARY_SCHEMA: Tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS segment_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    segment_count INTEGER NOT NULL DEFAULT 0,
+    total_video_bytes INTEGER NOT NULL DEFAULT 0,
+    total_frames INTEGER NOT NULL DEFAULT 0,
+    appsegment_count INTEGER NOT NULL DEFAULT 0
+)""",
+    "INSERT OR IGNORE INTO segment_totals (id) VALUES (1)",
+    """CREATE TABLE IF NOT EXISTS app_id_counts (
+    app_id TEXT PRIMARY KEY,
+    appsegment_count INTEGER NOT NULL
+) WITHOUT ROWID""",
+    """CREATE TRIGGER IF NOT EXISTS segments_totals_replace BEFORE INSERT ON segments
+BEGIN
+    UPDATE segment_totals SET
+        segment_count = segment_count - (SELECT COUNT(*) FROM segments WHERE id = NEW.id),
+        total_video_bytes = total_video_bytes
+            - COALESCE((SELECT file_size_bytes FROM segments WHERE id = NEW.id), 0),
+        total_frames = total_frames
+            - COALESCE((SELECT frame_count FROM segments WHERE id = NEW.id), 0)
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS segments_totals_insert AFTER INSERT ON segments
+BEGIN
+    UPDATE segment_totals SET
+        segment_count = segment_count + 1,
+        total_video_bytes = total_video_bytes + NEW.file_size_bytes,
+        total_frames = total_frames + NEW.frame_count
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS segments_totals_delete AFTER DELETE ON segments
+BEGIN
+    UPDATE segment_totals SET
+        segment_count = segment_count - 1,
+        total_video_bytes = total_video_bytes - OLD.file_size_bytes,
+        total_frames = total_frames - OLD.frame_count
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS segments_totals_update
+AFTER UPDATE OF file_size_bytes, frame_count ON segments
+BEGIN
+    UPDATE segment_totals SET
+        total_video_bytes = total_video_bytes - OLD.file_size_bytes + NEW.file_size_bytes,
+        total_frames = total_frames - OLD.frame_count + NEW.frame_count
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS appsegments_totals_replace BEFORE INSERT ON appsegments
+BEGIN
+    UPDATE segment_totals SET
+        appsegment_count = appsegment_count
+            - (SELECT COUNT(*) FROM appsegments WHERE id = NEW.id)
+    WHERE id = 1;
+    UPDATE app_id_counts SET appsegment_count = appsegment_count - 1
+    WHERE app_id = (SELECT app_id FROM appsegments WHERE id = NEW.id);
+    DELETE FROM app_id_counts
+    WHERE app_id = (SELECT app_id FROM appsegments WHERE id = NEW.id)
+      AND appsegment_count <= 0;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS appsegments_totals_insert AFTER INSERT ON appsegments
+BEGIN
+    UPDATE segment_totals SET appsegment_count = appsegment_count + 1 WHERE id = 1;
+    INSERT INTO app_id_counts (app_id, appsegment_count)
+    SELECT NEW.app_id, 1 WHERE NEW.app_id IS NOT NULL
+    ON CONFLICT(app_id) DO UPDATE SET appsegment_count = appsegment_count + 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS appsegments_totals_delete AFTER DELETE ON appsegments
+BEGIN
+    UPDATE segment_totals SET appsegment_count = appsegment_count - 1 WHERE id = 1;
+    UPDATE app_id_counts SET appsegment_count = appsegment_count - 1
+    WHERE app_id = OLD.app_id;
+    DELETE FROM app_id_counts WHERE app_id = OLD.app_id AND appsegment_count <= 0;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS appsegments_app_id_update
+AFTER UPDATE OF app_id ON appsegments
+BEGIN
+    UPDATE app_id_counts SET appsegment_count = appsegment_count - 1
+    WHERE app_id = OLD.app_id;
+    DELETE FROM app_id_counts WHERE app_id = OLD.app_id AND appsegment_count <= 0;
+    INSERT INTO app_id_counts (app_id, appsegment_count)
+    SELECT NEW.app_id, 1 WHERE NEW.app_id IS NOT NULL
+    ON CONFLICT(app_id) DO UPDATE SET appsegment_count = appsegment_count + 1;
+END""",
+)
+
+# OCR totals for get_database_stats(), maintained by triggers on ocr_text.
+# confidence is nullable, so non-NULL values are counted separately to keep
+# the average equal to AVG(confidence).
+_OCR_TOTALS_SCHEMA: Tuple[str, ...] = (
+    """CREATE TABLE IF NOT EXISTS ocr_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    ocr_count INTEGER NOT NULL DEFAULT 0,
+    confidence_count INTEGER NOT NULL DEFAULT 0,
+    confidence_sum REAL NOT NULL DEFAULT 0,
+    total_text_chars INTEGER NOT NULL DEFAULT 0
+)""",
+    "INSERT OR IGNORE INTO ocr_totals (id) VALUES (1)",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_totals_insert AFTER INSERT ON ocr_text
+BEGIN
+    UPDATE ocr_totals SET
+        ocr_count = ocr_count + 1,
+        confidence_count = confidence_count + (NEW.confidence IS NOT NULL),
+        confidence_sum = confidence_sum + COALESCE(NEW.confidence, 0),
+        total_text_chars = total_text_chars + LENGTH(NEW.text_content)
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_totals_delete AFTER DELETE ON ocr_text
+BEGIN
+    UPDATE ocr_totals SET
+        ocr_count = ocr_count - 1,
+        confidence_count = confidence_count - (OLD.confidence IS NOT NULL),
+        confidence_sum = confidence_sum - COALESCE(OLD.confidence, 0),
+        total_text_chars = total_text_chars - LENGTH(OLD.text_content)
+    WHERE id = 1;
+END""",
+    """CREATE TRIGGER IF NOT EXISTS ocr_text_totals_update
+AFTER UPDATE OF confidence, text_content ON ocr_text
+BEGIN
+    UPDATE ocr_totals SET
+        confidence_count = confidence_count
+            - (OLD.confidence IS NOT NULL) + (NEW.confidence IS NOT NULL),
+        confidence_sum = confidence_sum
+            - COALESCE(OLD.confidence, 0) + COALESCE(NEW.confidence, 0),
+        total_text_chars = total_text_chars
+            - LENGTH(OLD.text_content) + LENGTH(NEW.text_content)
+    WHERE id = 1;
+END""",
+)
+
+# Full schema for the current SCHEMA_VERSION. Every statement is idempotent so
+# initialize() can run it on both new and migrated databases.
+_SCHEMA_SQL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS schema_version (
+    version TEXT PRIMARY KEY,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS segments (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    frame_count INTEGER NOT NULL,
+    fps REAL,
+    width INTEGER,
+    height INTEGER,
+    file_size_bytes INTEGER NOT NULL,
+    video_path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_segments_date_start ON segments(date, start_ts);
+CREATE INDEX IF NOT EXISTS idx_segments_start_end ON segments(start_ts, end_ts);
+CREATE INDEX IF NOT EXISTS idx_segments_end_ts ON segments(end_ts);
+
+CREATE TABLE IF NOT EXISTS appsegments (
+    id TEXT PRIMARY KEY,
+    app_id TEXT,
+    date TEXT NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_appsegments_date_start ON appsegments(date, start_ts);
+CREATE INDEX IF NOT EXISTS idx_appsegments_app_start ON appsegments(app_id, start_ts);
+CREATE INDEX IF NOT EXISTS idx_appsegments_start_ts ON appsegments(start_ts);
+CREATE INDEX IF NOT EXISTS idx_appsegments_end_ts ON appsegments(end_ts);
+
+-- OCR text (Phase 4.1: Text Search with OCR)
+CREATE TABLE IF NOT EXISTS ocr_text (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    frame_path TEXT NOT NULL,
+    segment_id TEXT,
+    timestamp REAL NOT NULL,
+    text_content TEXT NOT NULL,
+    confidence REAL,
+    language TEXT DEFAULT 'en',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (segment_id) REFERENCES segments(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_ocr_timestamp ON ocr_text(timestamp);
+CREATE INDEX IF NOT EXISTS idx_ocr_segment_ts ON ocr_text(segment_id, timestamp);
+
+""" + ";\n".join(_OCR_SEARCH_SCHEMA + _SUMMARY_SCHEMA + _OCR_TOTALS_SCHEMA) + """;
+
+COMMIT;
+"""
+
+
+# Hot-path statements, kept as single constants so every call passes the
+# identical SQL text and hits the connection's prepared-statement cache
+_SEGMENT_COLUMNS = (
+    "id, date, start_ts, end_ts, frame_count, fps, width, height, "
+    "file_size_bytes, video_path"
+)
+_SQL_INSERT_SEGMENT = (
+    "INSERT OR REPLACE INTO segments "
+    f"({_SEGMENT_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_SQL_INSERT_APPSEGMENT = (
+    "INSERT OR REPLACE INTO appsegments "
+    "(id, app_id, date, start_ts, end_ts) VALUES (?, ?, ?, ?, ?)"
+)
+_SQL_SEGMENT_EXISTS = "SELECT 1 FROM segments WHERE id = ?"
+# get_all_segments() cache loads; rowid tracks which rows are already cached
+_SQL_ALL_SEGMENTS = (
+    f"SELECT rowid, {_SEGMENT_COLUMNS} FROM segments ORDER BY start_ts ASC"
+)
+_SQL_SEGMENTS_AFTER_ROWID = (
+    f"SELECT rowid, {_SEGMENT_COLUMNS} FROM segments WHERE rowid > ? "
+    "ORDER BY start_ts ASC"
+)
+_SQL_ALL_APPSEGMENTS = (
+    "SELECT id, app_id, date, start_ts, end_ts FROM appsegments ORDER BY start_ts ASC"
+)
+# Inner lookups are index-only scans; the full row is fetched once, by rowid
+# Segments do not overlap, so only the latest one starting at or before the
+# timestamp can contain it; its end_ts is checked after the one-row seek
+_SQL_FIND_AT = (
+    f"SELECT {_SEGMENT_COLUMNS} FROM segments WHERE rowid = ("
+    "SELECT rowid FROM segments WHERE start_ts <= ? "
+    "ORDER BY start_ts DESC LIMIT 1) AND end_ts >= ?"
+)
+_SQL_FIND_FORWARD = (
+    f"SELECT {_SEGMENT_COLUMNS} FROM segments WHERE rowid = ("
+    "SELECT rowid FROM segments WHERE start_ts >= ? "
+    "ORDER BY start_ts ASC LIMIT 1)"
+)
+_SQL_FIND_BACKWARD = (
+    f"SELECT {_SEGMENT_COLUMNS} FROM segments WHERE rowid = ("
+    "SELECT rowid FROM segments WHERE end_ts <= ? "
+    "ORDER BY end_ts DESC LIMIT 1)"
+)
+
+# FTS5 drives the search and returns matches already in rank (BM25) order;
+# each hit joins its ocr_text row by primary key for the confidence filter
+_SQL_SEARCH_OCR = (
+    "SELECT o.id, o.text_content, o.timestamp, o.segment_id, o.confidence "
+    "FROM ocr_search s JOIN ocr_text o ON o.id = s.rowid "
+    "WHERE s.text_content MATCH ? AND o.confidence >= ? "
+    "ORDER BY s.rank LIMIT ?"
+)
 
 
 @dataclass
@@ -64,6 +380,190 @@ class OCRTextRecord:
     created_at: str
 
 
+def _migrate_1_0_to_1_1(cursor: sqlite3.Cursor) -> None:
+    """Schema 1.1 only added the OCR tables, which initialize() creates."""
+
+
+def _migrate_1_1_to_1_2(cursor: sqlite3.Cursor) -> None:
+    """Replace idx_segments_start_ts with the composite idx_segments_start_end."""
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_segments_start_end
+        ON segments(start_ts, end_ts)
+    """)
+    # Redundant: (start_ts) is a prefix of (start_ts, end_ts)
+    cursor.execute("DROP INDEX IF EXISTS idx_segments_start_ts")
+
+
+def _migrate_1_2_to_1_3(cursor: sqlite3.Cursor) -> None:
+    """
+    Rebuild appsegments as a WITHOUT ROWID table clustered on its id.
+
+    The table's indexes are dropped with the old table and recreated by
+    _SCHEMA_SQL, which initialize() runs after migrating.
+    """
+    cursor.execute("""
+        CREATE TABLE appsegments_new (
+            id TEXT PRIMARY KEY,
+            app_id TEXT,
+            date TEXT NOT NULL,
+            start_ts REAL NOT NULL,
+            end_ts REAL NOT NULL
+        ) WITHOUT ROWID
+    """)
+    cursor.execute("""
+        INSERT INTO appsegments_new (id, app_id, date, start_ts, end_ts)
+        SELECT id, app_id, date, start_ts, end_ts FROM appsegments
+    """)
+    cursor.execute("DROP TABLE appsegments")
+    cursor.execute("ALTER TABLE appsegments_new RENAME TO appsegments")
+
+
+def _migrate_1_3_to_1_4(cursor: sqlite3.Cursor) -> None:
+    """Add the trigger-maintained summary tables and seed them from existing rows."""
+    for statement in _SUMMARY_SCHEMA:
+        cursor.execute(statement)
+    cursor.execute("""
+        UPDATE segment_totals SET
+            segment_count = (SELECT COUNT(*) FROM segments),
+            total_video_bytes = (SELECT COALESCE(SUM(file_size_bytes), 0) FROM segments),
+            total_frames = (SELECT COALESCE(SUM(frame_count), 0) FROM segments),
+            appsegment_count = (SELECT COUNT(*) FROM appsegments)
+        WHERE id = 1
+    """)
+    cursor.execute("DELETE FROM app_id_counts")
+    cursor.execute("""
+        INSERT INTO app_id_counts (app_id, appsegment_count)
+        SELECT app_id, COUNT(*) FROM appsegments
+        WHERE app_id IS NOT NULL
+        GROUP BY app_id
+    """)
+
+
+def _migrate_1_4_to_1_5(cursor: sqlite3.Cursor) -> None:
+    """Recreate ocr_search as an external-content index maintained by triggers."""
+    cursor.execute("DROP TABLE IF EXISTS ocr_search")
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ocr_text'")
+    if cursor.fetchone() is None:
+        # The schema script creates both tables empty; nothing to index
+        return
+    for statement in _OCR_SEARCH_SCHEMA:
+        cursor.execute(statement)
+    cursor.execute("INSERT INTO ocr_search (ocr_search) VALUES ('rebuild')")
+
+
+def _migrate_1_5_to_1_6(cursor: sqlite3.Cursor) -> None:
+    """Extend the date and app_id indexes with start_ts and refresh planner stats."""
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_segments_date_start
+        ON segments(date, start_ts)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_appsegments_date_start
+        ON appsegments(date, start_ts)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_appsegments_app_start
+        ON appsegments(app_id, start_ts)
+    """)
+    # Redundant: each is a prefix of one of the composites above
+    cursor.execute("DROP INDEX IF EXISTS idx_segments_date")
+    cursor.execute("DROP INDEX IF EXISTS idx_appsegments_date")
+    cursor.execute("DROP INDEX IF EXISTS idx_appsegments_app_id")
+    cursor.execute("ANALYZE")
+
+
+def _migrate_1_6_to_1_7(cursor: sqlite3.Cursor) -> None:
+    """Replace idx_ocr_segment with the composite idx_ocr_segment_ts."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ocr_text'")
+    if cursor.fetchone() is None:
+        return
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ocr_segment_ts
+        ON ocr_text(segment_id, timestamp)
+    """)
+    # Redundant: (segment_id) is a prefix of (segment_id, timestamp)
+    cursor.execute("DROP INDEX IF EXISTS idx_ocr_segment")
+
+
+def _migrate_1_7_to_1_8(cursor: sqlite3.Cursor) -> None:
+    """Add the trigger-maintained ocr_totals row and seed it from existing rows."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'ocr_text'")
+    if cursor.fetchone() is None:
+        # The schema script creates ocr_text and its totals together
+        return
+    for statement in _OCR_TOTALS_SCHEMA:
+        cursor.execute(statement)
+    cursor.execute("""
+        UPDATE ocr_totals SET
+            ocr_count = (SELECT COUNT(*) FROM ocr_text),
+            confidence_count = (SELECT COUNT(confidence) FROM ocr_text),
+            confidence_sum = (SELECT COALESCE(SUM(confidence), 0) FROM ocr_text),
+            total_text_chars = (SELECT COALESCE(SUM(LENGTH(text_content)), 0) FROM ocr_text)
+        WHERE id = 1
+    """)
+
+
+# Schema migrations as (from_version, to_version, migration) tuples, applied in
+# order by initialize() to bring an existing database up to SCHEMA_VERSION
+MIGRATIONS: List[Tuple[str, str, Callable[[sqlite3.Cursor], None]]] = [
+    ("1.0", "1.1", _migrate_1_0_to_1_1),
+    ("1.1", "1.2", _migrate_1_1_to_1_2),
+    ("1.2", "1.3", _migrate_1_2_to_1_3),
+    ("1.3", "1.4", _migrate_1_3_to_1_4),
+    ("1.4", "1.5", _migrate_1_4_to_1_5),
+    ("1.5", "1.6", _migrate_1_5_to_1_6),
+    ("1.6", "1.7", _migrate_1_6_to_1_7),
+    ("1.7", "1.8", _migrate_1_7_to_1_8),
+]
+
+
+def _local_date_range_bounds(start_date: str, end_date: str) -> Tuple[float, float]:
+    """
+    Convert an inclusive local date range into a half-open timestamp range.
+
+    Segment dates are the local calendar day the segment was recorded on, so
+    [local midnight of start_date, local midnight after end_date) selects the
+    same segments as comparing the date strings.
+
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format (inclusive)
+
+    Returns:
+        Tuple[float, float]: (lower bound inclusive, upper bound exclusive)
+
+    Raises:
+        ValueError: If either date is not in YYYY-MM-DD format
+    """
+    lower = datetime.strptime(start_date, "%Y-%m-%d")
+    upper = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
+    return lower.timestamp(), upper.timestamp()
+
+
+def _close_connections(
+    connections: List[sqlite3.Connection],
+    lock: threading.Lock,
+) -> None:
+    """
+    Close and forget every connection in a manager's connection registry.
+
+    Module-level so weakref.finalize can call it without keeping the
+    manager alive.
+
+    Args:
+        connections: Registry list, emptied in place
+        lock: Lock guarding the registry
+    """
+    with lock:
+        pending = list(connections)
+        connections.clear()
+    for conn in pending:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
 class DatabaseManager:
     """
     Manages SQLite database operations for Playback metadata.
@@ -82,15 +582,50 @@ class DatabaseManager:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Ensure database file is created with secure permissions if it's a new file
-        self._ensure_secure_permissions()
+        # Per-thread cached connections ("ro" / "rw"), plus a registry of every
+        # connection opened so close() can release them from any thread
+        self._tls = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._owner_pid = os.getpid()
+
+        # Writes from this process go through one writer at a time, so threads
+        # queue on this lock instead of spinning on SQLite's busy timeout
+        self._write_lock = threading.Lock()
+
+        # Close connections at interpreter exit or when the manager is collected
+        weakref.finalize(self, _close_connections, self._connections, self._connections_lock)
+
+        # Sorted in-process cache for get_all_segments(). Commits made by this
+        # manager are merged in from rows with rowid > _segments_max_rowid;
+        # a commit from any other connection forces a full reload
+        self._segments_cache: List[SegmentRecord] = []
+        self._segments_cache_keys: List[float] = []
+        self._segments_max_rowid = 0
+        self._segments_cache_valid = False
+        self._segments_data_version: Optional[Tuple[int, int]] = None
+        self._segments_own_commits = False
+        self._segments_cache_lock = threading.Lock()
+
+        # The first writable connection secures the database file; initialize()
+        # re-checks once its writes have created the WAL and SHM files
+        self._permissions_ensured = False
+        self._permissions_lock = threading.Lock()
+
+    def _ensure_secure_permissions_once(self) -> None:
+        """Run _ensure_secure_permissions() the first time it is needed."""
+        with self._permissions_lock:
+            if not self._permissions_ensured:
+                self._ensure_secure_permissions()
+                self._permissions_ensured = True
 
     def _ensure_secure_permissions(self) -> None:
         """
         Ensure database file has secure permissions (0o600).
 
-        This method is called during initialization and after database creation
-        to prevent other users from accessing the database file.
+        This method is called when the first writable connection is opened and
+        at the end of initialize() to prevent other users from accessing the
+        database file.
 
         Sets permissions on:
             - Main database file (.sqlite3)
@@ -109,63 +644,323 @@ class DatabaseManager:
             if shm_path.exists():
                 os.chmod(shm_path, 0o600)
 
-    @contextmanager
-    def _get_connection(self, read_only: bool = False):
+    def _open_connection(self, read_only: bool) -> sqlite3.Connection:
         """
-        Context manager for database connections.
+        Open and configure a new database connection.
+
+        Connections run in autocommit mode (isolation_level=None); writes are
+        grouped explicitly with _write_transaction().
 
         Args:
             read_only: If True, open connection in read-only mode
 
-        Yields:
-            sqlite3.Connection: Database connection
-
-        Example:
-            with db._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM segments")
+        Returns:
+            sqlite3.Connection: Configured connection
         """
-        # Track if database file existed before connection
-        db_existed = self.db_path.exists()
-
-        if read_only and db_existed:
+        if read_only:
             uri = f"file:{self.db_path}?mode=ro"
-            conn = sqlite3.connect(uri, uri=True)
+            conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, isolation_level=None,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
         else:
             # Set restrictive umask before creating database
             old_umask = os.umask(0o077)
             try:
-                conn = sqlite3.connect(self.db_path)
+                conn = sqlite3.connect(
+                    self.db_path, check_same_thread=False, isolation_level=None,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                )
             finally:
                 os.umask(old_umask)
 
-            # Ensure secure permissions on newly created database
-            if not db_existed:
-                self._ensure_secure_permissions()
+            self._ensure_secure_permissions_once()
+
+        self._configure_connection(conn, read_only)
+
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _cached_connection(self, read_only: bool) -> sqlite3.Connection:
+        """
+        Get this thread's cached connection, opening it on first use.
 
+        Each thread keeps one read-only and one read-write connection, so the
+        page cache and prepared statements stay warm across calls. Read-only
+        requests never fall back to a writable connection: while the database
+        file does not exist yet, opening it fails and nothing is cached, so
+        the next call tries again.
+
+        The file's identity is only checked when a connection is opened: if
+        it no longer matches the file this thread's other connection was
+        opened on, that stale connection is dropped. Connections are also
+        dropped by _get_connection() after an OperationalError once the file
+        has been removed or replaced; transient errors such as a busy or
+        locked database keep them.
+
+        Args:
+            read_only: If True, return the read-only connection
+
+        Returns:
+            sqlite3.Connection: Cached connection for the calling thread
+
+        Raises:
+            sqlite3.OperationalError: If the connection cannot be opened
+        """
+        # Connections must not be shared across fork(); start fresh in a child
+        if self._owner_pid != os.getpid():
+            self._tls = threading.local()
+            with self._connections_lock:
+                self._connections.clear()
+            self._write_lock = threading.Lock()
+            self._owner_pid = os.getpid()
+
+        key = "ro" if read_only else "rw"
+        conn = getattr(self._tls, key, None)
+        if conn is not None:
+            return conn
+
+        conn = self._open_connection(read_only)
+
+        file_id = self._file_identity()
+        if file_id != getattr(self._tls, "file_id", file_id):
+            # The file was removed or replaced since this thread last opened it
+            self._close_thread_connections()
+        self._tls.file_id = file_id
+
+        setattr(self._tls, key, conn)
+        return conn
+
+    def _file_identity(self) -> Optional[Tuple[int, int]]:
+        """
+        Identify the database file on disk.
+
+        Returns:
+            Optional[Tuple[int, int]]: (st_dev, st_ino) of the file, or None
+            if it does not exist
+        """
         try:
-            conn.row_factory = sqlite3.Row
+            stat_result = os.stat(self.db_path)
+        except FileNotFoundError:
+            return None
+        return (stat_result.st_dev, stat_result.st_ino)
+
+    def _close_thread_connections(self) -> None:
+        """
+        Close and forget the calling thread's cached connections only.
+
+        Other threads keep their connections (and any open transaction);
+        they reopen on their own once they hit an error or a new file.
+        """
+        for key in ("ro", "rw"):
+            conn = getattr(self._tls, key, None)
+            if conn is None:
+                continue
+            setattr(self._tls, key, None)
+            with self._connections_lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+        # A reopened connection may reuse the id() the cache was keyed on
+        self._segments_data_version = None
+
+    def close(self) -> None:
+        """
+        Close all cached connections opened by this manager (in any thread).
+
+        The manager stays usable; connections are reopened on next use.
+        """
+        _close_connections(self._connections, self._connections_lock)
+        self._tls = threading.local()
+        with self._segments_cache_lock:
+            self._segments_data_version = None
+
+    @contextmanager
+    def _get_connection(self, read_only: bool = False):
+        """
+        Context manager for database connections.
+
+        Yields the calling thread's cached connection rather than opening a
+        new one per call. Any transaction left open when the block exits is
+        rolled back, except inside transaction() on this thread: that
+        transaction belongs to the outermost scope, which commits or rolls
+        it back.
+
+        Args:
+            read_only: If True, open connection in read-only mode
+
+        Yields:
+            sqlite3.Connection: Database connection
 
-            # Set secure_delete for this connection
-            # This ensures deleted data is overwritten with zeros for privacy
-            if not read_only:
-                conn.execute("PRAGMA secure_delete=ON")
+        Example:
+            with db._get_connection() as conn:
+                cursor = conn.execute("SELECT * FROM segments")
+        """
+        conn = self._cached_connection(read_only)
 
+        dropped = False
+        try:
             yield conn
         except Exception as e:
-            conn.rollback()
-            logger.error(f"Database error: {e}", exc_info=True)
+            owns_transaction = not self._joins_open_transaction(conn)
+            if owns_transaction:
+                conn.rollback()
+            if isinstance(e, sqlite3.Error):
+                logger.error(f"Database error: {e}", exc_info=True)
+            if (
+                owns_transaction
+                and isinstance(e, sqlite3.OperationalError)
+                and self._file_identity() != getattr(self._tls, "file_id", None)
+            ):
+                # The file was removed or replaced; reopen on next use
+                self._close_thread_connections()
+                dropped = True
             raise
         finally:
-            conn.close()
+            # Uncommitted work is discarded, as when the connection was closed
+            if not dropped and conn.in_transaction and not self._joins_open_transaction(conn):
+                conn.rollback()
+
+    def _joins_open_transaction(self, conn: sqlite3.Connection) -> bool:
+        """
+        Check whether conn carries this thread's open transaction() scope.
+
+        Args:
+            conn: Connection yielded by _get_connection()
+
+        Returns:
+            bool: True if conn is the writable connection of a transaction
+            that an outer scope on this thread will commit or roll back
+        """
+        return (
+            getattr(self._tls, "in_transaction", False)
+            and conn is getattr(self._tls, "rw", None)
+        )
+
+    @contextmanager
+    def _write_transaction(self):
+        """
+        Context manager for a write transaction on this thread's connection.
+
+        Threads in this process take turns on an in-process writer lock, then
+        take the database write lock up front with BEGIN IMMEDIATE, so a
+        transaction never fails midway trying to upgrade a read lock while
+        another connection writes (waiting on other processes is bounded by
+        the connection's 5 s busy timeout instead). Commits on normal exit
+        and rolls back on error.
+
+        Inside transaction() on the same thread, joins the open transaction
+        instead; the outermost scope commits.
+
+        Yields:
+            sqlite3.Connection: Database connection inside the transaction
+        """
+        if getattr(self._tls, "in_transaction", False):
+            yield self._cached_connection(read_only=False)
+            return
+
+        with self._write_lock, self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._tls.in_transaction = True
+            try:
+                yield conn
+            finally:
+                self._tls.in_transaction = False
+            conn.execute("COMMIT")
+            self._segments_own_commits = True
+
+    def _require_no_transaction(self, operation: str) -> None:
+        """
+        Refuse to run a maintenance operation inside transaction().
+
+        Checkpoints cannot make progress past this thread's own open
+        transaction, and VACUUM fails inside one, so these operations must run
+        outside it.
+
+        Args:
+            operation: Name of the operation, for the error message
+
+        Raises:
+            RuntimeError: If this thread is inside transaction()
+        """
+        if getattr(self._tls, "in_transaction", False):
+            raise RuntimeError(f"{operation}() cannot run inside transaction()")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group several write calls into one transaction and one WAL commit.
+
+        Inserts and deletes made on this thread inside the block join the same
+        transaction. Everything is committed when the block exits, or rolled
+        back if it raises. Reads inside the block use the read-only connection
+        and do not see the uncommitted writes.
+
+        Yields:
+            DatabaseManager: This manager
+
+        Example:
+            with db.transaction():
+                for event in events:
+                    db.insert_appsegment(*event)
+        """
+        with self._write_transaction():
+            yield self
+
+    def _configure_connection(self, conn: sqlite3.Connection, read_only: bool) -> None:
+        """
+        Apply the standard PRAGMA profile to a new connection.
+
+        Every connection gets a larger page cache, in-memory temp storage and
+        memory-mapped reads and a 5 s busy timeout; read-only connections also
+        set query_only. Writable connections on a brand-new file first fix the
+        page size and enable incremental auto-vacuum. Writable connections
+        additionally ensure WAL mode (a no-op once set, but keeps WAL even if
+        initialize() was never run), apply WAL_WRITER_PRAGMAS when in WAL mode
+        (synchronous=NORMAL is safe against corruption; only the last
+        transactions may roll back on power loss; journal_size_limit stops the
+        -wal file from staying at its high-water mark), and enable
+        secure_delete.
+
+        Args:
+            conn: Newly opened connection
+            read_only: Whether the connection was opened read-only
+        """
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+        if read_only:
+            # Belt and braces on top of mode=ro: refuse writes at the SQL layer
+            conn.execute("PRAGMA query_only=ON")
+            return
+
+        # page_size and auto_vacuum only take effect on an empty file, and
+        # switching to WAL below writes the header
+        if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if str(journal_mode).lower() == "wal":
+            for pragma in WAL_WRITER_PRAGMAS:
+                conn.execute(pragma)
+
+        # Set secure_delete for this connection
+        # This ensures deleted data is overwritten with zeros for privacy
+        conn.execute("PRAGMA secure_delete=ON")
 
     def initialize(self) -> None:
         """
         Initialize database schema with all tables and indexes.
 
         Creates schema_version, segments, and appsegments tables with appropriate
-        indexes. Enables WAL mode for concurrent access and secure_delete for
-        privacy. Safe to call multiple times.
+        indexes. WAL mode and secure_delete are applied by _configure_connection()
+        when the writable connection is opened. Safe to call multiple times.
 
         Raises:
             sqlite3.Error: If database initialization fails
@@ -173,128 +968,77 @@ class DatabaseManager:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            # Enable WAL mode for concurrent reads during writes
-            cursor.execute("PRAGMA journal_mode=WAL")
-            logger.info("WAL mode enabled for concurrent access")
-
-            # Enable secure_delete to overwrite deleted data with zeros
-            # This ensures deleted records are truly removed from disk, enhancing privacy
-            cursor.execute("PRAGMA secure_delete=ON")
-            logger.info("Secure delete enabled for privacy protection")
+            # Bring an existing database up to date before (re)creating schema objects
+            current_version = self._read_schema_version(cursor)
+            if current_version is not None:
+                cursor.execute("BEGIN IMMEDIATE")
+                self._apply_migrations(cursor, current_version)
+                cursor.execute("COMMIT")
 
-            # Create schema_version table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS schema_version (
-                    version TEXT PRIMARY KEY,
-                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Insert initial schema version if not exists
-            cursor.execute("""
-                INSERT OR IGNORE INTO schema_version (version)
-                VALUES (?)
-            """, (SCHEMA_VERSION,))
+            # Create all tables and indexes in one transaction
+            conn.executescript(_SCHEMA_SQL)
 
-            # Create segments table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS segments (
-                    id TEXT PRIMARY KEY,
-                    date TEXT NOT NULL,
-                    start_ts REAL NOT NULL,
-                    end_ts REAL NOT NULL,
-                    frame_count INTEGER NOT NULL,
-                    fps REAL,
-                    width INTEGER,
-                    height INTEGER,
-                    file_size_bytes INTEGER NOT NULL,
-                    video_path TEXT NOT NULL
-                )
-            """)
+            if current_version is None:
+                # New database: _SCHEMA_SQL created the latest schema
+                cursor.execute("""
+                    INSERT OR IGNORE INTO schema_version (version)
+                    VALUES (?)
+                """, (SCHEMA_VERSION,))
 
-            # Create indexes for segments table
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_segments_date
-                ON segments(date)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_segments_start_ts
-                ON segments(start_ts)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_segments_end_ts
-                ON segments(end_ts)
-            """)
+            logger.info(f"Database initialized at {self.db_path}")
 
-            # Create appsegments table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS appsegments (
-                    id TEXT PRIMARY KEY,
-                    app_id TEXT,
-                    date TEXT NOT NULL,
-                    start_ts REAL NOT NULL,
-                    end_ts REAL NOT NULL
-                )
-            """)
+            # Ensure secure permissions after initialization
+            self._ensure_secure_permissions()
 
-            # Create indexes for appsegments table
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_appsegments_date
-                ON appsegments(date)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_appsegments_app_id
-                ON appsegments(app_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_appsegments_start_ts
-                ON appsegments(start_ts)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_appsegments_end_ts
-                ON appsegments(end_ts)
-            """)
+    @staticmethod
+    def _read_schema_version(cursor: sqlite3.Cursor) -> Optional[str]:
+        """
+        Read the most recently applied schema version.
 
-            # Create ocr_text table (Phase 4.1: Text Search with OCR)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS ocr_text (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    frame_path TEXT NOT NULL,
-                    segment_id TEXT,
-                    timestamp REAL NOT NULL,
-                    text_content TEXT NOT NULL,
-                    confidence REAL,
-                    language TEXT DEFAULT 'en',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (segment_id) REFERENCES segments(id) ON DELETE CASCADE
-                )
-            """)
+        Args:
+            cursor: Cursor on a database connection
 
-            # Create indexes for ocr_text table
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ocr_timestamp
-                ON ocr_text(timestamp)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ocr_segment
-                ON ocr_text(segment_id)
-            """)
+        Returns:
+            Optional[str]: Latest version string, or None if none is recorded
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+        )
+        if cursor.fetchone() is None:
+            return None
+
+        cursor.execute("""
+            SELECT version FROM schema_version
+            ORDER BY applied_at DESC, rowid DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _apply_migrations(self, cursor: sqlite3.Cursor, current_version: str) -> None:
+        """
+        Apply pending migrations from MIGRATIONS, recording each new version.
 
-            # Create FTS5 full-text search virtual table
+        Args:
+            cursor: Cursor on a writable connection
+            current_version: Schema version currently recorded in the database
+        """
+        version = current_version
+        for from_version, to_version, migrate in MIGRATIONS:
+            if from_version != version:
+                continue
+            logger.info(f"Migrating database schema {from_version} -> {to_version}")
+            migrate(cursor)
             cursor.execute("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS ocr_search USING fts5(
-                    text_content,
-                    segment_id UNINDEXED,
-                    timestamp UNINDEXED,
-                    tokenize = 'porter unicode61'
-                )
-            """)
-
-            conn.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+                INSERT OR IGNORE INTO schema_version (version)
+                VALUES (?)
+            """, (to_version,))
+            version = to_version
 
-            # Ensure secure permissions after initialization
-            self._ensure_secure_permissions()
+        if version != SCHEMA_VERSION:
+            logger.warning(
+                f"Database schema version {version} does not match expected {SCHEMA_VERSION}"
+            )
 
     def get_schema_version(self) -> str:
         """
@@ -311,13 +1055,8 @@ class DatabaseManager:
         try:
             with self._get_connection(read_only=True) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT version FROM schema_version
-                    ORDER BY applied_at DESC
-                    LIMIT 1
-                """)
-                result = cursor.fetchone()
-                return result["version"] if result else "0.0"
+                version = self._read_schema_version(cursor)
+                return version if version is not None else "0.0"
         except sqlite3.OperationalError:
             # Table doesn't exist (first time setup)
             return "0.0"
@@ -328,7 +1067,8 @@ class DatabaseManager:
 
         The secure_delete pragma causes SQLite to overwrite deleted content with zeros
         rather than leaving it in the database file. This enhances privacy by ensuring
-        deleted data cannot be recovered through disk forensics.
+        deleted data cannot be recovered through disk forensics. The setting is per
+        connection, so this checks the writable connection that performs deletes.
 
         Returns:
             bool: True if secure_delete is ON, False otherwise
@@ -338,15 +1078,14 @@ class DatabaseManager:
                 logger.warning("secure_delete is not enabled")
         """
         try:
-            with self._get_connection(read_only=True) as conn:
-                cursor = conn.cursor()
-                cursor.execute("PRAGMA secure_delete")
+            with self._get_connection() as conn:
+                cursor = conn.execute("PRAGMA secure_delete")
                 result = cursor.fetchone()
                 # secure_delete can be 0 (off), 1 (full), or 2 (fast)
                 # Both 1 and 2 indicate secure_delete is enabled
                 is_enabled = result[0] in (1, 2)
                 if is_enabled:
-                    logger.debug(f"secure_delete is enabled (mode {result[0]})")
+                    logger.debug("secure_delete is enabled (mode %s)", result[0])
                 else:
                     logger.warning("secure_delete is not enabled")
                 return is_enabled
@@ -385,26 +1124,49 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If insertion fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO segments
-                (id, date, start_ts, end_ts, frame_count, fps, width, height, file_size_bytes, video_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                segment_id,
-                date_str,
-                start_ts,
-                end_ts,
-                frame_count,
-                fps,
-                width,
-                height,
-                file_size_bytes,
-                video_path,
-            ))
-            conn.commit()
-            logger.debug(f"Inserted segment {segment_id} [{start_ts:.1f} - {end_ts:.1f}]")
+        self.insert_segments_bulk([(
+            segment_id,
+            date_str,
+            start_ts,
+            end_ts,
+            frame_count,
+            fps,
+            width,
+            height,
+            file_size_bytes,
+            video_path,
+        )])
+        logger.debug("Inserted segment %s [%.1f - %.1f]", segment_id, start_ts, end_ts)
+
+    def insert_segments_bulk(
+        self,
+        records: Iterable[Tuple[str, str, float, float, int, float, Optional[int], Optional[int], int, str]],
+    ) -> int:
+        """
+        Insert or replace multiple video segment records in a single transaction.
+
+        Args:
+            records: Iterable of tuples (segment_id, date_str, start_ts, end_ts,
+                     frame_count, fps, width, height, file_size_bytes, video_path),
+                     i.e. the same field order as SegmentRecord
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            sqlite3.Error: If insertion fails (no records are written)
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(_SQL_INSERT_SEGMENT, records)
+            count = cursor.rowcount
+        logger.debug("Inserted %d segments", count)
+
+        # Large batches can grow the WAL quickly; fold it back opportunistically
+        # (inside transaction() nothing is committed yet, so leave it to later)
+        in_transaction = getattr(self._tls, "in_transaction", False)
+        if count > CHECKPOINT_BATCH_THRESHOLD and not in_transaction:
+            self.checkpoint()
+        return count
 
     def insert_appsegment(
         self,
@@ -427,21 +1189,37 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If insertion fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO appsegments
-                (id, app_id, date, start_ts, end_ts)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                appsegment_id,
-                app_id,
-                date_str,
-                start_ts,
-                end_ts,
-            ))
-            conn.commit()
-            logger.debug(f"Inserted appsegment {appsegment_id} [{app_id or 'unknown'}]")
+        self.insert_appsegments_bulk([(
+            appsegment_id,
+            app_id,
+            date_str,
+            start_ts,
+            end_ts,
+        )])
+        logger.debug("Inserted appsegment %s [%s]", appsegment_id, app_id or "unknown")
+
+    def insert_appsegments_bulk(
+        self,
+        records: Iterable[Tuple[str, Optional[str], str, float, float]],
+    ) -> int:
+        """
+        Insert or replace multiple application activity segments in a single transaction.
+
+        Args:
+            records: Iterable of tuples (appsegment_id, app_id, date_str, start_ts,
+                     end_ts), i.e. the same field order as AppSegmentRecord
+
+        Returns:
+            int: Number of records written
+
+        Raises:
+            sqlite3.Error: If insertion fails (no records are written)
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(_SQL_INSERT_APPSEGMENT, records)
+            count = cursor.rowcount
+            logger.debug("Inserted %d appsegments", count)
+            return count
 
     def segment_exists(self, segment_id: str) -> bool:
         """
@@ -454,31 +1232,89 @@ class DatabaseManager:
             bool: True if segment exists, False otherwise
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM segments WHERE id = ?", (segment_id,))
+            cursor = conn.execute(_SQL_SEGMENT_EXISTS, (segment_id,))
             return cursor.fetchone() is not None
 
     def get_all_segments(self) -> List[SegmentRecord]:
         """
         Load all video segments ordered by start timestamp.
 
+        Results are served from an in-process cache. PRAGMA data_version is
+        read on this thread's writable connection when it has one, since it
+        changes only for commits made by other connections: any such commit
+        (another process, thread or manager) forces a full reload. Commits
+        made on that connection itself only insert rows (deletes invalidate
+        the cache), so those are merged in from rows with a rowid above the
+        last one seen.
+
         Returns:
             List[SegmentRecord]: List of all segments in chronological order
+                (a new list; the records themselves are shared with the cache)
 
         Example:
             segments = db.get_all_segments()
             for seg in segments:
                 print(f"{seg.id}: {seg.start_ts} - {seg.end_ts}")
         """
-        with self._get_connection(read_only=True) as conn:
+        with self._segments_cache_lock, self._get_connection(read_only=True) as conn:
+            version_conn = getattr(self._tls, "rw", None) or conn
+            version = version_conn.execute("PRAGMA data_version").fetchone()[0]
+            data_version = (id(version_conn), version)
+
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
-                       file_size_bytes, video_path
-                FROM segments
-                ORDER BY start_ts ASC
-            """)
-            return [SegmentRecord(**dict(row)) for row in cursor.fetchall()]
+            if not self._segments_cache_valid or data_version != self._segments_data_version:
+                self._reload_segments_cache(cursor)
+            elif self._segments_own_commits:
+                self._refresh_segments_cache(cursor)
+
+            self._segments_own_commits = False
+            self._segments_data_version = data_version
+            return list(self._segments_cache)
+
+    def _reload_segments_cache(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Rebuild the get_all_segments() cache from a full table scan.
+
+        Args:
+            cursor: Cursor on a database connection
+        """
+        cursor.execute(_SQL_ALL_SEGMENTS)
+        rows = cursor.fetchall()
+        self._segments_cache = [SegmentRecord(*row[1:]) for row in rows]
+        self._segments_cache_keys = [seg.start_ts for seg in self._segments_cache]
+        self._segments_max_rowid = max((row[0] for row in rows), default=0)
+        self._segments_cache_valid = True
+
+    def _refresh_segments_cache(self, cursor: sqlite3.Cursor) -> None:
+        """
+        Merge rows this manager added since the last load into the cache.
+
+        Only used when no other connection has committed since the last
+        load. Falls back to a full reload when the row count shows that rows
+        were replaced (INSERT OR REPLACE assigns a new rowid).
+
+        Args:
+            cursor: Cursor on a database connection
+        """
+        cursor.execute(_SQL_SEGMENTS_AFTER_ROWID, (self._segments_max_rowid,))
+        rows = cursor.fetchall()
+
+        cursor.execute("SELECT COUNT(*) FROM segments")
+        if cursor.fetchone()[0] != len(self._segments_cache) + len(rows):
+            self._reload_segments_cache(cursor)
+            return
+
+        for row in rows:
+            segment = SegmentRecord(*row[1:])
+            index = bisect.bisect_right(self._segments_cache_keys, segment.start_ts)
+            self._segments_cache_keys.insert(index, segment.start_ts)
+            self._segments_cache.insert(index, segment)
+            self._segments_max_rowid = max(self._segments_max_rowid, row[0])
+
+    def _invalidate_segments_cache(self) -> None:
+        """Force the next get_all_segments() call to reload from the database."""
+        with self._segments_cache_lock:
+            self._segments_cache_valid = False
 
     def get_all_appsegments(self) -> List[AppSegmentRecord]:
         """
@@ -493,13 +1329,8 @@ class DatabaseManager:
                 print(f"{appseg.app_id}: {appseg.start_ts} - {appseg.end_ts}")
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, app_id, date, start_ts, end_ts
-                FROM appsegments
-                ORDER BY start_ts ASC
-            """)
-            return [AppSegmentRecord(**dict(row)) for row in cursor.fetchall()]
+            cursor = conn.execute(_SQL_ALL_APPSEGMENTS)
+            return list(itertools.starmap(AppSegmentRecord, cursor))
 
     def get_segments_by_date(self, date_str: str) -> List[SegmentRecord]:
         """
@@ -512,15 +1343,14 @@ class DatabaseManager:
             List[SegmentRecord]: List of segments for the specified date
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
                        file_size_bytes, video_path
                 FROM segments
                 WHERE date = ?
                 ORDER BY start_ts ASC
             """, (date_str,))
-            return [SegmentRecord(**dict(row)) for row in cursor.fetchall()]
+            return list(itertools.starmap(SegmentRecord, cursor))
 
     def get_segments_by_date_range(
         self,
@@ -536,17 +1366,47 @@ class DatabaseManager:
 
         Returns:
             List[SegmentRecord]: List of segments within the date range
+
+        Raises:
+            ValueError: If either date is not in YYYY-MM-DD format
+        """
+        return list(self.iter_segments_by_date_range(start_date, end_date))
+
+    def iter_segments_by_date_range(
+        self,
+        start_date: str,
+        end_date: str
+    ) -> Iterator[SegmentRecord]:
+        """
+        Stream segments within a date range (inclusive) from the live cursor.
+
+        The read snapshot stays open until the iterator is exhausted or closed,
+        so consume it promptly.
+
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+
+        Yields:
+            SegmentRecord: Segments in chronological order
+
+        Raises:
+            ValueError: If either date is not in YYYY-MM-DD format
         """
+        # Range-scan the start_ts index instead of comparing date strings
+        lower, upper = _local_date_range_bounds(start_date, end_date)
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
                        file_size_bytes, video_path
                 FROM segments
-                WHERE date >= ? AND date <= ?
+                WHERE start_ts >= ? AND start_ts < ?
                 ORDER BY start_ts ASC
-            """, (start_date, end_date))
-            return [SegmentRecord(**dict(row)) for row in cursor.fetchall()]
+            """, (lower, upper))
+            try:
+                yield from itertools.starmap(SegmentRecord, cursor)
+            finally:
+                cursor.close()
 
     def find_segment_at_timestamp(
         self,
@@ -562,17 +1422,9 @@ class DatabaseManager:
             Optional[SegmentRecord]: Segment containing the timestamp, or None if not found
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
-                       file_size_bytes, video_path
-                FROM segments
-                WHERE start_ts <= ? AND end_ts >= ?
-                ORDER BY start_ts ASC
-                LIMIT 1
-            """, (timestamp, timestamp))
+            cursor = conn.execute(_SQL_FIND_AT, (timestamp, timestamp))
             row = cursor.fetchone()
-            return SegmentRecord(**dict(row)) if row else None
+            return SegmentRecord(*row) if row else None
 
     def find_nearest_segment_forward(
         self,
@@ -588,17 +1440,9 @@ class DatabaseManager:
             Optional[SegmentRecord]: Nearest segment forward, or None if not found
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
-                       file_size_bytes, video_path
-                FROM segments
-                WHERE start_ts >= ?
-                ORDER BY start_ts ASC
-                LIMIT 1
-            """, (timestamp,))
+            cursor = conn.execute(_SQL_FIND_FORWARD, (timestamp,))
             row = cursor.fetchone()
-            return SegmentRecord(**dict(row)) if row else None
+            return SegmentRecord(*row) if row else None
 
     def find_nearest_segment_backward(
         self,
@@ -607,6 +1451,9 @@ class DatabaseManager:
         """
         Find nearest segment at or before the specified timestamp.
 
+        The segment with the greatest end_ts <= timestamp is returned; the
+        lookup is a single descending seek on idx_segments_end_ts.
+
         Args:
             timestamp: Unix timestamp to search from
 
@@ -614,17 +1461,9 @@ class DatabaseManager:
             Optional[SegmentRecord]: Nearest segment backward, or None if not found
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT id, date, start_ts, end_ts, frame_count, fps, width, height,
-                       file_size_bytes, video_path
-                FROM segments
-                WHERE end_ts <= ?
-                ORDER BY start_ts DESC
-                LIMIT 1
-            """, (timestamp,))
+            cursor = conn.execute(_SQL_FIND_BACKWARD, (timestamp,))
             row = cursor.fetchone()
-            return SegmentRecord(**dict(row)) if row else None
+            return SegmentRecord(*row) if row else None
 
     def get_latest_timestamp(self) -> Optional[float]:
         """
@@ -634,10 +1473,9 @@ class DatabaseManager:
             Optional[float]: Latest timestamp, or None if no segments exist
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT MAX(end_ts) as latest FROM segments")
-            row = cursor.fetchone()
-            return row["latest"] if row and row["latest"] else None
+            cursor = conn.execute("SELECT MAX(end_ts) FROM segments")
+            latest = cursor.fetchone()[0]
+            return latest if latest else None
 
     def get_old_segments(self, cutoff_timestamp: float) -> List[Tuple[str, str]]:
         """
@@ -649,15 +1487,29 @@ class DatabaseManager:
         Returns:
             List[Tuple[str, str]]: List of (segment_id, video_path) tuples for old segments
         """
+        return list(self.iter_old_segments(cutoff_timestamp))
+
+    def iter_old_segments(self, cutoff_timestamp: float) -> Iterator[Tuple[str, str]]:
+        """
+        Stream segments older than the specified cutoff timestamp.
+
+        Args:
+            cutoff_timestamp: Unix timestamp cutoff for retention policy
+
+        Yields:
+            Tuple[str, str]: (segment_id, video_path) for each old segment
+        """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT id, video_path
                 FROM segments
                 WHERE start_ts < ?
                 ORDER BY start_ts ASC
             """, (cutoff_timestamp,))
-            return [(row["id"], row["video_path"]) for row in cursor.fetchall()]
+            try:
+                yield from cursor
+            finally:
+                cursor.close()
 
     def delete_segment(self, segment_id: str) -> None:
         """
@@ -670,11 +1522,56 @@ class DatabaseManager:
             This only deletes the database record. Video file cleanup is the
             caller's responsibility.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
-            conn.commit()
-            logger.debug(f"Deleted segment {segment_id}")
+        with self._write_transaction() as conn:
+            conn.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
+        self._invalidate_segments_cache()
+        logger.debug("Deleted segment %s", segment_id)
+
+    def delete_segments(self, segment_ids: Iterable[str]) -> int:
+        """
+        Delete multiple segments from the database in a single transaction.
+
+        Args:
+            segment_ids: Segment identifiers to delete
+
+        Returns:
+            int: Number of segments deleted
+
+        Note:
+            This only deletes the database records. Video file cleanup is the
+            caller's responsibility.
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(
+                "DELETE FROM segments WHERE id = ?",
+                ((segment_id,) for segment_id in segment_ids),
+            )
+            count = cursor.rowcount
+        self._invalidate_segments_cache()
+        logger.debug("Deleted %d segments", count)
+        return count
+
+    def delete_segments_before(self, cutoff_timestamp: float) -> List[Tuple[str, str]]:
+        """
+        Atomically delete all segments that start before the cutoff timestamp.
+
+        Args:
+            cutoff_timestamp: Unix timestamp cutoff for retention policy
+
+        Returns:
+            List[Tuple[str, str]]: (segment_id, video_path) of each deleted segment,
+                so the caller can remove the video files
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.execute("""
+                DELETE FROM segments
+                WHERE start_ts < ?
+                RETURNING id, video_path
+            """, (cutoff_timestamp,))
+            deleted = cursor.fetchall()
+        self._invalidate_segments_cache()
+        logger.debug("Deleted %d segments before %s", len(deleted), cutoff_timestamp)
+        return deleted
 
     def delete_appsegment(self, appsegment_id: str) -> None:
         """
@@ -683,11 +1580,9 @@ class DatabaseManager:
         Args:
             appsegment_id: Appsegment identifier to delete
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM appsegments WHERE id = ?", (appsegment_id,))
-            conn.commit()
-            logger.debug(f"Deleted appsegment {appsegment_id}")
+        with self._write_transaction() as conn:
+            conn.execute("DELETE FROM appsegments WHERE id = ?", (appsegment_id,))
+            logger.debug("Deleted appsegment %s", appsegment_id)
 
     def insert_ocr_text(
         self,
@@ -715,34 +1610,34 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If insertion fails
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+        with self._write_transaction() as conn:
+            cursor = conn.execute("""
                 INSERT INTO ocr_text
                 (frame_path, segment_id, timestamp, text_content, confidence, language)
                 VALUES (?, ?, ?, ?, ?, ?)
             """, (frame_path, segment_id, timestamp, text_content, confidence, language))
 
-            # Also insert into FTS5 index for full-text search
+            # The ocr_search index is updated by trigger
             ocr_id = cursor.lastrowid
-            cursor.execute("""
-                INSERT INTO ocr_search (rowid, text_content, segment_id, timestamp)
-                VALUES (?, ?, ?, ?)
-            """, (ocr_id, text_content, segment_id, timestamp))
 
-            conn.commit()
-            logger.debug(f"Inserted OCR text {ocr_id} [{len(text_content)} chars, confidence: {confidence:.2f}]")
+            logger.debug(
+                "Inserted OCR text %d [%d chars, confidence: %s]",
+                ocr_id, len(text_content), confidence,
+            )
             return ocr_id
 
     def insert_ocr_batch(
         self,
-        ocr_records: List[Tuple[str, float, str, float, Optional[str], str]]
+        ocr_records: Iterable[Tuple[str, float, str, float, Optional[str], str]]
     ) -> int:
         """
         Insert multiple OCR records in a single transaction for performance.
 
+        Records are passed to SQLite in slices of OCR_BATCH_CHUNK_SIZE, so a
+        generator can be consumed without materializing it.
+
         Args:
-            ocr_records: List of tuples (frame_path, timestamp, text_content,
+            ocr_records: Iterable of tuples (frame_path, timestamp, text_content,
                         confidence, segment_id, language)
 
         Returns:
@@ -755,53 +1650,27 @@ class DatabaseManager:
             ]
             count = db.insert_ocr_batch(records)
         """
-        if not ocr_records:
+        records = iter(ocr_records)
+        chunk = list(itertools.islice(records, OCR_BATCH_CHUNK_SIZE))
+        if not chunk:
             return 0
 
-        with self._get_connection() as conn:
+        inserted = 0
+        with self._write_transaction() as conn:
             cursor = conn.cursor()
 
-            # Insert into ocr_text table
-            cursor.executemany("""
-                INSERT INTO ocr_text
-                (frame_path, timestamp, text_content, confidence, segment_id, language)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, ocr_records)
-
-            # CRITICAL FIX: lastrowid after executemany is unreliable for calculating
-            # first_id when autoincrement may have gaps. Instead, query back the actual
-            # IDs based on the data we just inserted (timestamp + frame_path uniquely
-            # identify recent inserts within this transaction).
-            #
-            # We retrieve IDs for all records just inserted by matching on timestamp
-            # and frame_path, ordered by id to maintain insertion order.
-            timestamp_paths = [(rec[1], rec[0]) for rec in ocr_records]
-            placeholders = ','.join(['(?,?)' for _ in timestamp_paths])
-            flat_params = [item for pair in timestamp_paths for item in pair]
-
-            cursor.execute(f"""
-                SELECT id, timestamp, frame_path, text_content, segment_id
-                FROM ocr_text
-                WHERE (timestamp, frame_path) IN (VALUES {placeholders})
-                ORDER BY id
-            """, flat_params)
-
-            inserted_rows = cursor.fetchall()
-
-            # Build FTS5 records using actual IDs from database
-            fts_records = [
-                (row[0], row[3], row[4], row[1])  # (id, text_content, segment_id, timestamp)
-                for row in inserted_rows
-            ]
-
-            cursor.executemany("""
-                INSERT INTO ocr_search (rowid, text_content, segment_id, timestamp)
-                VALUES (?, ?, ?, ?)
-            """, fts_records)
+            # Insert into ocr_text table; the ocr_search index is updated by trigger
+            while chunk:
+                cursor.executemany("""
+                    INSERT INTO ocr_text
+                    (frame_path, timestamp, text_content, confidence, segment_id, language)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, chunk)
+                inserted += len(chunk)
+                chunk = list(itertools.islice(records, OCR_BATCH_CHUNK_SIZE))
 
-            conn.commit()
-            logger.info(f"Batch inserted {len(ocr_records)} OCR records")
-            return len(ocr_records)
+        logger.info(f"Batch inserted {inserted} OCR records")
+        return inserted
 
     def search_ocr_text(
         self,
@@ -827,34 +1696,10 @@ class DatabaseManager:
                 print(f"{ts}: {text} (confidence: {conf:.2f})")
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    o.id,
-                    o.text_content,
-                    o.timestamp,
-                    o.segment_id,
-                    o.confidence,
-                    s.rank
-                FROM ocr_text o
-                JOIN ocr_search s ON o.id = s.rowid
-                WHERE s.text_content MATCH ?
-                AND o.confidence >= ?
-                ORDER BY s.rank
-                LIMIT ?
-            """, (query, min_confidence, limit))
-
-            results = []
-            for row in cursor.fetchall():
-                results.append((
-                    row[0],  # id
-                    row[1],  # text_content
-                    row[2],  # timestamp
-                    row[3],  # segment_id
-                    row[4],  # confidence
-                ))
-
-            logger.debug(f"Search query '{query}' returned {len(results)} results")
+            cursor = conn.execute(_SQL_SEARCH_OCR, (query, min_confidence, limit))
+            results = cursor.fetchall()
+
+            logger.debug("Search query %r returned %d results", query, len(results))
             return results
 
     def get_ocr_by_segment(self, segment_id: str) -> List[OCRTextRecord]:
@@ -868,15 +1713,14 @@ class DatabaseManager:
             List[OCRTextRecord]: List of OCR records for the segment
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT id, frame_path, segment_id, timestamp, text_content,
                        confidence, language, created_at
                 FROM ocr_text
                 WHERE segment_id = ?
                 ORDER BY timestamp ASC
             """, (segment_id,))
-            return [OCRTextRecord(**dict(row)) for row in cursor.fetchall()]
+            return list(itertools.starmap(OCRTextRecord, cursor))
 
     def get_ocr_by_timestamp_range(
         self,
@@ -894,15 +1738,14 @@ class DatabaseManager:
             List[OCRTextRecord]: List of OCR records within the range
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
+            cursor = conn.execute("""
                 SELECT id, frame_path, segment_id, timestamp, text_content,
                        confidence, language, created_at
                 FROM ocr_text
                 WHERE timestamp >= ? AND timestamp <= ?
                 ORDER BY timestamp ASC
             """, (start_ts, end_ts))
-            return [OCRTextRecord(**dict(row)) for row in cursor.fetchall()]
+            return list(itertools.starmap(OCRTextRecord, cursor))
 
     def delete_ocr_by_segment(self, segment_id: str) -> int:
         """
@@ -918,13 +1761,26 @@ class DatabaseManager:
             This is automatically handled by CASCADE when segment is deleted,
             but can be called explicitly if needed.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM ocr_text WHERE segment_id = ?", (segment_id,))
+        return self.delete_ocr_by_segments([segment_id])
+
+    def delete_ocr_by_segments(self, segment_ids: Iterable[str]) -> int:
+        """
+        Delete all OCR records for multiple segments in a single transaction.
+
+        Args:
+            segment_ids: Segment identifiers
+
+        Returns:
+            int: Number of records deleted
+        """
+        with self._write_transaction() as conn:
+            cursor = conn.executemany(
+                "DELETE FROM ocr_text WHERE segment_id = ?",
+                ((segment_id,) for segment_id in segment_ids),
+            )
             deleted = cursor.rowcount
-            conn.commit()
-            logger.debug(f"Deleted {deleted} OCR records for segment {segment_id}")
-            return deleted
+        logger.debug("Deleted %d OCR records", deleted)
+        return deleted
 
     def get_database_stats(self) -> dict:
         """
@@ -939,90 +1795,180 @@ class DatabaseManager:
             print(f"Total size: {stats['total_video_bytes'] / 1024**3:.2f} GB")
         """
         with self._get_connection(read_only=True) as conn:
-            cursor = conn.cursor()
-
-            # Segment statistics
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as segment_count,
-                    MIN(start_ts) as earliest_ts,
-                    MAX(end_ts) as latest_ts,
-                    SUM(file_size_bytes) as total_video_bytes,
-                    SUM(frame_count) as total_frames
-                FROM segments
-            """)
-            segment_stats = dict(cursor.fetchone())
-
-            # AppSegment statistics
-            cursor.execute("""
+            # Segment and appsegment totals are maintained by triggers; the
+            # timestamp bounds are single index lookups
+            (
+                segment_count, earliest_ts, latest_ts, total_video_bytes,
+                total_frames, appsegment_count, unique_app_count,
+            ) = conn.execute("""
                 SELECT
-                    COUNT(*) as appsegment_count,
-                    COUNT(DISTINCT app_id) as unique_app_count
-                FROM appsegments
-            """)
-            appsegment_stats = dict(cursor.fetchone())
-
-            # OCR statistics (if table exists)
+                    segment_count,
+                    (SELECT MIN(start_ts) FROM segments),
+                    (SELECT MAX(end_ts) FROM segments),
+                    total_video_bytes,
+                    total_frames,
+                    appsegment_count,
+                    (SELECT COUNT(*) FROM app_id_counts)
+                FROM segment_totals
+                WHERE id = 1
+            """).fetchone()
+
+            # OCR totals are maintained by triggers (if the table exists)
             try:
-                cursor.execute("""
+                ocr_count, avg_confidence, total_text_chars = conn.execute("""
                     SELECT
-                        COUNT(*) as ocr_count,
-                        AVG(confidence) as avg_confidence,
-                        SUM(LENGTH(text_content)) as total_text_chars
-                    FROM ocr_text
-                """)
-                ocr_stats = dict(cursor.fetchone())
+                        ocr_count,
+                        CASE WHEN confidence_count > 0
+                            THEN confidence_sum / confidence_count
+                        END,
+                        total_text_chars
+                    FROM ocr_totals
+                    WHERE id = 1
+                """).fetchone()
             except sqlite3.OperationalError:
                 # Table doesn't exist (schema < 1.1)
-                ocr_stats = {
-                    "ocr_count": 0,
-                    "avg_confidence": 0.0,
-                    "total_text_chars": 0
-                }
+                ocr_count, avg_confidence, total_text_chars = 0, 0.0, 0
 
-            # Database file size
+            # Database and write-ahead log file sizes
             db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+            wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+            wal_size = wal_path.stat().st_size if wal_path.exists() else 0
 
             return {
-                **segment_stats,
-                **appsegment_stats,
-                **ocr_stats,
+                "segment_count": segment_count,
+                "earliest_ts": earliest_ts,
+                "latest_ts": latest_ts,
+                "total_video_bytes": total_video_bytes,
+                "total_frames": total_frames,
+                "appsegment_count": appsegment_count,
+                "unique_app_count": unique_app_count,
+                "ocr_count": ocr_count,
+                "avg_confidence": avg_confidence,
+                "total_text_chars": total_text_chars,
                 "database_size_bytes": db_size,
+                "wal_size_bytes": wal_size,
                 "schema_version": self.get_schema_version(),
             }
 
-    def vacuum(self) -> None:
+    def checkpoint(self, mode: str = "PASSIVE") -> Tuple[int, int, int]:
+        """
+        Checkpoint the write-ahead log into the main database file.
+
+        PASSIVE never waits for readers; TRUNCATE waits for them and then
+        truncates the -wal file to zero bytes.
+
+        Args:
+            mode: One of CHECKPOINT_MODES
+
+        Returns:
+            Tuple[int, int, int]: (busy, wal_frames, checkpointed_frames) as
+                reported by PRAGMA wal_checkpoint
+
+        Raises:
+            ValueError: If mode is not a valid checkpoint mode
+            RuntimeError: If called inside transaction()
+        """
+        mode = mode.upper()
+        if mode not in CHECKPOINT_MODES:
+            raise ValueError(f"Invalid checkpoint mode: {mode}")
+        self._require_no_transaction("checkpoint")
+
+        with self._get_connection() as conn:
+            busy, wal_frames, checkpointed = conn.execute(
+                f"PRAGMA wal_checkpoint({mode})"
+            ).fetchone()
+        logger.debug(
+            f"WAL checkpoint ({mode}): {checkpointed}/{wal_frames} frames, busy={busy}"
+        )
+        return busy, wal_frames, checkpointed
+
+    def vacuum(self, max_pages: Optional[int] = None) -> None:
         """
         Reclaim space from deleted records.
 
-        This operation rebuilds the database file, removing unused space from
-        deleted records. Should be run monthly or after large deletions.
+        On databases with auto_vacuum=INCREMENTAL (all databases created by
+        this module) this moves free pages to the end of the file and truncates
+        it, without rewriting the rest of the file, and does nothing when there
+        are no free pages. Older databases fall back to full_vacuum() once,
+        which also switches them to incremental mode.
+
+        Args:
+            max_pages: Maximum number of free pages to release (default: all)
+
+        Raises:
+            RuntimeError: If called inside transaction()
+        """
+        self._require_no_transaction("vacuum")
+        with self._write_transaction() as conn:
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if auto_vacuum == 2:  # INCREMENTAL
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if free_pages == 0:
+                    logger.debug("No free pages to reclaim; skipping vacuum")
+                    return
+                if max_pages is not None:
+                    free_pages = min(free_pages, int(max_pages))
+                logger.info("Starting incremental database vacuum...")
+                # The sqlite3 module steps a row-less pragma only once, so each
+                # execute() releases a single page and fetchall() has nothing
+                # to drain; the file is truncated when the transaction commits
+                for _ in range(free_pages):
+                    conn.execute("PRAGMA incremental_vacuum(1)").fetchall()
+                logger.info("Incremental database vacuum completed")
+                return
+
+        self.full_vacuum()
+
+    def full_vacuum(self) -> None:
+        """
+        Rebuild the entire database file.
+
+        Also enables auto_vacuum=INCREMENTAL, so later vacuum() calls can
+        reclaim space without a rebuild.
 
         Warning:
             This operation may take several seconds on large databases and
             requires exclusive access.
+
+        Raises:
+            RuntimeError: If called inside transaction()
         """
-        logger.info("Starting database vacuum...")
+        self._require_no_transaction("full_vacuum")
+        logger.info("Starting full database vacuum...")
         with self._get_connection() as conn:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
             conn.execute("VACUUM")
-        logger.info("Database vacuum completed")
+        logger.info("Full database vacuum completed")
 
-    def check_integrity(self) -> bool:
+    def check_integrity(self, mode: str = "quick") -> bool:
         """
         Verify database integrity.
 
+        The default quick check verifies page and record structure but skips
+        matching index contents against their tables, which makes it much
+        faster on large databases. Use mode="full" for a periodic manual check.
+
+        Args:
+            mode: "quick" (PRAGMA quick_check) or "full" (PRAGMA integrity_check)
+
         Returns:
             bool: True if database is healthy, False if corrupted
 
+        Raises:
+            ValueError: If mode is not "quick" or "full"
+
         Example:
             if not db.check_integrity():
                 logger.error("Database corruption detected!")
                 restore_from_backup(db.db_path)
         """
+        pragmas = {"quick": "quick_check", "full": "integrity_check"}
+        if mode not in pragmas:
+            raise ValueError(f"Invalid integrity check mode: {mode}")
+
         try:
             with self._get_connection(read_only=True) as conn:
-                cursor = conn.cursor()
-                cursor.execute("PRAGMA integrity_check")
+                cursor = conn.execute(f"PRAGMA {pragmas[mode]}")
                 result = cursor.fetchone()
                 is_ok = result[0] == "ok"
                 if not is_ok:
@@ -1053,7 +1999,21 @@ class DatabaseManager:
             backup_dir = self.db_path.parent
 
         backup_path = backup_dir / backup_name
-        shutil.copy2(self.db_path, backup_path)
+
+        # Online page-by-page copy: consistent with concurrent WAL writers and
+        # yields the database lock between steps
+        old_umask = os.umask(0o077)
+        try:
+            dest = sqlite3.connect(backup_path)
+        finally:
+            os.umask(old_umask)
+        try:
+            with self._get_connection(read_only=True) as conn:
+                conn.backup(dest, pages=BACKUP_PAGES_PER_STEP, sleep=0.001)
+        finally:
+            dest.close()
+
+        os.chmod(backup_path, 0o600)
         logger.info(f"Backup created: {backup_path}")
         return backup_path
 
@@ -1062,13 +2022,33 @@ def generate_segment_id() -> str:
     """
     Generate a unique segment or appsegment ID.
 
+    IDs are a 16-bit per-process salt followed by a 64-bit counter seeded
+    from the wall clock in nanoseconds, so no syscall is needed per ID.
+
     Returns:
         str: 20 hex character identifier
 
     Example:
-        segment_id = generate_segment_id()  # e.g., "1a2b3c4d5e6f7g8h9i0j"
+        segment_id = generate_segment_id()  # e.g., "1a2b17f0c3d2e4b5a697"
     """
-    return os.urandom(10).hex()
+    return f"{_segment_id_salt:04x}{next(_segment_id_counter) & _SEGMENT_ID_COUNTER_MASK:016x}"
+
+
+def _reseed_segment_ids() -> None:
+    """Draw a fresh process salt and counter start for generate_segment_id()."""
+    global _segment_id_salt, _segment_id_counter
+    _segment_id_salt = int.from_bytes(os.urandom(2), "big")
+    _segment_id_counter = itertools.count(time.time_ns() & _SEGMENT_ID_COUNTER_MASK)
+
+
+_SEGMENT_ID_COUNTER_MASK = (1 << 64) - 1
+_segment_id_salt = 0
+_segment_id_counter = itertools.count()
+_reseed_segment_ids()
+
+# A forked child would otherwise repeat the parent's salt and counter
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_segment_ids)
 
 
 def init_database(db_path: Path) -> DatabaseManager:
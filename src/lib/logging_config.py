@@ -4,16 +4,102 @@ Centralized logging configuration for Playback.
 Provides structured JSON logging with rotation for all Playback services.
 """
 
+import atexit
+import copy
 import json
 import logging
 import logging.handlers
+import queue
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from lib import paths
 
+# Try to import orjson for faster log encoding
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Log level names accepted by log_with_metadata
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Background listeners for loggers set up with use_queue=True, keyed by logger name
+_QUEUE_LISTENERS: Dict[str, logging.handlers.QueueListener] = {}
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that freezes record contents but keeps exc_info.
+
+    The default QueueHandler formats the whole record (merging exception text
+    into the message) so it can be pickled. Records here never leave the
+    process, so exc_info is kept for JSONFormatter; only the message and
+    metadata are captured now, so later changes to mutable %-args or
+    metadata values by the caller do not leak into the log line written on
+    the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        metadata = getattr(record, "metadata", None)
+        if isinstance(metadata, dict):
+            record.metadata = dict(metadata)
+        return record
+
+
+def _stop_queue_listener(name: str) -> None:
+    """Stop and flush the queue listener for a logger, if any."""
+    listener = _QUEUE_LISTENERS.pop(name, None)
+    if listener is not None:
+        listener.stop()
+
+
+def _stop_all_queue_listeners() -> None:
+    """Flush all queued log records (registered with atexit)."""
+    for name in list(_QUEUE_LISTENERS):
+        _stop_queue_listener(name)
+
+
+atexit.register(_stop_all_queue_listeners)
+
+
+# Shared fallback encoder; json.dumps() with non-default options builds a new
+# JSONEncoder on every call
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def _dumps(log_entry: Dict[str, Any]) -> str:
+    """Serialize a log entry to a single line of JSON.
+
+    Uses orjson when installed, falling back to the json module for values
+    orjson rejects (e.g. integers wider than 64 bits).
+
+    Args:
+        log_entry: Log entry to serialize
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return _JSON_ENCODER.encode(log_entry)
+
 
 class JSONFormatter(logging.Formatter):
     """Custom formatter that outputs newline-delimited JSON."""
@@ -26,6 +112,9 @@ class JSONFormatter(logging.Formatter):
         """
         super().__init__()
         self.component = component
+        # (whole second, "YYYY-MM-DDTHH:MM:SS") of the last formatted record;
+        # the date/time prefix only changes once per second
+        self._second_prefix = (-1, "")
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
@@ -37,7 +126,7 @@ class JSONFormatter(logging.Formatter):
             JSON string representation of log record
         """
         log_entry: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "component": self.component,
             "message": record.getMessage(),
@@ -51,7 +140,23 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        return _dumps(log_entry)
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record's creation time as ISO 8601 UTC with microseconds.
+
+        Args:
+            created: Record creation time (seconds since the epoch)
+
+        Returns:
+            Timestamp such as "2025-02-07T12:00:00.123456Z"
+        """
+        second = int(created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_prefix = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1e6):06d}Z"
 
 
 def setup_logger(
@@ -60,6 +165,7 @@ def setup_logger(
     max_bytes: int = 10 * 1024 * 1024,  # 10 MB
     backup_count: int = 5,
     console_output: bool = True,
+    use_queue: bool = False,
 ) -> logging.Logger:
     """Setup logger with JSON formatting and file rotation.
 
@@ -69,6 +175,9 @@ def setup_logger(
         max_bytes: Maximum size per log file in bytes (default: 10 MB)
         backup_count: Number of backup files to keep (default: 5)
         console_output: Whether to also output logs to console (default: True)
+        use_queue: Whether to hand records to a background thread that does
+            the formatting and I/O, so logging never blocks the caller on
+            disk or pipe writes (default: False)
 
     Returns:
         Configured logger instance
@@ -76,6 +185,7 @@ def setup_logger(
     logger = logging.getLogger(f"playback.{component}")
     logger.setLevel(getattr(logging, log_level.upper()))
     logger.handlers.clear()  # Remove any existing handlers
+    _stop_queue_listener(logger.name)
 
     # Determine log directory based on environment
     if paths.is_development_mode():
@@ -95,13 +205,26 @@ def setup_logger(
         encoding="utf-8",
     )
     file_handler.setFormatter(JSONFormatter(component))
-    logger.addHandler(file_handler)
+    handlers: list = [file_handler]
 
     # Add console handler if requested
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(JSONFormatter(component))
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    if use_queue:
+        # Caller only enqueues; a listener thread formats and writes
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            record_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        _QUEUE_LISTENERS[logger.name] = listener
+        logger.addHandler(_RecordQueueHandler(record_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
@@ -115,7 +238,17 @@ def log_with_metadata(logger: logging.Logger, level: str, message: str, **metada
         message: Log message
         **metadata: Additional key-value pairs to include in metadata field
     """
-    log_method = getattr(logger, level.lower())
+    # Callers almost always pass lowercase names; only normalize otherwise
+    level_no = _LEVELS.get(level)
+    if level_no is None:
+        level = level.lower()
+        level_no = _LEVELS[level]
+
+    # Skip record creation entirely when the level is filtered out
+    if not logger.isEnabledFor(level_no):
+        return
+
+    log_method = getattr(logger, level)
     log_method(message, extra={"metadata": metadata})
 
 
@@ -198,28 +331,34 @@ def log_processing_completion(
     log_with_metadata(logger, "info", "Day processing completed", **metadata)
 
 
-# Convenience functions for common log levels
+# Convenience functions for common log levels; each checks its level directly
+# instead of going through log_with_metadata's name lookup
 
 def log_info(logger: logging.Logger, message: str, **metadata: Any) -> None:
     """Log INFO level message with metadata."""
-    log_with_metadata(logger, "info", message, **metadata)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(message, extra={"metadata": metadata})
 
 
 def log_warning(logger: logging.Logger, message: str, **metadata: Any) -> None:
     """Log WARNING level message with metadata."""
-    log_with_metadata(logger, "warning", message, **metadata)
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(message, extra={"metadata": metadata})
 
 
 def log_error(logger: logging.Logger, message: str, **metadata: Any) -> None:
     """Log ERROR level message with metadata."""
-    log_with_metadata(logger, "error", message, **metadata)
+    if logger.isEnabledFor(logging.ERROR):
+        logger.error(message, extra={"metadata": metadata})
 
 
 def log_critical(logger: logging.Logger, message: str, **metadata: Any) -> None:
     """Log CRITICAL level message with metadata."""
-    log_with_metadata(logger, "critical", message, **metadata)
+    if logger.isEnabledFor(logging.CRITICAL):
+        logger.critical(message, extra={"metadata": metadata})
 
 
 def log_debug(logger: logging.Logger, message: str, **metadata: Any) -> None:
     """Log DEBUG level message with metadata."""
-    log_with_metadata(logger, "debug", message, **metadata)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, extra={"metadata": metadata})
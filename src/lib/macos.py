@@ -4,7 +4,7 @@ macOS-specific utilities for system integration.
 This module provides functions for:
 - CoreGraphics display detection and management
 - AppleScript integration for system state queries
-- Screen availability detection (screensaver, display off)
+- Screen availability detection (screensaver, screen lock, display off)
 - Frontmost application detection
 
 All functions include proper error handling and return None on failure
@@ -13,19 +13,166 @@ rather than raising exceptions, allowing callers to handle failures gracefully.
 
 import ctypes
 import ctypes.util
+import os
 import subprocess
-from typing import Optional, Tuple
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union
 
+# Try to import AppKit (PyObjC) for in-process workspace queries
+try:
+    from AppKit import NSDate, NSRunLoop, NSRunningApplication, NSWorkspace
 
-# Global CoreGraphics framework reference (lazy-loaded)
-_CG = None
+    APPKIT_AVAILABLE = True
+except ImportError:
+    APPKIT_AVAILABLE = False
+
+
+def _load_framework(name: str) -> Optional[ctypes.CDLL]:
+    """
+    Load a system framework via ctypes.
+
+    Args:
+        name: Framework name (e.g. "CoreGraphics")
+
+    Returns:
+        CDLL object for the framework, or None if it is not available
+        (e.g. when not running on macOS)
+    """
+    path = ctypes.util.find_library(name)
+    if not path:
+        return None
+    try:
+        return ctypes.CDLL(path)
+    except OSError:
+        return None
+
+
+# Framework references, loaded once at import (None when unavailable)
+_CG = _load_framework("CoreGraphics")
+_CF = _load_framework("CoreFoundation")
+_IMAGEIO = _load_framework("ImageIO")
+
+# CoreFoundation string encoding constant (kCFStringEncodingUTF8)
+_K_CF_STRING_ENCODING_UTF8 = 0x08000100
+
+# Uniform Type Identifier for PNG images (kUTTypePNG)
+_UTI_PNG = b"public.png"
+
+# Bundle identifier of the screen saver process
+_SCREENSAVER_BUNDLE_ID = "com.apple.ScreenSaver.Engine"
+
+# CGSession dictionary key reporting whether the login session is locked
+_SESSION_LOCKED_KEY = b"CGSSessionScreenIsLocked"
+
+# Seconds an "available" screen state is reused before re-checking
+_SCREEN_STATE_TTL = 30.0
+
+# Seconds a frontmost-app AppleScript result is reused; focus does not change
+# faster than the user can react, and each lookup forks osascript
+_FRONTMOST_APP_TTL = 0.1
+
+# Maximum number of displays queried from CGGetActiveDisplayList
+_MAX_DISPLAYS = 16
+
+# Seconds the display layout is reused before querying CoreGraphics again.
+# Reconfiguration callbacks invalidate it sooner, but they are only delivered
+# while a run loop is serviced, so the TTL remains as a safety net.
+_DISPLAY_CACHE_TTL = 5.0
+
+
+# CoreGraphics geometry structs
+class CGPoint(ctypes.Structure):
+    _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
+
+
+class CGSize(ctypes.Structure):
+    _fields_ = [("width", ctypes.c_double), ("height", ctypes.c_double)]
+
+
+class CGRect(ctypes.Structure):
+    _fields_ = [("origin", CGPoint), ("size", CGSize)]
+
+
+# Function signatures as (argtypes, restype), bound once on first use
+_CG_SIGNATURES = {
+    "CGGetActiveDisplayList": (
+        [ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32), ctypes.POINTER(ctypes.c_uint32)],
+        ctypes.c_int32,
+    ),
+    "CGEventCreate": ([ctypes.c_void_p], ctypes.c_void_p),
+    "CGEventGetLocation": ([ctypes.c_void_p], CGPoint),
+    "CGDisplayBounds": ([ctypes.c_uint32], CGRect),
+    "CGDisplayRegisterReconfigurationCallback": ([ctypes.c_void_p, ctypes.c_void_p], ctypes.c_int32),
+    "CGDisplayCreateImage": ([ctypes.c_uint32], ctypes.c_void_p),
+    "CGDisplayCreateImageForRect": ([ctypes.c_uint32, CGRect], ctypes.c_void_p),
+    "CGImageGetWidth": ([ctypes.c_void_p], ctypes.c_size_t),
+    "CGImageGetHeight": ([ctypes.c_void_p], ctypes.c_size_t),
+    "CGImageGetBytesPerRow": ([ctypes.c_void_p], ctypes.c_size_t),
+    "CGImageGetDataProvider": ([ctypes.c_void_p], ctypes.c_void_p),
+    "CGDataProviderCopyData": ([ctypes.c_void_p], ctypes.c_void_p),
+    "CGEventSourceSecondsSinceLastEventType": ([ctypes.c_int32, ctypes.c_uint32], ctypes.c_double),
+    "CGSessionCopyCurrentDictionary": ([], ctypes.c_void_p),
+}
+
+_CF_SIGNATURES = {
+    "CFRelease": ([ctypes.c_void_p], None),
+    "CFGetTypeID": ([ctypes.c_void_p], ctypes.c_ulong),
+    "CFBooleanGetTypeID": ([], ctypes.c_ulong),
+    "CFBooleanGetValue": ([ctypes.c_void_p], ctypes.c_bool),
+    "CFDictionaryGetValue": ([ctypes.c_void_p, ctypes.c_void_p], ctypes.c_void_p),
+    "CFDataGetLength": ([ctypes.c_void_p], ctypes.c_long),
+    "CFDataGetBytePtr": ([ctypes.c_void_p], ctypes.c_void_p),
+    "CFURLCreateFromFileSystemRepresentation": (
+        [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_bool],
+        ctypes.c_void_p,
+    ),
+    "CFStringCreateWithCString": (
+        [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32],
+        ctypes.c_void_p,
+    ),
+}
+
+_IMAGEIO_SIGNATURES = {
+    "CGImageDestinationCreateWithURL": (
+        [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p],
+        ctypes.c_void_p,
+    ),
+    "CGImageDestinationAddImage": ([ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p], None),
+    "CGImageDestinationFinalize": ([ctypes.c_void_p], ctypes.c_bool),
+}
+
+# Bound framework functions, keyed by symbol name
+_BOUND_FUNCTIONS: Dict[str, Callable] = {}
+
+# Cached display layout: (expires_at monotonic time, display IDs,
+# ((display ID, (x, y, width, height)), ...))
+_display_cache: Optional[
+    Tuple[float, Tuple[int, ...], Tuple[Tuple[int, Tuple[float, float, float, float]], ...]]
+] = None
+
+# Monotonic time until which the screen is known to be available
+_screen_available_until = 0.0
+
+# Cached AppleScript frontmost-app lookup: (expires_at monotonic time,
+# (bundle ID, name) or None)
+_frontmost_app_cache: Optional[Tuple[float, Optional[Tuple[str, str]]]] = None
+
+# CGDisplayReconfigurationCallBack prototype:
+# void (*)(CGDirectDisplayID display, CGDisplayChangeSummaryFlags flags, void *userInfo)
+_DISPLAY_RECONFIGURATION_CALLBACK = ctypes.CFUNCTYPE(
+    None, ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p
+)
+
+# Registered reconfiguration callback (kept referenced so it is never collected)
+_reconfiguration_callback = None
 
 
 def load_coregraphics() -> ctypes.CDLL:
     """
-    Load the CoreGraphics framework via ctypes.
+    Get the CoreGraphics framework loaded via ctypes.
 
-    The framework is lazy-loaded and cached for performance.
+    The framework is loaded once when this module is imported.
 
     Returns:
         CDLL object for CoreGraphics framework
@@ -33,52 +180,198 @@ def load_coregraphics() -> ctypes.CDLL:
     Raises:
         RuntimeError: If CoreGraphics framework cannot be found
     """
-    global _CG
-    if _CG is not None:
-        return _CG
-
-    path = ctypes.util.find_library("CoreGraphics")
-    if not path:
+    if _CG is None:
         raise RuntimeError("CoreGraphics framework not found")
-
-    _CG = ctypes.CDLL(path)
     return _CG
 
 
-def get_active_display_count() -> Optional[int]:
+def load_corefoundation() -> ctypes.CDLL:
     """
-    Get the number of active displays using CoreGraphics.
+    Get the CoreFoundation framework loaded via ctypes.
 
-    An active display is one that is powered on and available for rendering.
-    If no displays are active (all displays are off/sleeping), returns 0.
+    The framework is loaded once when this module is imported.
 
     Returns:
-        Number of active displays (0 if all displays off), or None if detection failed
+        CDLL object for CoreFoundation framework
+
+    Raises:
+        RuntimeError: If CoreFoundation framework cannot be found
+    """
+    if _CF is None:
+        raise RuntimeError("CoreFoundation framework not found")
+    return _CF
+
+
+def load_imageio() -> ctypes.CDLL:
+    """
+    Get the ImageIO framework loaded via ctypes.
+
+    The framework is loaded once when this module is imported.
+
+    Returns:
+        CDLL object for ImageIO framework
+
+    Raises:
+        RuntimeError: If ImageIO framework cannot be found
+    """
+    if _IMAGEIO is None:
+        raise RuntimeError("ImageIO framework not found")
+    return _IMAGEIO
+
+
+def _bind(loader: Callable[[], ctypes.CDLL], signatures: dict, name: str) -> Callable:
+    """
+    Return a framework function with argtypes/restype configured.
+
+    Each function is looked up and configured only once; later calls return
+    the cached binding.
+
+    Args:
+        loader: Framework loader (e.g. load_coregraphics)
+        signatures: Mapping of symbol name to (argtypes, restype)
+        name: Symbol name to bind
+
+    Returns:
+        Configured ctypes function
+
+    Raises:
+        RuntimeError: If the framework cannot be found
+    """
+    func = _BOUND_FUNCTIONS.get(name)
+    if func is None:
+        func = getattr(loader(), name)
+        func.argtypes, func.restype = signatures[name]
+        _BOUND_FUNCTIONS[name] = func
+    return func
+
+
+def _cg(name: str) -> Callable:
+    """Return a bound CoreGraphics function."""
+    return _bind(load_coregraphics, _CG_SIGNATURES, name)
+
+
+def _cf(name: str) -> Callable:
+    """Return a bound CoreFoundation function."""
+    return _bind(load_corefoundation, _CF_SIGNATURES, name)
+
+
+def _imageio(name: str) -> Callable:
+    """Return a bound ImageIO function."""
+    return _bind(load_imageio, _IMAGEIO_SIGNATURES, name)
+
+
+def invalidate_display_cache() -> None:
+    """
+    Discard the cached display layout.
+
+    The next display query re-reads the layout from CoreGraphics. Called
+    automatically when displays are reconfigured or a display query fails.
+    """
+    global _display_cache
+    _display_cache = None
+
+
+def _on_display_reconfigured(display_id: int, flags: int, user_info: int) -> None:
+    """CoreGraphics callback: invalidate the layout when any display changes."""
+    invalidate_display_cache()
+
+
+def _register_display_reconfiguration_callback() -> None:
+    """
+    Register for display reconfiguration notifications (once per process).
+
+    Failures are ignored; the cache TTL still bounds staleness.
+    """
+    global _reconfiguration_callback
+    if _reconfiguration_callback is not None:
+        return
+
+    try:
+        register = _cg("CGDisplayRegisterReconfigurationCallback")
+        callback = _DISPLAY_RECONFIGURATION_CALLBACK(_on_display_reconfigured)
+        if register(ctypes.cast(callback, ctypes.c_void_p), None) == 0:
+            _reconfiguration_callback = callback
+    except Exception:
+        pass
+
+
+def _get_display_layout() -> Optional[
+    Tuple[Tuple[int, ...], Tuple[Tuple[int, Tuple[float, float, float, float]], ...]]
+]:
+    """
+    Get the active display IDs and their bounds.
+
+    Display topology changes rarely, so the layout is cached and re-read from
+    CoreGraphics only when displays are reconfigured or the TTL expires.
+
+    Returns:
+        Tuple of (display IDs, ((display ID, (x, y, width, height)), ...)),
+        or None if detection failed
     """
+    global _display_cache
+
+    now = time.monotonic()
+    cached = _display_cache
+    if cached is not None and now < cached[0]:
+        return cached[1], cached[2]
+
+    _register_display_reconfiguration_callback()
+
     try:
-        cg = load_coregraphics()
+        CGGetActiveDisplayList = _cg("CGGetActiveDisplayList")
     except Exception:
         return None
 
-    # Define function signature for CGGetActiveDisplayList
-    CGGetActiveDisplayList = cg.CGGetActiveDisplayList
-    CGGetActiveDisplayList.argtypes = [
-        ctypes.c_uint32,
-        ctypes.POINTER(ctypes.c_uint32),
-        ctypes.POINTER(ctypes.c_uint32),
-    ]
-    CGGetActiveDisplayList.restype = ctypes.c_int32
-
-    # Query active displays
-    max_displays = 16
-    active = (ctypes.c_uint32 * max_displays)()
+    active = (ctypes.c_uint32 * _MAX_DISPLAYS)()
     count = ctypes.c_uint32(0)
-    err = CGGetActiveDisplayList(max_displays, active, ctypes.byref(count))
+    err = CGGetActiveDisplayList(_MAX_DISPLAYS, active, ctypes.byref(count))
 
     if err != 0:
+        invalidate_display_cache()
+        return None
+
+    displays = tuple(active[: count.value])
+    layout = []
+    for display_id in displays:
+        bounds = get_display_bounds(display_id)
+        if bounds is None:
+            return None
+        layout.append((display_id, bounds))
+
+    _display_cache = (now + _DISPLAY_CACHE_TTL, displays, tuple(layout))
+    return displays, _display_cache[2]
+
+
+def get_active_displays() -> Optional[Tuple[int, ...]]:
+    """
+    Get the IDs of all active displays.
+
+    Uses the cached display layout (see _get_display_layout).
+
+    Returns:
+        Tuple of CGDirectDisplayIDs (empty if all displays are off), or None
+        if detection failed
+    """
+    layout = _get_display_layout()
+    if layout is None:
         return None
+    return layout[0]
 
-    return count.value
+
+def get_active_display_count() -> Optional[int]:
+    """
+    Get the number of active displays using CoreGraphics.
+
+    An active display is one that is powered on and available for rendering.
+    If no displays are active (all displays are off/sleeping), returns 0.
+
+    Returns:
+        Number of active displays (0 if all displays off), or None if detection failed
+    """
+    displays = get_active_displays()
+    if displays is None:
+        return None
+    return len(displays)
 
 
 def is_display_active() -> Optional[bool]:
@@ -106,30 +399,23 @@ def get_mouse_location() -> Optional[Tuple[float, float]]:
         Tuple of (x, y) coordinates, or None if detection failed
     """
     try:
-        cg = load_coregraphics()
+        CGEventCreate = _cg("CGEventCreate")
+        CGEventGetLocation = _cg("CGEventGetLocation")
+        CFRelease = _cf("CFRelease")
     except Exception:
         return None
 
-    # Define CGPoint struct
-    class CGPoint(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
-
-    # Define function signatures
-    CGEventCreate = cg.CGEventCreate
-    CGEventCreate.argtypes = [ctypes.c_void_p]
-    CGEventCreate.restype = ctypes.c_void_p
-
-    CGEventGetLocation = cg.CGEventGetLocation
-    CGEventGetLocation.argtypes = [ctypes.c_void_p]
-    CGEventGetLocation.restype = CGPoint
-
     # Get current mouse location
     event_ref = CGEventCreate(None)
     if not event_ref:
         return None
 
-    loc = CGEventGetLocation(event_ref)
-    return (loc.x, loc.y)
+    try:
+        loc = CGEventGetLocation(event_ref)
+        return (loc.x, loc.y)
+    finally:
+        # CGEventCreate returns an owned reference
+        CFRelease(event_ref)
 
 
 def get_display_bounds(display_id: int) -> Optional[Tuple[float, float, float, float]]:
@@ -143,25 +429,10 @@ def get_display_bounds(display_id: int) -> Optional[Tuple[float, float, float, f
         Tuple of (x, y, width, height), or None if detection failed
     """
     try:
-        cg = load_coregraphics()
+        CGDisplayBounds = _cg("CGDisplayBounds")
     except Exception:
         return None
 
-    # Define CoreGraphics structs
-    class CGPoint(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
-
-    class CGSize(ctypes.Structure):
-        _fields_ = [("width", ctypes.c_double), ("height", ctypes.c_double)]
-
-    class CGRect(ctypes.Structure):
-        _fields_ = [("origin", CGPoint), ("size", CGSize)]
-
-    # Define function signature
-    CGDisplayBounds = cg.CGDisplayBounds
-    CGDisplayBounds.argtypes = [ctypes.c_uint32]
-    CGDisplayBounds.restype = CGRect
-
     # Get display bounds
     bounds = CGDisplayBounds(display_id)
     return (
@@ -172,6 +443,39 @@ def get_display_bounds(display_id: int) -> Optional[Tuple[float, float, float, f
     )
 
 
+def _locate_active_display() -> Optional[Tuple[int, int]]:
+    """
+    Find the display that currently contains the mouse cursor.
+
+    Returns:
+        Tuple of (1-based display index, CGDirectDisplayID), or None if
+        detection failed. Falls back to the first display if the mouse is
+        not on any display.
+    """
+    layout = _get_display_layout()
+    if layout is None or not layout[0]:
+        return None
+    displays, bounds_by_display = layout
+
+    # Fast path: with a single display there is nothing to hit-test
+    if len(displays) == 1:
+        return (1, displays[0])
+
+    mouse = get_mouse_location()
+    if mouse is None:
+        return None
+    px, py = mouse
+
+    # Find which display contains the mouse cursor
+    for i, (display_id, (sx, sy, sw, sh)) in enumerate(bounds_by_display):
+        # Check if mouse is within this display's bounds
+        if sx <= px <= sx + sw and sy <= py <= sy + sh:
+            return (i + 1, display_id)  # screencapture -D uses 1-based indexing
+
+    # Fallback: return first display if mouse not found on any display
+    return (1, displays[0])
+
+
 def get_active_display_index() -> Optional[int]:
     """
     Get the 1-based index of the display currently in use.
@@ -184,86 +488,194 @@ def get_active_display_index() -> Optional[int]:
         Returns None if detection failed
         Fallback to 1 (first display) if mouse is not on any display
     """
+    located = _locate_active_display()
+    if located is None:
+        return None
+    return located[0]
+
+
+def get_active_display_id() -> Optional[int]:
+    """
+    Get the CoreGraphics display ID of the display currently in use.
+
+    Uses the same mouse-cursor heuristic as get_active_display_index(), but
+    returns the CGDirectDisplayID expected by CGDisplayCreateImage.
+
+    Returns:
+        CGDirectDisplayID of the active display, or None if detection failed
+    """
+    located = _locate_active_display()
+    if located is None:
+        return None
+    return located[1]
+
+
+def _create_display_image(
+    display_id: int, rect: Optional[Tuple[float, float, float, float]] = None
+) -> Optional[int]:
+    """
+    Create a CGImage of a display, or of a region of it.
+
+    Args:
+        display_id: CoreGraphics display ID
+        rect: Optional (x, y, width, height) region in display-local
+            coordinates (points). Captures the whole display if omitted.
+
+    Returns:
+        Owned CGImageRef (caller must CFRelease), or None if capture failed
+    """
     try:
-        cg = load_coregraphics()
+        if rect is None:
+            image = _cg("CGDisplayCreateImage")(display_id)
+        else:
+            x, y, w, h = rect
+            region = CGRect(CGPoint(x, y), CGSize(w, h))
+            image = _cg("CGDisplayCreateImageForRect")(display_id, region)
     except Exception:
         return None
 
-    # Define CoreGraphics structs
-    class CGPoint(ctypes.Structure):
-        _fields_ = [("x", ctypes.c_double), ("y", ctypes.c_double)]
+    if not image:
+        # Display may have been disconnected; re-read the list next time
+        invalidate_display_cache()
+        return None
+
+    return image
+
+
+def capture_display_to_png(
+    display_id: int,
+    output_path: Union[Path, str],
+    rect: Optional[Tuple[float, float, float, float]] = None,
+) -> bool:
+    """
+    Capture a display in-process and write it as a PNG file.
 
-    class CGSize(ctypes.Structure):
-        _fields_ = [("width", ctypes.c_double), ("height", ctypes.c_double)]
+    Uses CGDisplayCreateImage to grab the display contents and an ImageIO
+    CGImageDestination to encode the PNG, avoiding the fork+exec cost of the
+    screencapture utility.
 
-    class CGRect(ctypes.Structure):
-        _fields_ = [("origin", CGPoint), ("size", CGSize)]
+    Args:
+        display_id: CoreGraphics display ID (see get_active_display_id)
+        output_path: Path where the PNG file should be written
+        rect: Optional (x, y, width, height) region in display-local
+            coordinates to capture via CGDisplayCreateImageForRect, which
+            avoids copying and encoding pixels outside the region
 
-    # Define function signatures
-    CGGetActiveDisplayList = cg.CGGetActiveDisplayList
-    CGGetActiveDisplayList.argtypes = [
-        ctypes.c_uint32,
-        ctypes.POINTER(ctypes.c_uint32),
-        ctypes.POINTER(ctypes.c_uint32),
-    ]
-    CGGetActiveDisplayList.restype = ctypes.c_int32
+    Returns:
+        True if the image was captured and written, False otherwise
+    """
+    try:
+        CFRelease = _cf("CFRelease")
+        CFURLCreateFromFileSystemRepresentation = _cf("CFURLCreateFromFileSystemRepresentation")
+        CFStringCreateWithCString = _cf("CFStringCreateWithCString")
+        CGImageDestinationCreateWithURL = _imageio("CGImageDestinationCreateWithURL")
+        CGImageDestinationAddImage = _imageio("CGImageDestinationAddImage")
+        CGImageDestinationFinalize = _imageio("CGImageDestinationFinalize")
+    except Exception:
+        return False
 
-    CGEventCreate = cg.CGEventCreate
-    CGEventCreate.argtypes = [ctypes.c_void_p]
-    CGEventCreate.restype = ctypes.c_void_p
+    image = _create_display_image(display_id, rect)
+    if not image:
+        return False
 
-    CGEventGetLocation = cg.CGEventGetLocation
-    CGEventGetLocation.argtypes = [ctypes.c_void_p]
-    CGEventGetLocation.restype = CGPoint
+    url = None
+    uti = None
+    dest = None
+    try:
+        path_bytes = os.fsencode(output_path)
+        url = CFURLCreateFromFileSystemRepresentation(None, path_bytes, len(path_bytes), False)
+        uti = CFStringCreateWithCString(None, _UTI_PNG, _K_CF_STRING_ENCODING_UTF8)
+        if not url or not uti:
+            return False
+
+        dest = CGImageDestinationCreateWithURL(url, uti, 1, None)
+        if not dest:
+            return False
+
+        CGImageDestinationAddImage(dest, image, None)
+        return bool(CGImageDestinationFinalize(dest))
+    finally:
+        for ref in (dest, uti, url, image):
+            if ref:
+                CFRelease(ref)
+
+
+def grab_display_raw(
+    display_id: int, rect: Optional[Tuple[float, float, float, float]] = None
+) -> Optional[Tuple[int, int, int, bytes]]:
+    """
+    Capture a display in-process and return its raw pixel data.
 
-    CGDisplayBounds = cg.CGDisplayBounds
-    CGDisplayBounds.argtypes = [ctypes.c_uint32]
-    CGDisplayBounds.restype = CGRect
+    The pixels are copied out of the CGImage backing store without any
+    encoding, so the expensive PNG compression can happen elsewhere (e.g. on
+    a worker thread).
 
-    # Get list of active displays
-    max_displays = 16
-    active = (ctypes.c_uint32 * max_displays)()
-    count = ctypes.c_uint32(0)
-    err = CGGetActiveDisplayList(max_displays, active, ctypes.byref(count))
+    Args:
+        display_id: CoreGraphics display ID (see get_active_display_id)
+        rect: Optional (x, y, width, height) region in display-local
+            coordinates to capture via CGDisplayCreateImageForRect
 
-    if err != 0 or count.value == 0:
+    Returns:
+        Tuple of (width, height, bytes_per_row, pixel_bytes) where pixels are
+        32-bit BGRA (little-endian, premultiplied alpha first), or None if
+        capture failed
+    """
+    try:
+        CGImageGetWidth = _cg("CGImageGetWidth")
+        CGImageGetHeight = _cg("CGImageGetHeight")
+        CGImageGetBytesPerRow = _cg("CGImageGetBytesPerRow")
+        CGImageGetDataProvider = _cg("CGImageGetDataProvider")
+        CGDataProviderCopyData = _cg("CGDataProviderCopyData")
+        CFDataGetLength = _cf("CFDataGetLength")
+        CFDataGetBytePtr = _cf("CFDataGetBytePtr")
+        CFRelease = _cf("CFRelease")
+    except Exception:
         return None
 
-    # Get current mouse location
-    event_ref = CGEventCreate(None)
-    if not event_ref:
+    image = _create_display_image(display_id, rect)
+    if not image:
         return None
 
-    loc = CGEventGetLocation(event_ref)
-    px, py = loc.x, loc.y
+    data = None
+    try:
+        width = CGImageGetWidth(image)
+        height = CGImageGetHeight(image)
+        stride = CGImageGetBytesPerRow(image)
 
-    # Find which display contains the mouse cursor
-    for i in range(count.value):
-        display_id = active[i]
-        bounds = CGDisplayBounds(display_id)
-        sx = bounds.origin.x
-        sy = bounds.origin.y
-        sw = bounds.size.width
-        sh = bounds.size.height
+        provider = CGImageGetDataProvider(image)  # Not owned, do not release
+        if not provider:
+            return None
 
-        # Check if mouse is within this display's bounds
-        if px >= sx and px <= sx + sw and py >= sy and py <= sy + sh:
-            return i + 1  # screencapture -D uses 1-based indexing
+        data = CGDataProviderCopyData(provider)
+        if not data:
+            return None
 
-    # Fallback: return first display if mouse not found on any display
-    return 1
+        length = CFDataGetLength(data)
+        pixels = ctypes.string_at(CFDataGetBytePtr(data), length)
+        return (width, height, stride, pixels)
+    finally:
+        if data:
+            CFRelease(data)
+        CFRelease(image)
 
 
-def is_screensaver_active() -> Optional[bool]:
+def _pump_workspace_events() -> None:
     """
-    Check if the screen saver is currently running.
+    Let AppKit process pending workspace notifications.
+
+    NSWorkspace only refreshes its view of running/frontmost applications
+    when the run loop processes notifications. Background scripts never run
+    the run loop, so spin it once without blocking before each query.
+    """
+    NSRunLoop.currentRunLoop().runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(0))
+
 
-    Uses AppleScript to query System Events for screen saver state.
+def _is_screensaver_active_applescript() -> Optional[bool]:
+    """
+    Check screen saver state via AppleScript (System Events).
 
     Returns:
-        True if screen saver is active
-        False if screen saver is not active
-        None if detection failed
+        True if screensaver is running, False if not, None if detection failed
     """
     try:
         script = 'tell application "System Events" to tell screen saver preferences to get running'
@@ -287,50 +699,154 @@ def is_screensaver_active() -> Optional[bool]:
         return None
 
 
+def is_screensaver_active() -> Optional[bool]:
+    """
+    Check if the screen saver is currently running.
+
+    Looks for the ScreenSaverEngine process via AppKit, which avoids
+    spawning osascript. Falls back to AppleScript if AppKit is unavailable.
+
+    Returns:
+        True if screensaver is running
+        False if screensaver is not running
+        None if detection failed
+    """
+    if APPKIT_AVAILABLE:
+        try:
+            _pump_workspace_events()
+            running = NSRunningApplication.runningApplicationsWithBundleIdentifier_(
+                _SCREENSAVER_BUNDLE_ID
+            )
+            return len(running) > 0
+        except Exception:
+            pass
+
+    return _is_screensaver_active_applescript()
+
+
+def is_screen_locked() -> Optional[bool]:
+    """
+    Check if the login session is locked.
+
+    Reads the CGSSessionScreenIsLocked key from the current CoreGraphics
+    session dictionary (a single in-process lookup).
+
+    Returns:
+        True if the screen is locked
+        False if the screen is unlocked
+        None if detection failed
+    """
+    try:
+        CGSessionCopyCurrentDictionary = _cg("CGSessionCopyCurrentDictionary")
+        CFDictionaryGetValue = _cf("CFDictionaryGetValue")
+        CFStringCreateWithCString = _cf("CFStringCreateWithCString")
+        CFGetTypeID = _cf("CFGetTypeID")
+        CFBooleanGetTypeID = _cf("CFBooleanGetTypeID")
+        CFBooleanGetValue = _cf("CFBooleanGetValue")
+        CFRelease = _cf("CFRelease")
+    except Exception:
+        return None
+
+    session = CGSessionCopyCurrentDictionary()
+    if not session:
+        return None
+
+    key = None
+    try:
+        key = CFStringCreateWithCString(None, _SESSION_LOCKED_KEY, _K_CF_STRING_ENCODING_UTF8)
+        if not key:
+            return None
+
+        # Key is absent when the session has never been locked
+        value = CFDictionaryGetValue(session, key)  # Not owned, do not release
+        if not value:
+            return False
+
+        if CFGetTypeID(value) != CFBooleanGetTypeID():
+            return None
+
+        return bool(CFBooleanGetValue(value))
+    finally:
+        if key:
+            CFRelease(key)
+        CFRelease(session)
+
+
 def is_screen_unavailable() -> bool:
     """
     Check if the screen should NOT be recorded.
 
     The screen is considered unavailable if:
     - Screen saver is active
+    - Screen is locked
     - All displays are off/sleeping
 
     This function is designed to be conservative: if detection fails,
     it assumes the screen IS available (returns False) to avoid
     missing recordings unnecessarily.
 
+    An "available" result is reused for up to 30 seconds, since screen saver
+    and lock transitions are rare; at worst a few frames of the screen saver
+    or lock screen are captured. "Unavailable" results are never cached, so
+    recording resumes on the first cycle after the screen comes back.
+
     Returns:
         True if screen should not be recorded
         False if screen is available for recording
     """
+    global _screen_available_until
+
+    now = time.monotonic()
+    if now < _screen_available_until:
+        return False
+
     # Check screen saver first
     screensaver_active = is_screensaver_active()
     if screensaver_active is True:
         return True
 
+    # Check if the session is locked
+    screen_locked = is_screen_locked()
+    if screen_locked is True:
+        return True
+
     # Check if any displays are active
     display_active = is_display_active()
     if display_active is False:
         return True
 
     # If detection failed or screen is available, return False
+    _screen_available_until = now + _SCREEN_STATE_TTL
     return False
 
 
-def get_frontmost_app_bundle_id() -> Optional[str]:
+def reset_screen_state_cache() -> None:
+    """Force the next is_screen_unavailable() call to re-check the screen."""
+    global _screen_available_until
+    _screen_available_until = 0.0
+
+
+def _get_frontmost_app_info_applescript() -> Optional[Tuple[str, str]]:
     """
-    Get the bundle identifier of the currently focused application.
+    Get the frontmost application's bundle ID and name via AppleScript.
 
-    Uses AppleScript with System Events (requires Accessibility permission).
+    Both values come from a single System Events query, so callers needing
+    either one share one osascript fork. Results are reused for 100 ms.
 
     Returns:
-        Bundle ID string (e.g., "com.apple.Safari")
-        Returns "unknown" if detection failed
-        Returns None if subprocess execution failed
+        (bundle ID, name) tuple, ("unknown", "Unknown") if detection failed,
+        or None if subprocess execution failed
     """
+    global _frontmost_app_cache
+
+    now = time.monotonic()
+    if _frontmost_app_cache is not None and now < _frontmost_app_cache[0]:
+        return _frontmost_app_cache[1]
+
     script = (
-        'tell application "System Events" to get '
-        'bundle identifier of (first process whose frontmost is true)'
+        'tell application "System Events" to tell '
+        '(first process whose frontmost is true) to return '
+        '(bundle identifier) & tab & name'
     )
 
     try:
@@ -341,48 +857,78 @@ def get_frontmost_app_bundle_id() -> Optional[str]:
             check=True,
             timeout=5,
         )
-        bundle_id = result.stdout.strip()
-        return bundle_id if bundle_id else "unknown"
+        bundle_id, _, app_name = result.stdout.strip("\n").partition("\t")
+        info = (bundle_id.strip() or "unknown", app_name.strip() or "Unknown")
     except subprocess.TimeoutExpired:
-        return "unknown"
+        info = ("unknown", "Unknown")
     except subprocess.CalledProcessError:
-        return "unknown"
+        info = ("unknown", "Unknown")
     except Exception:
-        return None
+        info = None
+
+    _frontmost_app_cache = (now + _FRONTMOST_APP_TTL, info)
+    return info
+
+
+def get_frontmost_app_info() -> Optional[Tuple[str, str]]:
+    """
+    Get the bundle identifier and localized name of the focused application.
+
+    Queries NSWorkspace in-process via AppKit. Falls back to a single
+    AppleScript call with System Events (requires Accessibility permission)
+    if AppKit is unavailable.
+
+    Returns:
+        (bundle ID, name) tuple (e.g., ("com.apple.Safari", "Safari")),
+        with "unknown"/"Unknown" for values that could not be detected
+        Returns None if subprocess execution failed
+    """
+    if APPKIT_AVAILABLE:
+        try:
+            _pump_workspace_events()
+            app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            if app is None:
+                return ("unknown", "Unknown")
+            bundle_id = app.bundleIdentifier()
+            app_name = app.localizedName()
+            return (
+                str(bundle_id) if bundle_id else "unknown",
+                str(app_name) if app_name else "Unknown",
+            )
+        except Exception:
+            pass
+
+    return _get_frontmost_app_info_applescript()
+
+
+def get_frontmost_app_bundle_id() -> Optional[str]:
+    """
+    Get the bundle identifier of the currently focused application.
+
+    See get_frontmost_app_info().
+
+    Returns:
+        Bundle ID string (e.g., "com.apple.Safari")
+        Returns "unknown" if detection failed
+        Returns None if subprocess execution failed
+    """
+    info = get_frontmost_app_info()
+    return info[0] if info is not None else None
 
 
 def get_frontmost_app_name() -> Optional[str]:
     """
     Get the localized name of the currently focused application.
 
-    Uses AppleScript with System Events (requires Accessibility permission).
+    See get_frontmost_app_info().
 
     Returns:
         Application name string (e.g., "Safari")
         Returns "Unknown" if detection failed
         Returns None if subprocess execution failed
     """
-    script = (
-        'tell application "System Events" to get '
-        'name of (first process whose frontmost is true)'
-    )
-
-    try:
-        result = subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=5,
-        )
-        app_name = result.stdout.strip()
-        return app_name if app_name else "Unknown"
-    except subprocess.TimeoutExpired:
-        return "Unknown"
-    except subprocess.CalledProcessError:
-        return "Unknown"
-    except Exception:
-        return None
+    info = get_frontmost_app_info()
+    return info[1] if info is not None else None
 
 
 def is_user_idle(threshold_seconds: int = 300) -> Optional[bool]:
@@ -400,15 +946,10 @@ def is_user_idle(threshold_seconds: int = 300) -> Optional[bool]:
         None if detection failed
     """
     try:
-        cg = load_coregraphics()
+        CGEventSourceSecondsSinceLastEventType = _cg("CGEventSourceSecondsSinceLastEventType")
     except Exception:
         return None
 
-    # Define function signature
-    CGEventSourceSecondsSinceLastEventType = cg.CGEventSourceSecondsSinceLastEventType
-    CGEventSourceSecondsSinceLastEventType.argtypes = [ctypes.c_int32, ctypes.c_uint32]
-    CGEventSourceSecondsSinceLastEventType.restype = ctypes.c_double
-
     # Query idle time
     # kCGEventSourceStateHIDSystemState = 1
     # kCGAnyInputEventType = ~0
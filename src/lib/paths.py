@@ -18,16 +18,39 @@ Production mode:
 All paths are Path objects from pathlib for consistent cross-platform handling.
 """
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional, Union
 
 
+# Home directory, resolved on first production path lookup
+_HOME: Optional[Path] = None
+
+
+def _home() -> Path:
+    """
+    Return the user's home directory, resolving it only once.
+
+    Resolution is deferred to the first call so importing this module never
+    fails in an environment without a home directory.
+
+    Returns:
+        Path to the home directory.
+    """
+    global _HOME
+    if _HOME is None:
+        _HOME = Path.home()
+    return _HOME
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_project_root() -> Path:
     """
     Detect the project root directory by walking up from this file's location.
 
-    The project root is identified by the presence of src/ directory.
+    The project root is identified by the presence of src/ directory. The
+    result is cached for the life of the process.
 
     Returns:
         Path to the project root directory.
@@ -48,6 +71,58 @@ def _detect_project_root() -> Path:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _dev_path(*parts: str) -> Path:
+    """
+    Build a development path under the project root, once per set of parts.
+
+    Args:
+        *parts: Path components relative to the project root
+
+    Returns:
+        Path under the project root.
+    """
+    return _detect_project_root().joinpath(*parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _production_path(*parts: str) -> Path:
+    """
+    Build a production path under the home directory, once per set of parts.
+
+    Args:
+        *parts: Path components relative to the home directory
+
+    Returns:
+        Path under the home directory.
+    """
+    return _home().joinpath(*parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _data_path(base: Path, name: str) -> Path:
+    """
+    Build a path directly under the base data directory, once per base.
+
+    The base directory is part of the key, so development and production
+    trees are cached separately.
+
+    Args:
+        base: Base data directory
+        name: File or directory name under the base
+
+    Returns:
+        Path under the base data directory.
+    """
+    return base / name
+
+
+def _clear_project_root_cache() -> None:
+    """Forget the cached project root so the next lookup walks the tree again."""
+    _detect_project_root.cache_clear()
+    _dev_path.cache_clear()
+
+
 def is_development_mode() -> bool:
     """
     Check if running in development mode.
@@ -72,10 +147,9 @@ def get_base_data_directory() -> Path:
         Path to the base data directory.
     """
     if is_development_mode():
-        return _detect_project_root() / "dev_data"
+        return _dev_path("dev_data")
     else:
-        home = Path.home()
-        return home / "Library" / "Application Support" / "Playback" / "data"
+        return _production_path("Library", "Application Support", "Playback", "data")
 
 
 def get_temp_directory() -> Path:
@@ -88,7 +162,7 @@ def get_temp_directory() -> Path:
     Returns:
         Path to the temp directory.
     """
-    return get_base_data_directory() / "temp"
+    return _data_path(get_base_data_directory(), "temp")
 
 
 def get_chunks_directory() -> Path:
@@ -101,7 +175,7 @@ def get_chunks_directory() -> Path:
     Returns:
         Path to the chunks directory.
     """
-    return get_base_data_directory() / "chunks"
+    return _data_path(get_base_data_directory(), "chunks")
 
 
 def get_database_path() -> Path:
@@ -114,7 +188,7 @@ def get_database_path() -> Path:
     Returns:
         Path to the meta.sqlite3 database file.
     """
-    return get_base_data_directory() / "meta.sqlite3"
+    return _data_path(get_base_data_directory(), "meta.sqlite3")
 
 
 def get_config_path() -> Path:
@@ -128,10 +202,9 @@ def get_config_path() -> Path:
         Path to the config.json file.
     """
     if is_development_mode():
-        return _detect_project_root() / "dev_config.json"
+        return _dev_path("dev_config.json")
     else:
-        home = Path.home()
-        return home / "Library" / "Application Support" / "Playback" / "config.json"
+        return _production_path("Library", "Application Support", "Playback", "config.json")
 
 
 def get_logs_directory() -> Path:
@@ -145,10 +218,9 @@ def get_logs_directory() -> Path:
         Path to the logs directory.
     """
     if is_development_mode():
-        return _detect_project_root() / "dev_logs"
+        return _dev_path("dev_logs")
     else:
-        home = Path.home()
-        return home / "Library" / "Logs" / "Playback"
+        return _production_path("Library", "Logs", "Playback")
 
 
 def get_timeline_open_signal_path() -> Path:
@@ -164,7 +236,20 @@ def get_timeline_open_signal_path() -> Path:
     Returns:
         Path to the .timeline_open signal file.
     """
-    return get_base_data_directory() / ".timeline_open"
+    return _data_path(get_base_data_directory(), ".timeline_open")
+
+
+def is_timeline_open() -> bool:
+    """
+    Check whether the timeline viewer's signal file exists.
+
+    Polled by the recording service on every capture tick, so it checks the
+    path with os.path.exists() rather than Path.exists().
+
+    Returns:
+        True if the timeline open signal file exists, False otherwise.
+    """
+    return os.path.exists(get_timeline_open_signal_path())
 
 
 def ensure_directory_exists(path: Path, mode: int = 0o755) -> None:
@@ -210,7 +295,9 @@ def ensure_data_directories() -> None:
     ensure_directory_exists(get_logs_directory(), mode=0o755)
 
 
-def create_secure_file(path: Union[Path, str], content: bytes) -> None:
+def create_secure_file(
+    path: Union[Path, str], content: Union[bytes, bytearray, memoryview]
+) -> None:
     """
     Create a file with secure permissions (0o600 = rw-------).
 
@@ -219,42 +306,46 @@ def create_secure_file(path: Union[Path, str], content: bytes) -> None:
     on the system from accessing recorded screen data.
 
     Implementation:
-        1. Set restrictive umask (0o077) to prevent default permissions
+        1. Open with O_CREAT and mode 0o600, so the file never exists with
+           broader permissions (no process-wide umask change, which would
+           race with other threads creating files)
         2. Write file content
-        3. Explicitly chmod to 0o600 for defense-in-depth
-        4. Restore original umask
+        3. Explicitly fchmod to 0o600 for defense-in-depth (covers an
+           existing file being overwritten and a stricter umask)
 
     Args:
         path: Path to the file to create (Path or str)
-        content: Binary content to write to the file
+        content: Binary content to write to the file; any bytes-like object
+            (bytes, bytearray, memoryview, mmap) is written without copying
 
     Raises:
         OSError: If file creation or permission setting fails
-        TypeError: If content is not bytes
+        TypeError: If content is not a bytes-like object
 
     Example:
         create_secure_file(Path("/path/to/screenshot.png"), screenshot_data)
         create_secure_file("/path/to/video.mp4", video_data)
     """
-    if not isinstance(content, bytes):
-        raise TypeError(f"content must be bytes, got {type(content).__name__}")
-
-    # Convert to Path for consistent handling
-    file_path = Path(path) if isinstance(path, str) else path
-
-    # Set restrictive umask to prevent readable/writable by group/other
-    old_umask = os.umask(0o077)
-
     try:
-        # Write file content
-        with open(file_path, 'wb') as f:
-            f.write(content)
-
+        view = memoryview(content).cast("B")
+    except TypeError:
+        raise TypeError(
+            f"content must be bytes-like, got {type(content).__name__}"
+        ) from None
+
+    # os.open accepts str and Path alike, so no Path is built here
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
         # Explicitly set permissions for defense-in-depth
-        os.chmod(file_path, 0o600)
+        os.fchmod(fd, 0o600)
+
+        # Unbuffered write straight from the caller's buffer, retrying on
+        # short writes
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
     finally:
-        # Always restore original umask
-        os.umask(old_umask)
+        os.close(fd)
 
 
 def get_day_directory(date_str: str, subdirectory: str) -> Path:
@@ -272,36 +363,76 @@ def get_day_directory(date_str: str, subdirectory: str) -> Path:
         Path to the day directory (e.g., chunks/202512/22/).
 
     Raises:
-        ValueError: If date_str is not 8 characters or subdirectory is invalid.
+        ValueError: If date_str is not 8 ASCII digits or subdirectory is invalid.
+    """
+    return _day_directory(get_base_data_directory(), subdirectory, date_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _day_directory(base: Path, subdirectory: str, date_str: str) -> Path:
+    """
+    Validate and build base/subdirectory/YYYYMM/DD, once per distinct input.
+
+    The base directory is part of the key, so switching between development
+    and production trees never returns a stale path. Invalid input raises
+    and is never cached, so it is rejected on every call.
+
+    Args:
+        base: Base data directory.
+        subdirectory: Either "temp" or "chunks".
+        date_str: Date string in YYYYMMDD format.
+
+    Returns:
+        Path to the day directory.
+
+    Raises:
+        ValueError: If date_str is not 8 ASCII digits or subdirectory is invalid.
     """
-    if len(date_str) != 8:
+    if not (len(date_str) == 8 and date_str.isascii() and date_str.isdigit()):
         raise ValueError(f"date_str must be YYYYMMDD format, got: {date_str}")
 
     if subdirectory not in ("temp", "chunks"):
         raise ValueError(f"subdirectory must be 'temp' or 'chunks', got: {subdirectory}")
 
-    year_month = date_str[:6]  # YYYYMM
-    day = date_str[6:]  # DD
+    return base.joinpath(subdirectory, date_str[:6], date_str[6:])
+
+
+# Constants for backward compatibility with existing scripts, resolved on
+# first access (PEP 562) so importing this module does no filesystem work
+_LAZY_CONSTANTS = {
+    "PROJECT_ROOT": _detect_project_root,
+    "TEMP_ROOT": get_temp_directory,
+    "CHUNKS_ROOT": get_chunks_directory,
+    "META_DB_PATH": get_database_path,
+}
 
-    base = get_base_data_directory()
-    return base / subdirectory / year_month / day
 
+def __getattr__(name: str) -> Optional[Path]:
+    """
+    Resolve a backward-compatibility path constant on first access.
+
+    Constants that cannot be determined (no project root found) are None;
+    the getter functions still work in production mode.
 
-# Constants for backward compatibility with existing scripts
-PROJECT_ROOT: Optional[Path] = None
-TEMP_ROOT: Optional[Path] = None
-CHUNKS_ROOT: Optional[Path] = None
-META_DB_PATH: Optional[Path] = None
+    Args:
+        name: Attribute name being looked up.
+
+    Returns:
+        Resolved path, or None if it cannot be determined.
 
-try:
-    PROJECT_ROOT = _detect_project_root()
-    TEMP_ROOT = get_temp_directory()
-    CHUNKS_ROOT = get_chunks_directory()
-    META_DB_PATH = get_database_path()
-except RuntimeError:
-    # If we can't detect project root, constants remain None
-    # Functions will still work in production mode
-    pass
+    Raises:
+        AttributeError: If name is not a lazily resolved constant.
+    """
+    resolve = _LAZY_CONSTANTS.get(name)
+    if resolve is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value: Optional[Path] = resolve()
+    except RuntimeError:
+        value = None
+    globals()[name] = value
+    return value
 
 
 __all__ = [
@@ -313,6 +444,7 @@ __all__ = [
     "get_config_path",
     "get_logs_directory",
     "get_timeline_open_signal_path",
+    "is_timeline_open",
     "ensure_directory_exists",
     "ensure_data_directories",
     "get_day_directory",
@@ -207,6 +207,15 @@ class TestExcludedAppsValidation:
             "com.another.valid"
         ]
 
+    def test_non_ascii_bundle_ids_filtered_out(self):
+        """Bundle IDs are restricted to ASCII letters, digits, dots and hyphens."""
+        config = Config({"excluded_apps": [
+            "com.valid.app",
+            "com.café.app",
+            "com.app\u00b2"
+        ]})
+        assert config.excluded_apps == ["com.valid.app"]
+
     def test_non_list_excluded_apps_behavior(self):
         """Non-list excluded_apps should be handled gracefully."""
         # Valid string bundle ID should be converted to single-item list
@@ -8,8 +8,11 @@ maintenance functions, security features, and backup functionality.
 import os
 import sqlite3
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 # Import the module under test
 import lib.database as database
 
@@ -81,6 +84,24 @@ class TestDatabaseInitialization:
                 mode = cursor.fetchone()[0]
                 assert mode.lower() == "wal"
 
+    def test_connection_pragma_profile(self):
+        """Test that connections apply the standard PRAGMA profile."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection() as conn:
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+                assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+                assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+                assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+                assert conn.execute("PRAGMA journal_size_limit").fetchone()[0] == 67108864
+
+            with db._get_connection(read_only=True) as conn:
+                assert conn.execute("PRAGMA cache_size").fetchone()[0] == -64000
+                assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+                assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+
     def test_secure_delete_pragma_enabled(self):
         """Test that secure_delete pragma is enabled."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -110,19 +131,23 @@ class TestDatabaseInitialization:
                 indexes = {row[0] for row in cursor.fetchall()}
 
                 # Segments indexes
-                assert "idx_segments_date" in indexes
-                assert "idx_segments_start_ts" in indexes
+                assert "idx_segments_date_start" in indexes
+                assert "idx_segments_date" not in indexes
+                assert "idx_segments_start_end" in indexes
                 assert "idx_segments_end_ts" in indexes
+                assert "idx_segments_start_ts" not in indexes
 
                 # AppSegments indexes
-                assert "idx_appsegments_date" in indexes
-                assert "idx_appsegments_app_id" in indexes
+                assert "idx_appsegments_date_start" in indexes
+                assert "idx_appsegments_app_start" in indexes
+                assert "idx_appsegments_app_id" not in indexes
                 assert "idx_appsegments_start_ts" in indexes
                 assert "idx_appsegments_end_ts" in indexes
 
                 # OCR indexes
                 assert "idx_ocr_timestamp" in indexes
-                assert "idx_ocr_segment" in indexes
+                assert "idx_ocr_segment_ts" in indexes
+                assert "idx_ocr_segment" not in indexes
 
 
 class TestSecurityAndPermissions:
@@ -140,6 +165,19 @@ class TestSecurityAndPermissions:
             mode = stat_info.st_mode & 0o777
             assert mode == 0o600
 
+    def test_existing_database_secured_on_first_write_connection(self):
+        """Test that a loosely permissioned database is fixed by the first writer."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            database.DatabaseManager(db_path).initialize()
+            os.chmod(db_path, 0o644)
+
+            db = database.DatabaseManager(db_path)
+            assert os.stat(db_path).st_mode & 0o777 == 0o644
+
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "a.mp4")
+            assert os.stat(db_path).st_mode & 0o777 == 0o600
+
     def test_read_only_connection_mode(self):
         """Test that read-only connections work correctly."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -259,6 +297,41 @@ class TestSegmentOperations:
             assert seg.file_size_bytes == 2048
             assert seg.video_path == "chunks/202502/07/video.mp4"
 
+    def test_insert_segments_bulk(self):
+        """Test inserting multiple segments in one transaction."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            records = [
+                (f"seg{i}", "2025-02-07", 1707300000.0 + i * 10, 1707300010.0 + i * 10,
+                 10, 1.0, 1920, 1080, 1024, f"test{i}.mp4")
+                for i in range(5)
+            ]
+            assert db.insert_segments_bulk(records) == 5
+
+            segments = db.get_all_segments()
+            assert [seg.id for seg in segments] == [f"seg{i}" for i in range(5)]
+            assert segments[0].width == 1920
+
+    def test_insert_segments_bulk_rolls_back_on_error(self):
+        """Test that a failing row leaves no partially inserted batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            records = [
+                ("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, None, None, 1024, "a.mp4"),
+                ("seg2", None, 1707300010.0, 1707300020.0, 10, 1.0, None, None, 1024, "b.mp4"),
+            ]
+            try:
+                db.insert_segments_bulk(records)
+                assert False, "Expected IntegrityError for NULL date"
+            except sqlite3.IntegrityError:
+                pass
+
+            assert db.get_all_segments() == []
+
     def test_segment_exists_check(self):
         """Test segment_exists() returns correct status."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -294,6 +367,82 @@ class TestSegmentOperations:
             assert segments[1].id == "seg2"
             assert segments[2].id == "seg3"
 
+    def test_get_all_segments_cache_tracks_changes(self):
+        """Test that cached get_all_segments results follow inserts, replaces and deletes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+
+            db.insert_segment("seg2", "2025-02-07", 1707300010.0, 1707300020.0, 10, 1.0, 1024, "test2.mp4")
+            assert [s.id for s in db.get_all_segments()] == ["seg2"]
+
+            # New rows are merged in start_ts order
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test1.mp4")
+            assert [s.id for s in db.get_all_segments()] == ["seg1", "seg2"]
+
+            # Replacing a row must not leave a stale copy behind
+            db.insert_segment("seg1", "2025-02-07", 1707300030.0, 1707300040.0, 10, 1.0, 1024, "test1.mp4")
+            assert [s.id for s in db.get_all_segments()] == ["seg2", "seg1"]
+
+            # Changes made by another connection are detected too
+            other = sqlite3.connect(str(db_path))
+            other.execute("DELETE FROM segments WHERE id = 'seg2'")
+            other.commit()
+            other.close()
+            assert [s.id for s in db.get_all_segments()] == ["seg1"]
+
+            # Deleting the max-rowid row elsewhere lets SQLite reuse its rowid
+            db.insert_segment("seg3", "2025-02-07", 1707300050.0, 1707300060.0, 10, 1.0, 1024, "test3.mp4")
+            assert [s.id for s in db.get_all_segments()] == ["seg1", "seg3"]
+            other = sqlite3.connect(str(db_path))
+            (seg3_rowid,) = other.execute(
+                "SELECT rowid FROM segments WHERE id = 'seg3'"
+            ).fetchone()
+            other.execute("DELETE FROM segments WHERE id = 'seg3'")
+            other.execute(
+                "INSERT INTO segments (id, date, start_ts, end_ts, frame_count, fps, "
+                "file_size_bytes, video_path) VALUES ('seg4', '2025-02-07', "
+                "1707300070.0, 1707300080.0, 10, 1.0, 1024, 'test4.mp4')"
+            )
+            assert other.execute(
+                "SELECT rowid FROM segments WHERE id = 'seg4'"
+            ).fetchone()[0] == seg3_rowid
+            other.commit()
+            assert [s.id for s in db.get_all_segments()] == ["seg1", "seg4"]
+
+            # External updates are picked up as well
+            other.execute("UPDATE segments SET video_path = 'moved.mp4' WHERE id = 'seg4'")
+            other.commit()
+            other.close()
+            assert db.get_all_segments()[-1].video_path == "moved.mp4"
+
+            db.delete_segment("seg1")
+            db.delete_segment("seg4")
+            assert db.get_all_segments() == []
+
+            # Callers get their own list
+            db.get_all_segments().append("junk")
+            assert db.get_all_segments() == []
+
+    def test_get_all_segments_merges_own_inserts(self, monkeypatch):
+        """Test that the manager's own inserts refresh the cache without a full reload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test1.mp4")
+            db.get_all_segments()
+
+            reloads = []
+            original = db._reload_segments_cache
+            monkeypatch.setattr(
+                db, "_reload_segments_cache", lambda cursor: reloads.append(1) or original(cursor)
+            )
+            db.insert_segment("seg2", "2025-02-07", 1707300010.0, 1707300020.0, 10, 1.0, 1024, "test2.mp4")
+
+            assert [s.id for s in db.get_all_segments()] == ["seg1", "seg2"]
+            assert reloads == []
+
     def test_get_segments_by_date_filtering(self):
         """Test filtering segments by specific date."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -318,11 +467,10 @@ class TestSegmentOperations:
             db = database.DatabaseManager(Path(tmpdir) / "test.db")
             db.initialize()
 
-            # Insert segments across multiple days
-            db.insert_segment("seg1", "2025-02-05", 1707100000.0, 1707100010.0, 10, 1.0, 1024, "test1.mp4")
-            db.insert_segment("seg2", "2025-02-06", 1707200000.0, 1707200010.0, 10, 1.0, 1024, "test2.mp4")
-            db.insert_segment("seg3", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test3.mp4")
-            db.insert_segment("seg4", "2025-02-08", 1707400000.0, 1707400010.0, 10, 1.0, 1024, "test4.mp4")
+            # Insert segments across multiple days, at local noon of their date
+            for index, day in enumerate(["2025-02-05", "2025-02-06", "2025-02-07", "2025-02-08"], start=1):
+                start_ts = datetime.strptime(day, "%Y-%m-%d").replace(hour=12).timestamp()
+                db.insert_segment(f"seg{index}", day, start_ts, start_ts + 10, 10, 1.0, 1024, f"test{index}.mp4")
 
             # Get range from Feb 6-7 (inclusive)
             segments = db.get_segments_by_date_range("2025-02-06", "2025-02-07")
@@ -330,6 +478,11 @@ class TestSegmentOperations:
             assert segments[0].id == "seg2"
             assert segments[1].id == "seg3"
 
+            # The streaming variant yields the same records lazily
+            iterator = db.iter_segments_by_date_range("2025-02-06", "2025-02-07")
+            assert next(iterator).id == "seg2"
+            assert [seg.id for seg in iterator] == ["seg3"]
+
     def test_find_segment_at_timestamp(self):
         """Test finding segment containing specific timestamp."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -404,6 +557,40 @@ class TestSegmentOperations:
             seg = db.find_nearest_segment_backward(1707299990.0)
             assert seg is None
 
+    def test_nearest_segment_lookups_avoid_table_scans(self):
+        """Test that nearest-segment lookups seek an index instead of scanning."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            queries = [
+                database._SQL_FIND_AT,
+                database._SQL_FIND_BACKWARD,
+                database._SQL_FIND_FORWARD,
+            ]
+            with db._get_connection(read_only=True) as conn:
+                for query in queries:
+                    params = (0.0,) * query.count("?")
+                    plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+                    details = " ".join(row[3] for row in plan)
+                    assert "COVERING INDEX" in details
+                    assert "SCAN" not in details
+
+    def test_segments_by_date_read_in_index_order(self):
+        """Test that a single-day lookup needs no separate sort step."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection(read_only=True) as conn:
+                plan = conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM segments "
+                    "WHERE date = ? ORDER BY start_ts ASC",
+                    ("2025-02-07",),
+                ).fetchall()
+                details = " ".join(row[3] for row in plan)
+                assert "idx_segments_date_start" in details
+                assert "TEMP B-TREE" not in details
 
 class TestAppSegmentOperations:
     """Test appsegment insertion and query operations."""
@@ -432,6 +619,21 @@ class TestAppSegmentOperations:
             assert app_seg.start_ts == 1707300000.0
             assert app_seg.end_ts == 1707300010.0
 
+    def test_insert_appsegments_bulk(self):
+        """Test inserting multiple appsegments in one transaction."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            count = db.insert_appsegments_bulk(
+                (f"app{i}", f"com.app{i}", "2025-02-07", 1707300000.0 + i, 1707300001.0 + i)
+                for i in range(3)
+            )
+            assert count == 3
+
+            appsegments = db.get_all_appsegments()
+            assert [a.app_id for a in appsegments] == ["com.app0", "com.app1", "com.app2"]
+
     def test_get_all_appsegments_ordering(self):
         """Test that get_all_appsegments returns segments in chronological order."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -621,6 +823,106 @@ class TestOCROperations:
             records = db.get_ocr_by_segment("seg2")
             assert len(records) == 1
 
+    def test_insert_ocr_batch_in_chunks(self, monkeypatch):
+        """Test that a generator spanning several chunks is inserted in full."""
+        monkeypatch.setattr(database, "OCR_BATCH_CHUNK_SIZE", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            records = (
+                (f"/path/{i}.png", 1707300000.0 + i, f"text{i}", 0.9, "seg1", "en")
+                for i in range(5)
+            )
+            assert db.insert_ocr_batch(records) == 5
+            assert len(db.get_ocr_by_segment("seg1")) == 5
+            assert db.insert_ocr_batch(iter([])) == 0
+
+    def test_search_ocr_text_plan(self):
+        """Test that search is driven by the FTS index without a separate sort."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection(read_only=True) as conn:
+                plan = conn.execute(
+                    f"EXPLAIN QUERY PLAN {database._SQL_SEARCH_OCR}", ("meeting", 0.0, 10)
+                ).fetchall()
+                details = [row[3] for row in plan]
+                assert details[0].startswith("SCAN s VIRTUAL TABLE")
+                assert "USING INTEGER PRIMARY KEY" in details[1]
+                assert not any("TEMP B-TREE" in detail for detail in details)
+
+    def test_search_index_follows_ocr_text(self):
+        """Test that batch inserts are searchable and deletes leave no stale hits."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            db.insert_ocr_batch([
+                ("/path/1.png", 1707300000.0, "quarterly meeting", 0.95, "seg1", "en"),
+                ("/path/2.png", 1707300010.0, "meeting follow-up", 0.90, "seg2", "en"),
+            ])
+            assert len(db.search_ocr_text("meeting")) == 2
+
+            db.delete_ocr_by_segment("seg1")
+            results = db.search_ocr_text("meeting")
+            assert [r[3] for r in results] == ["seg2"]
+            assert db.search_ocr_text("quarterly") == []
+
+            with db._get_connection() as conn:
+                conn.execute("INSERT INTO ocr_search (ocr_search) VALUES ('integrity-check')")
+
+    def test_migration_rebuilds_search_index(self):
+        """Test that a 1.4 database gets an external-content search index."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+            db.insert_ocr_text("/path/1.png", 1707300000.0, "legacy notes", 0.95, "seg1", "en")
+            db.close()
+
+            # Recreate the 1.4 layout: a standalone FTS table filled by hand
+            conn = sqlite3.connect(str(db_path))
+            conn.executescript("""
+                DROP TRIGGER ocr_text_search_insert;
+                DROP TRIGGER ocr_text_search_delete;
+                DROP TRIGGER ocr_text_search_update;
+                DROP TABLE ocr_search;
+                CREATE VIRTUAL TABLE ocr_search USING fts5(
+                    text_content, segment_id UNINDEXED, timestamp UNINDEXED,
+                    tokenize = 'porter unicode61'
+                );
+                INSERT INTO ocr_search (rowid, text_content, segment_id, timestamp)
+                    SELECT id, text_content, segment_id, timestamp FROM ocr_text;
+                UPDATE schema_version SET version = '1.4';
+            """)
+            conn.close()
+
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+
+            assert db.get_schema_version() == database.SCHEMA_VERSION
+            assert [r[1] for r in db.search_ocr_text("legacy")] == ["legacy notes"]
+            db.insert_ocr_text("/path/2.png", 1707300010.0, "fresh notes", 0.95, "seg1", "en")
+            assert len(db.search_ocr_text("notes")) == 2
+
+    def test_delete_ocr_by_segments(self):
+        """Test deleting OCR records for several segments at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            db.insert_ocr_text("/path/1.png", 1707300000.0, "text1", 0.95, "seg1", "en")
+            db.insert_ocr_text("/path/2.png", 1707300010.0, "text2", 0.90, "seg2", "en")
+            db.insert_ocr_text("/path/3.png", 1707300020.0, "text3", 0.92, "seg2", "en")
+            db.insert_ocr_text("/path/4.png", 1707300030.0, "text4", 0.92, "seg3", "en")
+
+            assert db.delete_ocr_by_segments(["seg1", "seg2", "missing"]) == 3
+            assert db.get_ocr_by_segment("seg1") == []
+            assert db.get_ocr_by_segment("seg2") == []
+            assert len(db.get_ocr_by_segment("seg3")) == 1
+
     def test_search_ocr_empty_query(self):
         """Test searching with empty query returns no results."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -675,6 +977,65 @@ class TestMaintenanceOperations:
             assert stats["schema_version"] == database.SCHEMA_VERSION
             assert "database_size_bytes" in stats
 
+    def test_database_stats_track_ocr_rows(self):
+        """Test that OCR totals follow inserts, updates and deletes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            stats = db.get_database_stats()
+            assert stats["ocr_count"] == 0
+            assert stats["avg_confidence"] is None
+            assert stats["total_text_chars"] == 0
+
+            db.insert_ocr_text("/path/1.png", 1707300000.0, "hello", 0.5, "seg1", "en")
+            db.insert_ocr_text("/path/2.png", 1707300010.0, "world!", 1.0, "seg2", "en")
+            with db._get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO ocr_text (frame_path, segment_id, timestamp, text_content) "
+                    "VALUES ('/path/3.png', 'seg2', 1707300020.0, 'abc')"
+                )
+                conn.execute("UPDATE ocr_text SET text_content = 'hi' WHERE frame_path = '/path/1.png'")
+            db.delete_ocr_by_segment("seg2")
+            db.insert_ocr_text("/path/4.png", 1707300030.0, "four", 0.75, "seg3", "en")
+
+            stats = db.get_database_stats()
+            with db._get_connection(read_only=True) as conn:
+                expected = conn.execute(
+                    "SELECT COUNT(*), AVG(confidence), SUM(LENGTH(text_content)) FROM ocr_text"
+                ).fetchone()
+            assert (stats["ocr_count"], stats["avg_confidence"], stats["total_text_chars"]) == expected
+            assert expected == (2, 0.625, 6)
+
+    def test_database_stats_track_replace_and_delete(self):
+        """Test that trigger-maintained totals match the table contents."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test1.mp4")
+            db.insert_segment("seg2", "2025-02-07", 1707300010.0, 1707300020.0, 5, 1.0, 2048, "test2.mp4")
+            # Replacing a row must not double count it
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 20, 1.0, 4096, "test1.mp4")
+            db.delete_segment("seg2")
+
+            db.insert_appsegment("app1", "2025-02-07", 1707300000.0, 1707300010.0, "com.app1")
+            db.insert_appsegment("app2", "2025-02-07", 1707300010.0, 1707300020.0, "com.app1")
+            db.insert_appsegment("app3", "2025-02-07", 1707300020.0, 1707300030.0, None)
+            # Re-assign app2 to a different app through INSERT OR REPLACE
+            db.insert_appsegment("app2", "2025-02-07", 1707300010.0, 1707300020.0, "com.app2")
+            db.delete_appsegment("app1")
+
+            stats = db.get_database_stats()
+
+            assert stats["segment_count"] == 1
+            assert stats["total_video_bytes"] == 4096
+            assert stats["total_frames"] == 20
+            assert stats["earliest_ts"] == 1707300000.0
+            assert stats["latest_ts"] == 1707300010.0
+            assert stats["appsegment_count"] == 2
+            assert stats["unique_app_count"] == 1
+
     def test_get_latest_timestamp(self):
         """Test getting latest timestamp from segments."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -727,6 +1088,56 @@ class TestMaintenanceOperations:
             assert len(segments) == 1
             assert segments[0].id == "seg2"
 
+    def test_delete_segments(self):
+        """Test deleting several segments in one call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            for i in range(3):
+                db.insert_segment(f"seg{i}", "2025-02-07", 1707300000.0 + i * 10, 1707300010.0 + i * 10, 10, 1.0, 1024, f"test{i}.mp4")
+
+            assert db.delete_segments(["seg0", "seg2", "missing"]) == 2
+            assert [seg.id for seg in db.get_all_segments()] == ["seg1"]
+
+    def test_delete_segments_before(self):
+        """Test deleting all segments before a cutoff and returning their paths."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            db.insert_segment("old1", "2025-02-05", 1707100000.0, 1707100010.0, 10, 1.0, 1024, "old1.mp4")
+            db.insert_segment("old2", "2025-02-06", 1707200000.0, 1707200010.0, 10, 1.0, 1024, "old2.mp4")
+            db.insert_segment("new", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "new.mp4")
+
+            deleted = db.delete_segments_before(1707250000.0)
+
+            assert sorted(deleted) == [("old1", "old1.mp4"), ("old2", "old2.mp4")]
+            assert [seg.id for seg in db.get_all_segments()] == ["new"]
+
+    def test_checkpoint_truncates_wal(self):
+        """Test that a TRUNCATE checkpoint empties the WAL file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test1.mp4")
+
+            assert db.get_database_stats()["wal_size_bytes"] > 0
+
+            busy, _, _ = db.checkpoint("truncate")
+
+            assert busy == 0
+            assert db.get_database_stats()["wal_size_bytes"] == 0
+
+    def test_checkpoint_rejects_unknown_mode(self):
+        """Test that checkpoint() validates its mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with pytest.raises(ValueError):
+                db.checkpoint("NOW; DROP TABLE segments")
+
     def test_vacuum(self):
         """Test database vacuum operation."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -745,6 +1156,50 @@ class TestMaintenanceOperations:
             segments = db.get_all_segments()
             assert len(segments) == 1
 
+    def test_new_database_uses_incremental_auto_vacuum(self):
+        """Test that new databases reclaim free pages with incremental vacuum."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection(read_only=True) as conn:
+                assert conn.execute("PRAGMA page_size").fetchone()[0] == database.PAGE_SIZE
+                assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+
+            db.insert_segments_bulk(
+                (f"seg{i}", "2025-02-07", float(i), float(i + 1), 10, 1.0, 1920, 1080, 1024, "x" * 500)
+                for i in range(500)
+            )
+            for i in range(500):
+                db.delete_segment(f"seg{i}")
+
+            with db._get_connection() as conn:
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            db.vacuum(max_pages=2)
+            with db._get_connection() as conn:
+                assert conn.execute("PRAGMA freelist_count").fetchone()[0] == free_pages - 2
+
+            db.vacuum()
+
+            with db._get_connection() as conn:
+                assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+    def test_vacuum_converts_legacy_database(self):
+        """Test that vacuum() switches a legacy database to incremental mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("CREATE TABLE legacy (id INTEGER)")
+            conn.commit()
+            conn.close()
+
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+            db.vacuum()
+
+            with db._get_connection(read_only=True) as conn:
+                assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
     def test_check_integrity(self):
         """Test database integrity check."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -753,6 +1208,10 @@ class TestMaintenanceOperations:
 
             # Fresh database should pass integrity check
             assert db.check_integrity() is True
+            assert db.check_integrity(mode="full") is True
+
+            with pytest.raises(ValueError):
+                db.check_integrity(mode="thorough")
 
 
 class TestBackupAndRecovery:
@@ -788,6 +1247,23 @@ class TestBackupAndRecovery:
             assert backup_path.exists()
             assert backup_path.parent == backup_dir
 
+    def test_backup_contains_data_and_is_private(self):
+        """Test that backup copies committed rows and gets 0o600 permissions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+            db.insert_segment("seg1", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test1.mp4")
+
+            backup_path = db.backup()
+
+            assert os.stat(backup_path).st_mode & 0o777 == 0o600
+            conn = sqlite3.connect(backup_path)
+            try:
+                rows = conn.execute("SELECT id FROM segments").fetchall()
+            finally:
+                conn.close()
+            assert rows == [("seg1",)]
+
     def test_schema_migration_support(self):
         """Test that schema version tracking supports migrations."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -811,6 +1287,74 @@ class TestBackupAndRecovery:
                 assert "version" in columns
                 assert "applied_at" in columns
 
+    def test_migrates_existing_database(self):
+        """Test that a 1.1 database is migrated to the current schema."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+
+            # Build a minimal schema 1.1 database by hand
+            conn = sqlite3.connect(str(db_path))
+            conn.executescript("""
+                CREATE TABLE schema_version (
+                    version TEXT PRIMARY KEY,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                INSERT INTO schema_version (version) VALUES ('1.1');
+                CREATE TABLE segments (
+                    id TEXT PRIMARY KEY,
+                    date TEXT NOT NULL,
+                    start_ts REAL NOT NULL,
+                    end_ts REAL NOT NULL,
+                    frame_count INTEGER NOT NULL,
+                    fps REAL,
+                    width INTEGER,
+                    height INTEGER,
+                    file_size_bytes INTEGER,
+                    video_path TEXT NOT NULL
+                );
+                CREATE INDEX idx_segments_start_ts ON segments(start_ts);
+                INSERT INTO segments VALUES
+                    ('seg1', '2025-02-07', 100.0, 110.0, 10, 1.0, 1920, 1080, 1024, 'a.mp4');
+                CREATE TABLE appsegments (
+                    id TEXT PRIMARY KEY,
+                    app_id TEXT,
+                    date TEXT NOT NULL,
+                    start_ts REAL NOT NULL,
+                    end_ts REAL NOT NULL
+                );
+                CREATE INDEX idx_appsegments_app_id ON appsegments(app_id);
+                INSERT INTO appsegments VALUES
+                    ('app1', 'com.example.app', '2025-02-07', 100.0, 110.0);
+            """)
+            conn.close()
+
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+
+            assert db.get_schema_version() == database.SCHEMA_VERSION
+            assert db.find_segment_at_timestamp(105.0).id == "seg1"
+
+            with db._get_connection(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+                indexes = {row[0] for row in cursor.fetchall()}
+                assert "idx_segments_start_end" in indexes
+                assert "idx_segments_start_ts" not in indexes
+                assert "idx_appsegments_app_start" in indexes
+                assert "idx_appsegments_app_id" not in indexes
+
+                # appsegments was rebuilt without a rowid, keeping its rows
+                cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'appsegments'")
+                assert "WITHOUT ROWID" in cursor.fetchone()[0]
+
+            assert [a.id for a in db.get_all_appsegments()] == ["app1"]
+
+            # Summary totals were seeded from the existing rows
+            stats = db.get_database_stats()
+            assert stats["segment_count"] == 1
+            assert stats["total_video_bytes"] == 1024
+            assert stats["unique_app_count"] == 1
+
 
 class TestHelperFunctions:
     """Test module-level helper functions."""
@@ -832,6 +1376,24 @@ class TestHelperFunctions:
         # All should be unique
         assert len(ids) == 100
 
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_generate_segment_id_reseeded_after_fork(self):
+        """Test that a forked child does not repeat the parent's IDs."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write_fd, database.generate_segment_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = database.generate_segment_id()
+        os.waitpid(pid, 0)
+        child_id = os.read(read_fd, 64).decode()
+        os.close(read_fd)
+
+        assert len(child_id) == 20
+        assert child_id != parent_id
+
     def test_init_database_convenience(self):
         """Test init_database convenience function."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -886,6 +1448,249 @@ class TestErrorHandling:
             db.insert_segment("test", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test.mp4")
             assert db.segment_exists("test") is True
 
+    def test_connections_cached_per_thread(self):
+        """Test that connections are reused within a thread and not shared across threads."""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection(read_only=True) as conn1:
+                pass
+            with db._get_connection(read_only=True) as conn2:
+                pass
+            assert conn1 is conn2
+
+            other = []
+
+            def worker():
+                with db._get_connection(read_only=True) as conn:
+                    other.append(conn)
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            assert other[0] is not conn1
+
+            # close() releases all connections; the manager stays usable
+            db.close()
+            db.insert_segment("test", "2025-02-07", 1707300000.0, 1707300010.0, 10, 1.0, 1024, "test.mp4")
+            assert db.segment_exists("test") is True
+
+    def test_connections_closed_when_manager_collected(self):
+        """Test that dropping the manager closes its cached connections."""
+        import gc
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+            with db._get_connection() as conn:
+                pass
+
+            del db
+            gc.collect()
+
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    def test_read_before_initialize_does_not_create_file(self):
+        """Test that reads on a missing database never open it read-write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = database.DatabaseManager(db_path)
+
+            assert db.get_schema_version() == "0.0"
+            assert not db_path.exists()
+
+            # The read-only open is retried once the file exists
+            db.initialize()
+            with db._get_connection(read_only=True) as conn:
+                assert conn.execute("PRAGMA query_only").fetchone()[0] == 1
+            assert db.get_schema_version() != "0.0"
+
+    def test_cached_connection_skips_file_checks(self, monkeypatch):
+        """Test that warm connections are reused without touching the file system."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+            db.get_all_appsegments()
+
+            stats = []
+            real_stat = os.stat
+            monkeypatch.setattr(
+                database.os, "stat", lambda *a, **k: stats.append(a) or real_stat(*a, **k)
+            )
+            for _ in range(3):
+                db.get_all_appsegments()
+                db.insert_appsegment("app1", "2025-02-07", 1.0, 2.0, "com.example.a")
+
+            assert stats == []
+
+    def test_operational_error_keeps_connection_while_file_unchanged(self, caplog):
+        """Test that transient errors and caller exceptions keep the connection."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection(read_only=True) as conn:
+                first = conn
+            with pytest.raises(sqlite3.OperationalError):
+                with db._get_connection(read_only=True) as conn:
+                    conn.execute("SELECT * FROM no_such_table")
+            caplog.clear()
+            with pytest.raises(KeyError):
+                with db._get_connection(read_only=True) as conn:
+                    raise KeyError("caller error")
+            assert "Database error" not in caplog.text
+            with db._get_connection(read_only=True) as conn:
+                assert conn is first
+
+    def test_operational_error_drops_only_calling_thread(self, monkeypatch):
+        """Test that a thread seeing a replaced file reopens only its own connections."""
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            ready, done = threading.Event(), threading.Event()
+            seen = []
+
+            def worker():
+                with db.transaction():
+                    db.insert_appsegment("app1", "2025-02-07", 1.0, 2.0, "com.example.a")
+                    ready.set()
+                    done.wait(5)
+                    seen.append(db._tls.rw)
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            assert ready.wait(5)
+
+            with db._get_connection(read_only=True) as conn:
+                first = conn
+            monkeypatch.setattr(db, "_file_identity", lambda: (0, 0))
+            with pytest.raises(sqlite3.OperationalError):
+                with db._get_connection(read_only=True) as conn:
+                    conn.execute("SELECT * FROM no_such_table")
+            with db._get_connection(read_only=True) as conn:
+                assert conn is not first
+
+            done.set()
+            thread.join()
+            assert seen[0] is not None
+            assert [a.id for a in db.get_all_appsegments()] == ["app1"]
+
+    def test_replaced_file_detected_on_next_open(self):
+        """Test that a connection opened on a replaced file drops the stale one."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+            db.insert_appsegment("old", "2025-02-07", 1.0, 2.0, "com.example.a")
+
+            db_path.unlink()
+            for suffix in ("-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+            fresh = database.DatabaseManager(db_path)
+            fresh.initialize()
+            fresh.close()
+
+            assert db.get_all_appsegments() == []
+            db.insert_appsegment("new", "2025-02-07", 2.0, 3.0, "com.example.b")
+            assert [a.id for a in db.get_all_appsegments()] == ["new"]
+
+    def test_uncommitted_changes_discarded(self):
+        """Test that a transaction left open in a connection block is rolled back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db._get_connection() as conn:
+                conn.execute("BEGIN")
+                conn.execute(
+                    "INSERT INTO appsegments (id, app_id, date, start_ts, end_ts) VALUES (?, ?, ?, ?, ?)",
+                    ("app1", "com.app", "2025-02-07", 1.0, 2.0),
+                )
+
+            assert db.get_all_appsegments() == []
+
+    def test_transaction_groups_writes(self):
+        """Test that writes inside transaction() commit together."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db.transaction():
+                db.insert_appsegment("app1", "2025-02-07", 100.0, 110.0, "com.example.a")
+                db.insert_appsegment("app2", "2025-02-07", 110.0, 120.0, "com.example.b")
+                # Not visible to readers until the block commits
+                assert db.get_all_appsegments() == []
+
+            assert [a.id for a in db.get_all_appsegments()] == ["app1", "app2"]
+
+    def test_transaction_survives_nested_maintenance_helper(self):
+        """Test that helpers using the shared connection keep the open transaction."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with db.transaction():
+                db.insert_appsegment("app1", "2025-02-07", 100.0, 110.0, "com.example.a")
+                assert db.verify_secure_delete() is True
+                db.insert_appsegment("app2", "2025-02-07", 110.0, 120.0, "com.example.b")
+                assert db.get_all_appsegments() == []
+
+            assert [a.id for a in db.get_all_appsegments()] == ["app1", "app2"]
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that an error inside transaction() discards every write in it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            with pytest.raises(RuntimeError):
+                with db.transaction():
+                    db.insert_appsegment("app1", "2025-02-07", 100.0, 110.0, "com.example.a")
+                    raise RuntimeError("abort")
+
+            assert db.get_all_appsegments() == []
+            db.insert_appsegment("app2", "2025-02-07", 110.0, 120.0, "com.example.b")
+            assert [a.id for a in db.get_all_appsegments()] == ["app2"]
+
+    def test_maintenance_refused_inside_transaction(self):
+        """Test that checkpoint and vacuum raise inside transaction() and roll it back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = database.DatabaseManager(Path(tmpdir) / "test.db")
+            db.initialize()
+
+            for operation in (db.checkpoint, db.vacuum, db.full_vacuum):
+                with pytest.raises(RuntimeError, match="inside transaction"):
+                    with db.transaction():
+                        db.insert_appsegment("app1", "2025-02-07", 100.0, 110.0, "com.example.a")
+                        operation()
+
+                assert db.get_all_appsegments() == []
+
+            db.vacuum()
+            db.checkpoint()
+
+    def test_write_transaction_takes_write_lock_up_front(self):
+        """Test that write transactions hold the write lock from BEGIN."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test.db"
+            db = database.DatabaseManager(db_path)
+            db.initialize()
+
+            other = sqlite3.connect(str(db_path), timeout=0, isolation_level=None)
+            try:
+                with db._write_transaction():
+                    with pytest.raises(sqlite3.OperationalError, match="locked"):
+                        other.execute("BEGIN IMMEDIATE")
+            finally:
+                other.close()
+
     def test_get_schema_version_on_empty_db(self):
         """Test getting schema version on uninitialized database."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -4,6 +4,7 @@ Unit tests for logging_config.py - Structured JSON logging configuration.
 
 import json
 import logging
+import queue
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -105,6 +106,28 @@ class TestJSONFormatter:
         # Should be parseable as ISO 8601
         datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
 
+    def test_timestamp_is_record_creation_time(self):
+        """Test timestamp reflects when the record was created, not formatted."""
+        formatter = logging_config.JSONFormatter("test")
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Test",
+            args=(),
+            exc_info=None,
+        )
+
+        record.created = 1707307200.25
+        assert json.loads(formatter.format(record))["timestamp"] == "2024-02-07T12:00:00.250000Z"
+
+        # Same second reuses the cached prefix; the next second refreshes it
+        record.created = 1707307200.5
+        assert json.loads(formatter.format(record))["timestamp"] == "2024-02-07T12:00:00.500000Z"
+        record.created = 1707307201.0
+        assert json.loads(formatter.format(record))["timestamp"] == "2024-02-07T12:00:01.000000Z"
+
     def test_unicode_message(self):
         """Test formatting message with unicode characters."""
         formatter = logging_config.JSONFormatter("test")
@@ -213,6 +236,55 @@ class TestSetupLogger:
                     # Should have same number of handlers (not doubled)
                     assert handler_count_1 == handler_count_2
 
+    def test_setup_logger_with_queue(self):
+        """Test queued logger writes JSON records from a background thread."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("lib.logging_config.paths.is_development_mode", return_value=True):
+                with patch(
+                    "lib.logging_config.paths.PROJECT_ROOT", Path(tmpdir)
+                ):
+                    logger = logging_config.setup_logger(
+                        "queued", console_output=False, use_queue=True
+                    )
+
+                    # Caller only has the queue handler attached
+                    assert len(logger.handlers) == 1
+                    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+                    try:
+                        raise ValueError("boom")
+                    except ValueError as e:
+                        logging_config.log_error_with_context(
+                            logger, "Failed", exception=e, path="/tmp/x"
+                        )
+
+                    # Stopping the listener flushes pending records
+                    logging_config._stop_queue_listener(logger.name)
+
+                    log_file = Path(tmpdir) / "dev_logs" / "queued.log"
+                    parsed = json.loads(log_file.read_text().strip())
+                    assert parsed["message"] == "Failed"
+                    assert parsed["metadata"]["path"] == "/tmp/x"
+                    assert "ValueError: boom" in parsed["exception"]
+
+    def test_queue_handler_freezes_message_and_metadata(self):
+        """Test queued records keep the values from the time of the call."""
+        handler = logging_config._RecordQueueHandler(queue.SimpleQueue())
+        items = ["a"]
+        metadata = {"count": 1}
+        record = logging.LogRecord(
+            "test", logging.INFO, __file__, 1, "items=%s", (items,), None
+        )
+        record.metadata = metadata
+
+        prepared = handler.prepare(record)
+        items.append("b")
+        metadata["count"] = 2
+
+        assert prepared.getMessage() == "items=['a']"
+        assert prepared.metadata == {"count": 1}
+        assert record.args == (items,)
+
 
 class TestLogWithMetadata:
     """Tests for log_with_metadata function."""
@@ -244,6 +316,23 @@ class TestLogWithMetadata:
 
         logger.debug.assert_called_once()
 
+    def test_log_with_metadata_accepts_uppercase_level(self):
+        """Test that level names are matched case-insensitively."""
+        logger = MagicMock()
+        logging_config.log_with_metadata(logger, "WARNING", "Careful", code=1)
+
+        logger.isEnabledFor.assert_called_once_with(logging.WARNING)
+        logger.warning.assert_called_once()
+
+    def test_log_with_metadata_skips_disabled_level(self):
+        """Test that messages below the logger level are not emitted."""
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+        logging_config.log_with_metadata(logger, "debug", "Debug info", details="test")
+
+        logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        logger.debug.assert_not_called()
+
 
 class TestLogResourceMetrics:
     """Tests for log_resource_metrics function."""
@@ -401,6 +490,16 @@ class TestConvenienceFunctions:
 
         logger.debug.assert_called_once()
 
+    def test_convenience_functions_skip_disabled_level(self):
+        """Test that convenience functions do not emit below the logger level."""
+        logger = MagicMock()
+        logger.isEnabledFor.return_value = False
+        logging_config.log_debug(logger, "Debug message", details="test")
+        logging_config.log_info(logger, "Info message", key="value")
+
+        logger.debug.assert_not_called()
+        logger.info.assert_not_called()
+
 
 class TestLogRotation:
     """Tests for log rotation configuration."""
@@ -74,6 +74,15 @@ def test_screensaver_functions():
     else:
         print("  ✗ Could not detect screensaver state (AppleScript unavailable)")
 
+    locked = macos.is_screen_locked()
+    print(f"\nScreen locked: {locked}")
+    if locked is True:
+        print("  ! Screen is currently locked")
+    elif locked is False:
+        print("  ✓ Screen is not locked")
+    else:
+        print("  ✗ Could not detect lock state (CoreGraphics unavailable)")
+
 
 def test_screen_availability():
     """Test screen availability check."""
@@ -113,6 +122,15 @@ def test_frontmost_app_functions():
     else:
         print("  ✗ AppleScript execution failed")
 
+    info = macos.get_frontmost_app_info()
+    print(f"\nFrontmost app info: {info}")
+    if info is not None and info != ("unknown", "Unknown"):
+        print(f"  ✓ Frontmost app: {info[1]} ({info[0]})")
+    elif info == ("unknown", "Unknown"):
+        print("  ! Could not detect frontmost app")
+    else:
+        print("  ✗ AppleScript execution failed")
+
 
 def test_idle_detection():
     """Test user idle detection."""
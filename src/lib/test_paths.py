@@ -24,6 +24,21 @@ class TestProjectRootDetection:
         assert (root / "src").is_dir()
         assert (root / "src" / "lib").is_dir()
 
+    def test_detect_project_root_is_cached(self):
+        """Test that the project root is only resolved once per process."""
+        paths._clear_project_root_cache()
+        try:
+            with patch.object(Path, "is_dir", autospec=True, side_effect=Path.is_dir) as is_dir:
+                first = paths._detect_project_root()
+                calls = is_dir.call_count
+                second = paths._detect_project_root()
+
+            assert calls > 0
+            assert is_dir.call_count == calls
+            assert first == second
+        finally:
+            paths._clear_project_root_cache()
+
     def test_project_root_constant_set(self):
         """Test that PROJECT_ROOT constant is set correctly."""
         if paths.PROJECT_ROOT is not None:
@@ -144,6 +159,54 @@ class TestLogsDirectory:
             logs_dir = paths.get_logs_directory()
             assert "Library/Logs/Playback" in str(logs_dir)
 
+    def test_prod_mode_resolves_home_once(self, monkeypatch):
+        """Test that the home directory is looked up only on first use."""
+        monkeypatch.setattr(paths, "_HOME", None)
+        paths._production_path.cache_clear()
+        try:
+            with patch.dict(os.environ, {}, clear=True):
+                with patch("pathlib.Path.home", return_value=Path("/Users/test")) as home:
+                    first = paths.get_logs_directory()
+                    second = paths.get_config_path()
+        finally:
+            paths._production_path.cache_clear()
+
+        assert home.call_count == 1
+        assert first == Path("/Users/test/Library/Logs/Playback")
+        assert second.parent == Path("/Users/test/Library/Application Support/Playback")
+
+
+class TestPathCaching:
+    """Test that environment base paths are built once per mode."""
+
+    def test_dev_paths_reused(self):
+        """Test that development getters return the same Path object."""
+        with patch.dict(os.environ, {"PLAYBACK_DEV_MODE": "1"}):
+            assert paths.get_base_data_directory() is paths.get_base_data_directory()
+            assert paths.get_logs_directory() is paths.get_logs_directory()
+
+    def test_prod_paths_reused(self):
+        """Test that production getters return the same Path object."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert paths.get_base_data_directory() is paths.get_base_data_directory()
+            assert paths.get_config_path() is paths.get_config_path()
+
+    def test_data_paths_reused(self):
+        """Test that paths under the base data directory are built once."""
+        assert paths.get_temp_directory() is paths.get_temp_directory()
+        assert paths.get_chunks_directory() is paths.get_chunks_directory()
+        assert paths.get_database_path() is paths.get_database_path()
+        assert paths.get_timeline_open_signal_path() is paths.get_timeline_open_signal_path()
+
+    def test_mode_switch_returns_other_tree(self):
+        """Test that cached paths still follow PLAYBACK_DEV_MODE."""
+        with patch.dict(os.environ, {"PLAYBACK_DEV_MODE": "1"}):
+            dev_dir = paths.get_base_data_directory()
+        with patch.dict(os.environ, {}, clear=True):
+            prod_dir = paths.get_base_data_directory()
+        assert dev_dir != prod_dir
+        assert dev_dir.name == "dev_data"
+
 
 class TestTimelineOpenSignalPath:
     """Test get_timeline_open_signal_path function."""
@@ -155,6 +218,14 @@ class TestTimelineOpenSignalPath:
         assert signal_path.parent == base_dir
         assert signal_path.name == ".timeline_open"
 
+    def test_is_timeline_open_follows_signal_file(self, tmp_path):
+        """Test that is_timeline_open reflects the signal file's presence."""
+        signal_path = tmp_path / ".timeline_open"
+        with patch.object(paths, "get_timeline_open_signal_path", return_value=signal_path):
+            assert paths.is_timeline_open() is False
+            signal_path.touch()
+            assert paths.is_timeline_open() is True
+
 
 class TestEnsureDirectoryExists:
     """Test ensure_directory_exists function."""
@@ -266,6 +337,30 @@ class TestSecureFileCreation:
             with pytest.raises(TypeError, match="content must be bytes"):
                 paths.create_secure_file(file_path, 12345)
 
+    def test_secure_file_accepts_buffers(self):
+        """Test that bytearray and memoryview content is written as-is."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            array_path = Path(tmpdir) / "array.bin"
+            paths.create_secure_file(array_path, bytearray(b"frame data"))
+            assert array_path.read_bytes() == b"frame data"
+
+            view_path = Path(tmpdir) / "view.bin"
+            words = memoryview(bytearray(range(8))).cast("H")
+            paths.create_secure_file(view_path, words)
+            assert view_path.read_bytes() == bytes(range(8))
+
+    def test_secure_file_overwrite_tightens_permissions(self):
+        """Test that overwriting an existing file resets it to 0o600."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "existing.bin"
+            file_path.write_bytes(b"old data that is longer")
+            os.chmod(file_path, 0o644)
+
+            paths.create_secure_file(file_path, b"new")
+
+            assert file_path.read_bytes() == b"new"
+            assert os.stat(file_path).st_mode & 0o777 == 0o600
+
     def test_secure_file_umask_restored(self):
         """Test that umask is restored after file creation."""
         original_umask = os.umask(0o022)
@@ -300,6 +395,16 @@ class TestGetDayDirectory:
         assert day_dir.parent.name == "202601"
         assert "chunks" in str(day_dir)
 
+    def test_day_directory_follows_environment(self):
+        """Test that cached day directories are keyed on the base directory."""
+        with patch.dict(os.environ, {"PLAYBACK_DEV_MODE": "1"}):
+            dev_dir = paths.get_day_directory("20251222", "chunks")
+            assert dev_dir == paths.get_base_data_directory() / "chunks" / "202512" / "22"
+        with patch.dict(os.environ, {}, clear=True):
+            prod_dir = paths.get_day_directory("20251222", "chunks")
+            assert prod_dir == paths.get_base_data_directory() / "chunks" / "202512" / "22"
+        assert dev_dir != prod_dir
+
     def test_invalid_date_format(self):
         """Test that invalid date format raises ValueError."""
         with pytest.raises(ValueError, match="must be YYYYMMDD format"):
@@ -311,6 +416,12 @@ class TestGetDayDirectory:
         with pytest.raises(ValueError, match="must be YYYYMMDD format"):
             paths.get_day_directory("202512221", "temp")
 
+        with pytest.raises(ValueError, match="must be YYYYMMDD format"):
+            paths.get_day_directory("abcdefgh", "temp")
+
+        with pytest.raises(ValueError, match="must be YYYYMMDD format"):
+            paths.get_day_directory("2025１２22", "temp")
+
     def test_invalid_subdirectory(self):
         """Test that invalid subdirectory raises ValueError."""
         with pytest.raises(ValueError, match="must be 'temp' or 'chunks'"):
@@ -14,13 +14,20 @@ Functions:
 """
 
 import re
-import uuid
+import secrets
+import string
 from datetime import datetime
 from typing import Optional
 
 
 DATE_RE = re.compile(r"^(?P<date>\d{8})-(?P<time>\d{6})")
 
+# Runs of characters not allowed in app IDs used in filenames
+_APP_ID_INVALID_RE = re.compile(r"[^A-Za-z0-9.]+")
+
+# Characters allowed in app IDs used in filenames
+_APP_ID_VALID_CHARS = frozenset(string.ascii_letters + string.digits + ".")
+
 
 def parse_timestamp_from_name(name: str) -> Optional[float]:
     """
@@ -114,13 +121,18 @@ def sanitize_app_id(app_id: str) -> str:
         >>> sanitize_app_id("com.example.app")
         'com.example.app'
         >>> sanitize_app_id("My App!@#")
-        'My_App___'
+        'My_App_'
         >>> sanitize_app_id("")
         'unknown'
     """
     if not app_id:
         return "unknown"
-    return re.sub(r"[^A-Za-z0-9.]+", "_", app_id)
+
+    # Fast path: typical bundle IDs are already valid
+    if _APP_ID_VALID_CHARS.issuperset(app_id):
+        return app_id
+
+    return _APP_ID_INVALID_RE.sub("_", app_id)
 
 
 def generate_chunk_name(timestamp: datetime, app_id: Optional[str] = None) -> str:
@@ -146,9 +158,13 @@ def generate_chunk_name(timestamp: datetime, app_id: Optional[str] = None) -> st
         >>> name.endswith("-com.example.app")
         True
     """
-    date_part = timestamp.strftime("%Y%m%d")
-    time_part = timestamp.strftime("%H%M%S")
-    short_uuid = uuid.uuid4().hex[:8]
+    t = timestamp
+    short_uuid = secrets.token_hex(4)
     sanitized_app = sanitize_app_id(app_id or "unknown")
 
-    return f"{date_part}-{time_part}-{short_uuid}-{sanitized_app}"
+    # Format fields directly; equivalent to strftime("%Y%m%d-%H%M%S") but
+    # without walking a format string on every capture
+    return (
+        f"{t.year:04d}{t.month:02d}{t.day:02d}-{t.hour:02d}{t.minute:02d}{t.second:02d}"
+        f"-{short_uuid}-{sanitized_app}"
+    )
@@ -611,15 +611,10 @@ def process_day(
         appsegments_count=len(appsegments)
     )
 
-    for app_id, start_ts, end_ts in appsegments:
-        appsegment_id = generate_segment_id()
-        db.insert_appsegment(
-            appsegment_id=appsegment_id,
-            date_str=date_str,
-            start_ts=start_ts,
-            end_ts=end_ts,
-            app_id=app_id,
-        )
+    db.insert_appsegments_bulk(
+        (generate_segment_id(), app_id, date_str, start_ts, end_ts)
+        for app_id, start_ts, end_ts in appsegments
+    )
 
     # Remove temporary files after successful processing
     if cleanup:
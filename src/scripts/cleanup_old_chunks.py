@@ -306,6 +306,9 @@ def cleanup_old_recordings(
 
     Returns:
         Tuple of (segments_deleted, bytes_freed)
+
+    Raises:
+        sqlite3.Error: If the database entries could not be deleted
     """
     if policy == "never":
         log_info(
@@ -348,6 +351,7 @@ def cleanup_old_recordings(
 
     deleted_count = 0
     freed_bytes = 0
+    deleted_ids = []
     base_data_dir = get_database_path().parent
 
     for segment_id, video_path in old_segments:
@@ -376,11 +380,8 @@ def cleanup_old_recordings(
 
                 freed_bytes += file_size
 
-            # Delete database entries
-            if not dry_run:
-                # Note: We don't have a direct method to delete appsegments by segment_id
-                # We'll delete the segment, and rely on database constraints or manual cleanup
-                db.delete_segment(segment_id)
+            # Queue the database entry; rows are deleted in one transaction below
+            deleted_ids.append(segment_id)
 
             deleted_count += 1
 
@@ -393,6 +394,21 @@ def cleanup_old_recordings(
                 video_path=video_path
             )
 
+    # Delete database entries for every segment handled above
+    if not dry_run and deleted_ids:
+        try:
+            db.delete_segments(deleted_ids)
+        except Exception as e:
+            # The video files are already gone; the remaining rows are left
+            # for --orphaned to remove
+            log_error_with_context(
+                logger,
+                "Error deleting segment records",
+                exception=e,
+                segment_count=len(deleted_ids)
+            )
+            raise
+
     # Clean up empty directories
     if not dry_run:
         chunks_dir = get_chunks_directory()
@@ -458,7 +474,7 @@ def cleanup_orphaned_segments(
         dry_run=dry_run
     )
 
-    orphaned_count = 0
+    orphaned_ids = []
     base_data_dir = get_database_path().parent
 
     for segment in segments:
@@ -474,11 +490,12 @@ def cleanup_orphaned_segments(
                     dry_run=dry_run
                 )
 
-            if not dry_run:
-                db.delete_segment(segment.id)
+            orphaned_ids.append(segment.id)
 
-            orphaned_count += 1
+    if not dry_run and orphaned_ids:
+        db.delete_segments(orphaned_ids)
 
+    orphaned_count = len(orphaned_ids)
     log_info(
         logger,
         "Orphaned segment cleanup completed",
@@ -526,6 +543,9 @@ def vacuum_database(logger, verbose: bool = False) -> int:
     db = init_database(db_path)
     db.vacuum()
 
+    # Fold the WAL back into the main file so the size reflects the vacuum
+    db.checkpoint("TRUNCATE")
+
     # Get size after vacuum
     size_after = db_path.stat().st_size
     freed_bytes = size_before - size_after
@@ -2,8 +2,9 @@
 """
 Screen recording service for Playback.
 
-Continuously captures screenshots at configured intervals using macOS's native
-`screencapture` utility. Implements pause detection, app exclusion, and resource
+Continuously captures screenshots at configured intervals using CoreGraphics
+in-process capture (falling back to macOS's native `screencapture` utility).
+Implements pause detection, app exclusion, and resource
 monitoring with structured JSON logging.
 
 Requirements:
@@ -12,7 +13,13 @@ Requirements:
 - Screen Recording permission granted in System Settings
 """
 
+import os
+import queue
+import signal
 import subprocess
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
 import time
 import sys
 from datetime import datetime
@@ -25,11 +32,15 @@ from lib.paths import (
     get_temp_directory,
     ensure_directory_exists,
     get_timeline_open_signal_path,
+    is_timeline_open,
 )
 from lib.macos import (
     is_screen_unavailable,
     get_active_display_index,
+    get_active_display_id,
     get_frontmost_app_bundle_id,
+    capture_display_to_png,
+    grab_display_raw,
 )
 from lib.timestamps import generate_chunk_name
 from lib.config import load_config_with_defaults
@@ -52,6 +63,37 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# Try to import Pillow for off-thread PNG encoding
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Maximum number of raw frames waiting to be encoded (bounds memory usage)
+ENCODE_QUEUE_SIZE = 8
+
+# Queue item telling an encoder thread to exit once earlier frames are written
+_STOP_ENCODER = None
+
+# PNG encoder backend: "thread" (default) or "process". Pillow releases the
+# GIL while compressing, so threads usually suffice; the process backend
+# isolates encoding entirely from the capture process.
+ENCODER_BACKEND = os.environ.get("PLAYBACK_ENCODER_BACKEND", "thread")
+
+# Log level names accepted from PLAYBACK_LOG_LEVEL; anything else falls back to INFO
+LOG_LEVEL_NAMES = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# Last day directory ensured by ensure_chunk_dir: ((year, month, day), path)
+_chunk_dir_cache = None
+
+# zlib compression level for PNG frames (1 = fastest)
+PNG_COMPRESS_LEVEL = 1
+
+# Write buffer size for PNG frames (1 MB)
+PNG_WRITE_BUFFER_SIZE = 1 << 20
+
 
 def _has_screen_recording_permission() -> bool:
     """
@@ -91,23 +133,71 @@ def ensure_chunk_dir(now: datetime) -> Path:
     """
     Ensure temp/YYYYMM/DD directory exists.
 
+    The directory is only checked/created once per day; later calls for the
+    same day return the cached path. If the processing service removes it in
+    the meantime, capture_screen() and encode_and_write() re-create it on
+    the failed write and retry, so no frame is dropped.
+
     Args:
         now: Current datetime
 
     Returns:
         Path to day directory
     """
-    year_month = now.strftime("%Y%m")
-    day = now.strftime("%d")
+    global _chunk_dir_cache
+
+    day_key = (now.year, now.month, now.day)
 
-    day_dir = get_temp_directory() / year_month / day
+    cached = _chunk_dir_cache
+    if cached is not None and cached[0] == day_key:
+        return cached[1]
+
+    day_dir = get_temp_directory() / f"{now.year:04d}{now.month:02d}" / f"{now.day:02d}"
     ensure_directory_exists(day_dir, mode=0o700)
+    _chunk_dir_cache = (day_key, day_dir)
     return day_dir
 
 
+def reset_chunk_dir_cache() -> None:
+    """
+    Forget the cached day directory so the next capture re-creates it.
+
+    The processing service removes day directories once they are empty,
+    which can include today's directory.
+    """
+    global _chunk_dir_cache
+    _chunk_dir_cache = None
+
+
+def temp_path_for(output_path: Path) -> Path:
+    """
+    Get the in-progress path used while a frame is being written.
+
+    The temp file lives in the same directory (so the final rename is atomic)
+    and is a dotfile, which the processing service ignores, so a partially
+    written frame is never picked up. Unlike with_suffix(), this keeps dotted
+    app IDs in the name intact.
+
+    Args:
+        output_path: Final path of the frame
+
+    Returns:
+        Temporary path next to output_path
+    """
+    return output_path.with_name(f".{output_path.name}.tmp")
+
+
 def capture_screen(output_path: Path, logger) -> None:
     """
-    Capture screenshot using macOS screencapture utility.
+    Capture screenshot of the active display.
+
+    Captures in-process via CoreGraphics/ImageIO, which avoids spawning a
+    screencapture process every interval. Falls back to the macOS
+    screencapture utility if in-process capture is unavailable or fails.
+
+    The day directory is cached by ensure_chunk_dir(), but the processing
+    service may remove it once empty; if the capture fails and the directory
+    is gone, it is re-created and the capture retried once.
 
     Args:
         output_path: Path where screenshot should be saved
@@ -116,31 +206,408 @@ def capture_screen(output_path: Path, logger) -> None:
     Raises:
         subprocess.CalledProcessError: If screencapture command fails
     """
-    temp_path = output_path.with_suffix(".png")
+    try:
+        _capture_screen_once(output_path, logger)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        if output_path.parent.is_dir():
+            raise
+        log_debug(logger, "Day directory removed - re-creating", path=str(output_path.parent))
+        ensure_directory_exists(output_path.parent, mode=0o700)
+        _capture_screen_once(output_path, logger)
 
-    # Try to detect active display
-    display_index = get_active_display_index()
 
-    cmd = ["screencapture", "-x", "-t", "png"]
+def _capture_screen_once(output_path: Path, logger) -> None:
+    """
+    Capture the active display to output_path once (see capture_screen()).
 
-    if display_index is not None:
-        log_debug(logger, "Using active display", display_index=display_index)
-        cmd.extend(["-D", str(display_index)])
+    Args:
+        output_path: Path where screenshot should be saved
+        logger: Logger instance for structured logging
 
-    cmd.append(str(temp_path))
+    Raises:
+        subprocess.CalledProcessError: If screencapture command fails
+    """
+    temp_path = temp_path_for(output_path)
 
-    subprocess.run(cmd, check=True)
+    # Try in-process capture of the active display first
+    display_id = get_active_display_id()
+    captured = False
 
-    # Set secure permissions (0o600 = user read/write only)
-    import os
+    if display_id is not None:
+        captured = capture_display_to_png(display_id, temp_path)
+        if captured:
+            log_debug(logger, "Captured display in-process", display_id=display_id)
 
+    if not captured:
+        # Fall back to screencapture utility
+        display_index = get_active_display_index()
+
+        cmd = ["screencapture", "-x", "-t", "png"]
+
+        if display_index is not None:
+            log_debug(logger, "Using active display", display_index=display_index)
+            cmd.extend(["-D", str(display_index)])
+
+        cmd.append(str(temp_path))
+
+        subprocess.run(cmd, check=True)
+
+    # Set secure permissions (0o600 = user read/write only)
     os.chmod(temp_path, 0o600)
 
-    # Rename to remove .png extension
-    temp_path.rename(output_path)
+    # Atomically move into place (permissions carry over with the inode)
+    os.replace(temp_path, output_path)
+
+
+def grab_raw(logger):
+    """
+    Grab raw pixels of the active display without encoding them.
+
+    Args:
+        logger: Logger instance for structured logging
+
+    Returns:
+        Tuple of (width, height, bytes_per_row, bgra_bytes), or None if
+        in-process capture is unavailable
+    """
+    display_id = get_active_display_id()
+    if display_id is None:
+        return None
+
+    raw = grab_display_raw(display_id)
+    if raw is not None:
+        log_debug(logger, "Grabbed display in-process", display_id=display_id)
+    return raw
+
+
+def encode_and_write(raw, output_path: Path) -> None:
+    """
+    Encode raw BGRA pixels as PNG and write them to output_path.
+
+    The PNG is written to a temporary path first and renamed into place so
+    that readers never observe a partially written frame. If the day
+    directory was removed since it was cached, it is re-created.
+
+    Args:
+        raw: Tuple of (width, height, bytes_per_row, bgra_bytes) from grab_raw()
+        output_path: Path where screenshot should be saved
+    """
+    width, height, stride, pixels = raw
+    temp_path = temp_path_for(output_path)
+
+    image = Image.frombuffer("RGB", (width, height), pixels, "raw", "BGRX", stride, 1)
+
+    try:
+        try:
+            f = open(temp_path, "wb", buffering=PNG_WRITE_BUFFER_SIZE)
+        except FileNotFoundError:
+            # The processing service removed the (empty) cached day directory
+            ensure_directory_exists(temp_path.parent, mode=0o700)
+            f = open(temp_path, "wb", buffering=PNG_WRITE_BUFFER_SIZE)
+
+        # Fast zlib level: screen content compresses well even at level 1, and
+        # a large write buffer keeps the number of write() syscalls low
+        with f:
+            image.save(f, format="PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+
+        # Set secure permissions (0o600 = user read/write only)
+        os.chmod(temp_path, 0o600)
+
+        # Atomically move into place
+        os.replace(temp_path, output_path)
+    except BaseException:
+        # Never leave a half-written frame behind
+        temp_path.unlink(missing_ok=True)
+        raise
+    finally:
+        # Drop the image's reference to the pixel buffer (which may be shared memory)
+        image.close()
+
+
+def _encoder_worker(frames: queue.Queue, logger) -> None:
+    """
+    Consume raw frames from the queue, encoding and writing each to disk.
+
+    Exits after taking _STOP_ENCODER from the queue.
+
+    Args:
+        frames: Queue of (raw, output_path, app_id) tuples
+        logger: Logger instance for structured logging
+    """
+    while True:
+        item = frames.get()
+        if item is _STOP_ENCODER:
+            frames.task_done()
+            return
+
+        raw, output_path, app_id = item
+        try:
+            encode_and_write(raw, output_path)
+
+            file_size_kb = output_path.stat().st_size / 1024
+
+            log_info(
+                logger,
+                "Screenshot captured",
+                path=str(output_path),
+                size_kb=round(file_size_kb, 1),
+                app_id=app_id or "unknown",
+            )
+
+        except Exception as e:
+            reset_chunk_dir_cache()
+            log_error_with_context(
+                logger,
+                "Screenshot encoding failed",
+                exception=e,
+                path=str(output_path),
+            )
+
+        finally:
+            frames.task_done()
+
+
+class ThreadEncoderPool:
+    """
+    Encode frames in a pool of daemon threads fed by a bounded queue.
+
+    The queue is bounded so a slow disk applies backpressure to the capture
+    loop instead of accumulating frames in memory.
+    """
+
+    def __init__(self, logger, worker_count: int, max_pending: int = ENCODE_QUEUE_SIZE):
+        """
+        Start the encoder threads.
+
+        Args:
+            logger: Logger instance for structured logging
+            worker_count: Number of encoder threads
+            max_pending: Maximum frames queued but not yet taken by a thread
+        """
+        self._frames = queue.Queue(maxsize=max_pending)
+        self._threads = []
+
+        for i in range(worker_count):
+            thread = threading.Thread(
+                target=_encoder_worker,
+                args=(self._frames, logger),
+                name=f"png-encoder-{i}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def put(self, item, block: bool = True) -> None:
+        """
+        Queue a (raw, output_path, app_id) frame for encoding.
+
+        Args:
+            item: Tuple of (raw, output_path, app_id)
+            block: Wait for room if the queue is full
+        """
+        self._frames.put(item, block=block)
+
+    def close(self) -> None:
+        """Write every queued frame, then stop the encoder threads."""
+        for _ in self._threads:
+            self._frames.put(_STOP_ENCODER)
+        self._frames.join()
+        for thread in self._threads:
+            thread.join()
 
-    # Ensure final file has secure permissions
-    os.chmod(output_path, 0o600)
+
+def start_encoder_workers(logger) -> ThreadEncoderPool:
+    """
+    Start daemon threads that encode and write captured frames.
+
+    Uses roughly a quarter of the available cores (at least one).
+
+    Args:
+        logger: Logger instance for structured logging
+
+    Returns:
+        ThreadEncoderPool accepting (raw, output_path, app_id) tuples
+    """
+    worker_count = max(1, (os.cpu_count() or 1) // 4)
+    pool = ThreadEncoderPool(logger, worker_count)
+
+    log_debug(logger, "Encoder workers started", worker_count=worker_count)
+    return pool
+
+
+def _encode_shared_frame(
+    shm_name: str, width: int, height: int, stride: int, output_path: str
+) -> int:
+    """
+    Encode a frame stored in shared memory (runs in an encoder process).
+
+    Args:
+        shm_name: Name of the SharedMemory block holding BGRA pixels
+        width: Frame width in pixels
+        height: Frame height in pixels
+        stride: Bytes per row
+        output_path: Path where screenshot should be saved
+
+    Returns:
+        Size of the written file in bytes
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pixels = shm.buf[: stride * height]
+        try:
+            encode_and_write((width, height, stride, pixels), Path(output_path))
+        finally:
+            pixels.release()
+    finally:
+        shm.close()
+
+    return os.stat(output_path).st_size
+
+
+class ProcessEncoderPool:
+    """
+    Encode frames in a pool of worker processes.
+
+    Raw pixels are placed in a SharedMemory block so only its name crosses
+    the process boundary, instead of pickling a multi-megabyte payload. A
+    semaphore caps the number of in-flight frames, so a slow disk applies
+    backpressure to the capture loop just like the bounded thread queue.
+
+    Exposes the same put() and close() interface as ThreadEncoderPool.
+    """
+
+    def __init__(self, logger, max_workers: int, max_pending: int = ENCODE_QUEUE_SIZE):
+        """
+        Start the encoder process pool.
+
+        Args:
+            logger: Logger instance for structured logging
+            max_workers: Number of encoder processes
+            max_pending: Maximum frames submitted but not yet written
+        """
+        self._logger = logger
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+
+    def put(self, item, block: bool = True) -> None:
+        """
+        Submit a (raw, output_path, app_id) frame for encoding.
+
+        Args:
+            item: Tuple of (raw, output_path, app_id)
+            block: Wait for a free slot if too many frames are pending
+        """
+        raw, output_path, app_id = item
+        width, height, stride, pixels = raw
+
+        if not self._slots.acquire(blocking=block):
+            raise queue.Full
+
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=len(pixels))
+        except Exception:
+            self._slots.release()
+            raise
+
+        try:
+            shm.buf[: len(pixels)] = pixels
+            future = self._executor.submit(
+                _encode_shared_frame, shm.name, width, height, stride, str(output_path)
+            )
+        except Exception:
+            shm.close()
+            shm.unlink()
+            self._slots.release()
+            raise
+
+        future.add_done_callback(
+            lambda f: self._on_frame_done(f, shm, output_path, app_id)
+        )
+
+    def close(self) -> None:
+        """Write every submitted frame, then stop the encoder processes."""
+        self._executor.shutdown(wait=True)
+
+    def _on_frame_done(
+        self, future: Future, shm: shared_memory.SharedMemory, output_path: Path, app_id
+    ) -> None:
+        """Log the result of an encode and free its shared memory block."""
+        try:
+            exception = future.exception()
+            if exception is None:
+                log_info(
+                    self._logger,
+                    "Screenshot captured",
+                    path=str(output_path),
+                    size_kb=round(future.result() / 1024, 1),
+                    app_id=app_id or "unknown",
+                )
+            else:
+                reset_chunk_dir_cache()
+                log_error_with_context(
+                    self._logger,
+                    "Screenshot encoding failed",
+                    exception=exception,
+                    path=str(output_path),
+                )
+        finally:
+            shm.close()
+            shm.unlink()
+            self._slots.release()
+
+
+def start_encoder(logger):
+    """
+    Start the configured PNG encoder backend.
+
+    Args:
+        logger: Logger instance for structured logging
+
+    Returns:
+        Object with a put((raw, output_path, app_id), block=True) method and
+        a close() method that drains pending frames
+    """
+    if ENCODER_BACKEND == "process":
+        worker_count = max(1, (os.cpu_count() or 1) // 4)
+        log_debug(logger, "Encoder processes started", worker_count=worker_count)
+        return ProcessEncoderPool(logger, max_workers=worker_count)
+
+    return start_encoder_workers(logger)
+
+
+def wait_for_next_tick(next_tick: float, interval_seconds: float, logger) -> float:
+    """
+    Sleep until the next scheduled capture slot.
+
+    Slots are spaced on a monotonic clock, so time spent capturing and
+    encoding does not accumulate into drift. If the loop has fallen more than
+    a full interval behind, the schedule is resynced to now instead of
+    firing a burst of back-to-back captures to catch up.
+
+    Args:
+        next_tick: Monotonic time of the slot that just ran
+        interval_seconds: Seconds between captures
+        logger: Logger instance for structured logging
+
+    Returns:
+        Monotonic time of the slot that is about to run
+    """
+    next_tick += interval_seconds
+    sleep_for = next_tick - time.monotonic()
+
+    if sleep_for > 0:
+        time.sleep(sleep_for)
+        return next_tick
+
+    if -sleep_for >= interval_seconds:
+        log_warning(
+            logger,
+            "Capture loop behind schedule - resyncing",
+            behind_seconds=round(-sleep_for, 3),
+        )
+        return time.monotonic()
+
+    return next_tick
 
 
 def is_timeline_viewer_open() -> bool:
@@ -150,8 +617,7 @@ def is_timeline_viewer_open() -> bool:
     Returns:
         True if signal file exists, False otherwise
     """
-    signal_path = get_timeline_open_signal_path()
-    return signal_path.exists()
+    return is_timeline_open()
 
 
 def collect_metrics(start_time: float, total_captures: int) -> dict:
@@ -192,6 +658,11 @@ def collect_metrics(start_time: float, total_captures: int) -> dict:
         return {}
 
 
+def _exit_on_sigterm(signum, frame) -> None:
+    """Turn SIGTERM into SystemExit so the capture loop shuts down cleanly."""
+    raise SystemExit(0)
+
+
 def main(interval_seconds: int = 2) -> None:
     """
     Main recording loop.
@@ -202,8 +673,26 @@ def main(interval_seconds: int = 2) -> None:
     Args:
         interval_seconds: Seconds between captures (default: 2)
     """
-    # Setup structured logging
-    logger = setup_logger("recording", log_level="INFO", console_output=False)
+    # Setup structured logging; a mistyped level must not crash-loop the service
+    requested_level = os.environ.get("PLAYBACK_LOG_LEVEL", "INFO")
+    log_level = requested_level.strip().upper()
+    if log_level not in LOG_LEVEL_NAMES:
+        log_level = "INFO"
+
+    logger = setup_logger(
+        "recording",
+        log_level=log_level,
+        console_output=False,
+        use_queue=True,
+    )
+
+    if log_level != requested_level.strip().upper():
+        log_warning(
+            logger,
+            "Unknown PLAYBACK_LOG_LEVEL - using INFO",
+            requested_level=requested_level,
+            valid_levels=list(LOG_LEVEL_NAMES),
+        )
 
     log_info(logger, "Recording service starting", interval_seconds=interval_seconds)
 
@@ -245,112 +734,133 @@ Service exiting now.
         exclusion_mode=config.exclusion_mode,
     )
 
+    # Encode and write frames off the capture loop when Pillow is available
+    frames = start_encoder(logger) if PIL_AVAILABLE else None
+
     timeline_was_open = False
     last_config_check = time.time()
     start_time = time.time()
     total_captures = 0
     last_metrics_log = 0
+    next_tick = time.monotonic()
 
-    while True:
-        now = datetime.now()
-        cycle_start = time.time()
-
-        # Reload config every 30 seconds
-        if time.time() - last_config_check > 30:
-            config = load_config_with_defaults()
-            last_config_check = time.time()
-            log_debug(logger, "Configuration reloaded")
-
-        # Check if timeline viewer is open
-        timeline_open = is_timeline_viewer_open()
-
-        # Log timeline viewer state changes
-        if timeline_open and not timeline_was_open:
-            log_info(logger, "Timeline viewer opened - pausing recording")
-            timeline_was_open = True
-        elif not timeline_open and timeline_was_open:
-            log_info(logger, "Timeline viewer closed - resuming recording")
-            timeline_was_open = False
-
-        # Skip capture if timeline viewer is open
-        if timeline_open:
-            log_debug(logger, "Skipping capture - timeline viewer open")
-            time.sleep(interval_seconds)
-            continue
-
-        # Check if screen is unavailable (screensaver, locked, off)
-        screen_unavailable = is_screen_unavailable()
-
-        if screen_unavailable:
-            log_debug(logger, "Skipping capture - screen unavailable")
-            time.sleep(interval_seconds)
-            continue
-
-        # Get frontmost app bundle ID
-        app_id = get_frontmost_app_bundle_id()
-
-        # Check if app is excluded
-        if config.is_app_excluded(app_id):
-            if config.exclusion_mode == "skip":
-                log_debug(
-                    logger, "Skipping capture - app excluded", app_id=app_id or "unknown"
-                )
-                time.sleep(interval_seconds)
-                continue
-            # If exclusion_mode is "invisible", still capture
-            # (future: implement blurring/redaction)
-
-        # Prepare capture directory
-        day_dir = ensure_chunk_dir(now)
-
-        # Generate chunk name with timestamp and app ID
-        chunk_name = generate_chunk_name(now, app_id)
-        chunk_path = day_dir / chunk_name
+    # launchd stops the service with SIGTERM; exit through the finally below
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
-        try:
-            capture_screen(chunk_path, logger)
-            total_captures += 1
+    try:
+        while True:
+            now = datetime.now()
+
+            # Reload config every 30 seconds
+            if time.time() - last_config_check > 30:
+                config = load_config_with_defaults()
+                last_config_check = time.time()
+                log_debug(logger, "Configuration reloaded")
+
+            # Check if timeline viewer is open
+            timeline_open = is_timeline_viewer_open()
+
+            # Log timeline viewer state changes
+            if timeline_open and not timeline_was_open:
+                log_info(logger, "Timeline viewer opened - pausing recording")
+                timeline_was_open = True
+            elif not timeline_open and timeline_was_open:
+                log_info(logger, "Timeline viewer closed - resuming recording")
+                timeline_was_open = False
+
+            # Skip capture if timeline viewer is open
+            if timeline_open:
+                log_debug(logger, "Skipping capture - timeline viewer open")
+                next_tick = wait_for_next_tick(next_tick, interval_seconds, logger)
+                continue
 
-            file_size_kb = chunk_path.stat().st_size / 1024
+            # Check if screen is unavailable (screensaver, locked, off)
+            screen_unavailable = is_screen_unavailable()
 
-            log_info(
-                logger,
-                "Screenshot captured",
-                path=str(chunk_path),
-                size_kb=round(file_size_kb, 1),
-                app_id=app_id or "unknown",
-            )
+            if screen_unavailable:
+                log_debug(logger, "Skipping capture - screen unavailable")
+                next_tick = wait_for_next_tick(next_tick, interval_seconds, logger)
+                continue
 
-        except subprocess.CalledProcessError as e:
-            log_error_with_context(
-                logger,
-                "Screenshot capture failed",
-                exception=e,
-                path=str(chunk_path),
-                return_code=e.returncode,
-            )
+            # Get frontmost app bundle ID
+            app_id = get_frontmost_app_bundle_id()
+
+            # Check if app is excluded
+            if config.is_app_excluded(app_id):
+                if config.exclusion_mode == "skip":
+                    log_debug(
+                        logger, "Skipping capture - app excluded", app_id=app_id or "unknown"
+                    )
+                    next_tick = wait_for_next_tick(next_tick, interval_seconds, logger)
+                    continue
+                # If exclusion_mode is "invisible", still capture
+                # (future: implement blurring/redaction)
+
+            # Prepare capture directory
+            day_dir = ensure_chunk_dir(now)
+
+            # Generate chunk name with timestamp and app ID
+            chunk_name = generate_chunk_name(now, app_id)
+            chunk_path = day_dir / chunk_name
+
+            try:
+                raw = grab_raw(logger) if frames is not None else None
+
+                if raw is not None:
+                    # Hand off to encoder workers; blocks when the queue is full
+                    frames.put((raw, chunk_path, app_id), block=True)
+                    total_captures += 1
+                else:
+                    capture_screen(chunk_path, logger)
+                    total_captures += 1
+
+                    file_size_kb = chunk_path.stat().st_size / 1024
+
+                    log_info(
+                        logger,
+                        "Screenshot captured",
+                        path=str(chunk_path),
+                        size_kb=round(file_size_kb, 1),
+                        app_id=app_id or "unknown",
+                    )
+
+            except subprocess.CalledProcessError as e:
+                reset_chunk_dir_cache()
+                log_error_with_context(
+                    logger,
+                    "Screenshot capture failed",
+                    exception=e,
+                    path=str(chunk_path),
+                    return_code=e.returncode,
+                )
 
-        except Exception as e:
-            log_error_with_context(
-                logger,
-                "Unexpected error during capture",
-                exception=e,
-                path=str(chunk_path),
-            )
+            except Exception as e:
+                reset_chunk_dir_cache()
+                log_error_with_context(
+                    logger,
+                    "Unexpected error during capture",
+                    exception=e,
+                    path=str(chunk_path),
+                )
 
-        # Log resource metrics every 100 captures (~200 seconds at 2s interval)
-        if PSUTIL_AVAILABLE and total_captures > 0 and total_captures % 100 == 0:
-            if time.time() - last_metrics_log > 30:  # At most once per 30 seconds
-                metrics = collect_metrics(start_time, total_captures)
-                if metrics:
-                    log_resource_metrics(logger, **metrics)
-                    last_metrics_log = time.time()
-
-        # Sleep for remainder of interval
-        elapsed = time.time() - cycle_start
-        sleep_time = max(0, interval_seconds - elapsed)
-        if sleep_time > 0:
-            time.sleep(sleep_time)
+            # Log resource metrics every 100 captures (~200 seconds at 2s interval)
+            if PSUTIL_AVAILABLE and total_captures > 0 and total_captures % 100 == 0:
+                if time.time() - last_metrics_log > 30:  # At most once per 30 seconds
+                    metrics = collect_metrics(start_time, total_captures)
+                    if metrics:
+                        log_resource_metrics(logger, **metrics)
+                        last_metrics_log = time.time()
+
+            # Sleep until the next capture slot
+            next_tick = wait_for_next_tick(next_tick, interval_seconds, logger)
+
+    finally:
+        if frames is not None:
+            # Write frames still waiting in the encoder before exiting; a
+            # repeated SIGTERM must not interrupt the drain
+            signal.signal(signal.SIGTERM, signal.SIG_IGN)
+            frames.close()
+        log_info(logger, "Recording service stopped", captures_total=total_captures)
 
 
 if __name__ == "__main__":